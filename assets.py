@@ -0,0 +1,179 @@
+"""
+Image asset loading for the roulette game.
+Paths are resolved relative to the application directory. Images are decoded on
+a worker thread and downscaled to the size they are actually displayed at, so
+GPU memory and decode time follow the screen rather than the source file.
+Downscaled variants are cached in memory and on disk.
+
+Downscaling needs Pillow; without it images are still decoded off the main
+thread through Kivy's Loader, at full resolution.
+"""
+
+import hashlib
+import os
+import queue
+import threading
+
+from kivy.clock import Clock
+
+try:
+    from PIL import Image as PILImage
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+TEXTURE_DIR = os.path.join('roulette_game', 'assets', 'textures')
+DEFAULT_VARIANT_CACHE_DIR = os.environ.get('ROULETTE_TEXTURE_CACHE', os.path.join(APP_DIR, 'cache', 'textures'))
+
+# Variant sizes are rounded up to this many pixels so small layout changes reuse a variant
+VARIANT_STEP = 128
+
+
+def resolve_asset(path):
+    """Absolute path of an asset given relative to the app directory, or None if missing"""
+    full_path = path if os.path.isabs(path) else os.path.join(APP_DIR, path)
+    return full_path if os.path.exists(full_path) else None
+
+
+def variant_size(source_size, target_size, step=VARIANT_STEP):
+    """Target size rounded up to the step, never larger than the source"""
+    return tuple(min(src, max(step, -(-int(target) // step) * step))
+                 for src, target in zip(source_size, target_size))
+
+
+class TextureLoader:
+    """Loads textures off the main thread at the size they are displayed
+
+    request() calls on_ready(texture) on the main thread once the variant for
+    the given widget size is available (immediately if it is already cached).
+    """
+
+    def __init__(self, cache_dir=DEFAULT_VARIANT_CACHE_DIR, step=VARIANT_STEP):
+        self.cache_dir = cache_dir
+        self.step = step
+        self.textures = {}  # (path, width bucket, height bucket) -> Texture
+        self._waiting = {}  # Same keys -> callbacks for variants still loading
+        self._missing = set()
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def _bucket(self, target_size):
+        return tuple(max(self.step, -(-int(v) // self.step) * self.step) for v in target_size)
+
+    def request(self, path, target_size, on_ready):
+        full_path = resolve_asset(path)
+        if full_path is None:
+            if path not in self._missing:
+                self._missing.add(path)
+                print(f"✗ Texture file not found: {path} - falling back to solid color")
+            return
+
+        key = (full_path,) + self._bucket(target_size)
+        texture = self.textures.get(key)
+        if texture is not None:
+            on_ready(texture)
+            return
+        if key in self._waiting:
+            self._waiting[key].append(on_ready)
+            return
+        self._waiting[key] = [on_ready]
+
+        if not PIL_AVAILABLE:
+            self._load_full_resolution(key)
+            return
+        self._queue.put(key)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._decode_loop, name='texture-loader', daemon=True)
+            self._thread.start()
+
+    def release(self):
+        """Forget every loaded texture (memory pressure), returns how many were dropped
+
+        Textures still shown by a widget stay alive until it lets go of them; a later
+        request() loads the variant again, from the variant cache when it was saved.
+        """
+        count = len(self.textures)
+        self.textures.clear()
+        return count
+
+    def cache_path(self, full_path, size):
+        """Variant file name from the source path, size, modification time and variant size"""
+        st = os.stat(full_path)
+        key = hashlib.sha256(f"{full_path}:{st.st_size}:{st.st_mtime_ns}:{size[0]}x{size[1]}".encode('utf-8')).hexdigest()
+        name, ext = os.path.splitext(os.path.basename(full_path))
+        return os.path.join(self.cache_dir, f"{name}-{size[0]}x{size[1]}-{key[:16]}{ext.lower()}")
+
+    def _decode(self, key):
+        """Decode (and downscale) one variant to raw RGBA pixels - runs on the worker thread"""
+        full_path, width, height = key
+        with PILImage.open(full_path) as source:
+            size = variant_size(source.size, (width, height), self.step)
+            variant_file = self.cache_path(full_path, size)
+            if os.path.exists(variant_file):
+                with PILImage.open(variant_file) as cached:
+                    image = cached.convert('RGBA')
+            else:
+                image = source.convert('RGBA')
+                if image.size != size:
+                    image = image.resize(size, PILImage.LANCZOS)
+                    self._save_variant(image, variant_file)
+        return image.size, source.size, image.tobytes()
+
+    def _save_variant(self, image, variant_file):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_file = variant_file + '.tmp'
+            if variant_file.endswith(('.jpg', '.jpeg')):
+                image.convert('RGB').save(tmp_file, 'JPEG', quality=90)
+            else:
+                image.save(tmp_file, 'PNG')
+            os.replace(tmp_file, variant_file)
+        except OSError as e:
+            print(f"✗ Could not cache texture variant {variant_file}: {e}")
+
+    def _decode_loop(self):
+        while True:
+            key = self._queue.get()
+            try:
+                result = self._decode(key)
+            except Exception as e:
+                print(f"✗ Failed to load texture {key[0]}: {e}")
+                result = None
+            # Textures must be created on the main (GL) thread
+            Clock.schedule_once(lambda dt, k=key, r=result: self._finish(k, r), 0)
+
+    def _finish(self, key, result):
+        callbacks = self._waiting.pop(key, [])
+        if result is None:
+            return
+        from kivy.graphics.texture import Texture
+        size, source_size, pixels = result
+        texture = Texture.create(size=size, colorfmt='rgba')
+        texture.blit_buffer(pixels, colorfmt='rgba', bufferfmt='ubyte')
+        texture.flip_vertical()  # PIL rows run top to bottom, GL textures bottom to top
+        self.textures[key] = texture
+        print(f"✓ Loaded texture {os.path.basename(key[0])} at {size[0]}x{size[1]} (source {source_size[0]}x{source_size[1]})")
+        for on_ready in callbacks:
+            on_ready(texture)
+
+    def _load_full_resolution(self, key):
+        """Fallback without Pillow: Kivy's Loader decodes on its own threads"""
+        from kivy.loader import Loader
+        proxy = Loader.image(key[0])
+
+        def on_load(instance):
+            texture = instance.image.texture
+            self.textures[key] = texture
+            print(f"✓ Loaded texture {os.path.basename(key[0])} at full resolution {texture.size}")
+            for on_ready in self._waiting.pop(key, []):
+                on_ready(texture)
+
+        def on_error(instance, error=None):
+            self._waiting.pop(key, None)
+            print(f"✗ Failed to load texture {key[0]}: {error}")
+
+        if proxy.loaded:
+            on_load(proxy)
+        else:
+            proxy.bind(on_load=on_load, on_error=on_error)
@@ -0,0 +1,368 @@
+"""
+Audio loading and playback for the roulette game.
+Sounds are loaded off the startup path (background thread, or one per frame on
+Android) and callers get placeholder handles straight away. Playing a handle
+before its sound is ready either skips or queues the playback. Short effects
+that can be triggered rapidly play through a VoicePool of preloaded players.
+
+Compressed clips are decoded once to WAV (raw PCM) in a cache directory so later
+launches skip the MP3 decode, and loaded players stay resident under a memory
+budget - the least recently played ones are unloaded and reloaded on demand.
+"""
+
+import hashlib
+import os
+import queue
+import shutil
+import subprocess
+import threading
+
+from kivy.clock import Clock
+from kivy.core.audio import SoundLoader
+
+try:
+    from kivy.utils import platform
+except ImportError:
+    platform = 'unknown'
+
+# 'thread' (decode on a worker thread), 'deferred' (one load per frame) or 'sync'
+DEFAULT_LOADING_MODE = os.environ.get('ROULETTE_AUDIO_LOADING',
+                                      'deferred' if platform == 'android' else 'thread')
+
+DEFAULT_PCM_CACHE_DIR = os.path.join('sounds', 'cache', 'pcm')
+# Memory allowed for loaded (decoded) sounds before the least recently played are unloaded
+DEFAULT_MEMORY_BUDGET = int(float(os.environ.get('ROULETTE_AUDIO_BUDGET_MB', '16')) * 1024 * 1024)
+
+# Decoded size estimate for players whose source is still compressed (44.1 kHz, 16-bit stereo)
+PCM_BYTES_PER_SECOND = 44100 * 2 * 2
+
+
+class PCMCache:
+    """Decodes compressed clips once to 16-bit WAV files in a cache directory
+
+    Decoding uses the ffmpeg command line tool when it is installed; without a
+    decoder (e.g. on Android) the original file is used unchanged.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_PCM_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.ffmpeg = shutil.which('ffmpeg')
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    def cache_path(self, path):
+        """Cache file name from the source path, size and modification time"""
+        st = os.stat(path)
+        key = hashlib.sha256(f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}".encode('utf-8')).hexdigest()
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, f"{name}-{key[:16]}.wav")
+
+    def resolve(self, path):
+        """Path to load: the decoded WAV when available, otherwise the original"""
+        if path.lower().endswith('.wav') or not os.path.exists(path):
+            return path
+        with self._lock:  # Voices of the same clip share one decode
+            resolved = self._resolved.get(path)
+            if resolved is None:
+                resolved = self._decode(path)
+                self._resolved[path] = resolved
+            return resolved
+
+    def _decode(self, path):
+        target = self.cache_path(path)
+        if os.path.exists(target):
+            return target
+        if not self.ffmpeg:
+            return path
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_target = target + '.tmp.wav'
+        try:
+            subprocess.run([self.ffmpeg, '-v', 'error', '-y', '-i', path,
+                            '-acodec', 'pcm_s16le', '-ar', '44100', tmp_target],
+                           check=True, stdin=subprocess.DEVNULL, timeout=60)
+            os.replace(tmp_target, target)
+            print(f"✓ Decoded {path} to PCM cache")
+            return target
+        except Exception as e:
+            print(f"✗ Could not decode {path} to PCM: {e}")
+            if os.path.exists(tmp_target):
+                os.remove(tmp_target)
+            return path
+
+
+class SoundHandle:
+    """Placeholder for a sound that may still be loading"""
+
+    def __init__(self, path, queue_play=False, bank=None):
+        self.path = path
+        self.queue_play = queue_play  # Play once loaded if play() was called too early
+        self.bank = bank
+        self.sound = None
+        self.ready = False
+        self.failed = False
+        self.evicted = False  # Unloaded to stay under the memory budget
+        self.queued = False  # Waiting in the bank's load queue
+        self.pending_play = False
+        self.size_bytes = 0
+        self.last_used = 0
+
+    def __bool__(self):
+        # Behaves like the old "sound or None" attributes once loading has failed
+        return not self.failed
+
+    def _loaded(self, sound):
+        """Called on the main thread when loading has finished"""
+        self.sound = sound
+        self.ready = True
+        self.evicted = False
+        self.queued = False
+        self.failed = sound is None
+        if self.pending_play and sound is not None:
+            sound.play()
+        self.pending_play = False
+
+    def play(self):
+        if self.bank is not None:
+            self.bank.touch(self)
+        if self.sound is not None:
+            self.sound.play()
+        elif self.evicted:
+            # Unloaded under memory pressure - reload and play as soon as it is back
+            self.pending_play = True
+            self.bank.reload(self)
+        elif not self.ready and self.queue_play:
+            self.pending_play = True
+
+    def stop(self):
+        self.pending_play = False
+        if self.sound is not None:
+            self.sound.stop()
+
+    @property
+    def playing(self):
+        return self.sound is not None and self.sound.state == 'play'
+
+    @property
+    def length(self):
+        return self.sound.length if self.sound is not None else 0
+
+
+class SoundBank:
+    """Queue of sounds to load without blocking the first frame"""
+
+    def __init__(self, mode=DEFAULT_LOADING_MODE, loader=SoundLoader.load, pcm_cache=None,
+                 memory_budget=DEFAULT_MEMORY_BUDGET):
+        self.mode = mode
+        self.loader = loader
+        self.pcm_cache = pcm_cache
+        self.memory_budget = memory_budget
+        self.resident_bytes = 0
+        self.handles = {}
+        self._queue = queue.Queue()  # (handle, on_ready) still to load
+        self._thread = None
+        # Deferred mode loads one sound per frame - a trigger fires once per frame however often it is called
+        self._deferred_trigger = Clock.create_trigger(self._load_next_deferred, 0)
+        self._use_counter = 0
+        self.started = False
+
+    def request(self, path, queue_play=False, on_ready=None, voice=0):
+        """Get a handle for path, loading it in the background if not already known
+
+        Each distinct voice number gets its own player object for the same file.
+        """
+        key = (path, voice)
+        handle = self.handles.get(key)
+        if handle is None:
+            handle = SoundHandle(path, queue_play, bank=self)
+            self.handles[key] = handle
+            self._enqueue(handle, on_ready)
+            if self.started:
+                self._process_queue()
+        return handle
+
+    def start(self):
+        """Begin loading everything requested so far (later requests load as they come)"""
+        self.started = True
+        self._process_queue()
+
+    def _enqueue(self, handle, on_ready):
+        handle.queued = True
+        self._queue.put((handle, on_ready))
+
+    def _process_queue(self):
+        if self.mode == 'sync':
+            while not self._queue.empty():
+                self._load_one(*self._queue.get_nowait())
+        elif self.mode == 'deferred':
+            self._deferred_trigger()
+        elif self._thread is None:
+            # One loader for the bank's lifetime - it waits on the queue for later requests
+            self._thread = threading.Thread(target=self._load_loop, name='sound-loader', daemon=True)
+            self._thread.start()
+
+    @property
+    def all_ready(self):
+        return all(handle.ready for handle in self.handles.values())
+
+    def touch(self, handle):
+        """Mark a handle as just used (for least-recently-played unloading)"""
+        self._use_counter += 1
+        handle.last_used = self._use_counter
+
+    def reload(self, handle):
+        """Queue an evicted handle for loading again"""
+        if handle.evicted and not handle.queued:
+            self._enqueue(handle, None)
+            self._process_queue()
+
+    def _load_sound(self, path):
+        """Load through the PCM cache (runs on the loader thread in 'thread' mode)"""
+        try:
+            if self.pcm_cache is not None:
+                path = self.pcm_cache.resolve(path)
+            return self.loader(path)
+        except Exception as e:
+            print(f"✗ Failed to load sound {path}: {e}")
+            return None
+
+    def _finish(self, handle, on_ready, sound):
+        handle._loaded(sound)
+        if sound is not None:
+            handle.size_bytes = int((sound.length or 0) * PCM_BYTES_PER_SECOND)
+            self.resident_bytes += handle.size_bytes
+            self.touch(handle)
+            self._enforce_budget(keep=handle)
+        if on_ready is not None:
+            on_ready(handle)
+
+    def _enforce_budget(self, keep=None):
+        """Unload least recently played sounds until the resident total fits the budget"""
+        if self.resident_bytes <= self.memory_budget:
+            return
+        loaded = sorted((h for h in self.handles.values() if h.sound is not None and h is not keep),
+                        key=lambda h: h.last_used)
+        for handle in loaded:
+            if self.resident_bytes <= self.memory_budget:
+                break
+            if handle.playing:
+                continue
+            self._unload(handle)
+
+    def unload_idle(self):
+        """Unload every sound that is not playing (memory pressure), returns the bytes freed
+
+        The handles reload on their next play(), like ones evicted by the budget.
+        """
+        freed = self.resident_bytes
+        for handle in list(self.handles.values()):
+            if handle.sound is not None and not handle.playing:
+                self._unload(handle)
+        return freed - self.resident_bytes
+
+    def _unload(self, handle):
+        handle.sound.unload()
+        handle.sound = None
+        handle.ready = False
+        handle.evicted = True
+        self.resident_bytes -= handle.size_bytes
+
+    def _load_one(self, handle, on_ready):
+        self._finish(handle, on_ready, self._load_sound(handle.path))
+
+    def _load_next_deferred(self, dt):
+        """Load one sound this frame and schedule the next"""
+        try:
+            queued = self._queue.get_nowait()
+        except queue.Empty:
+            return
+        self._load_one(*queued)
+        if not self._queue.empty():
+            self._deferred_trigger()
+
+    def _load_loop(self):
+        while True:
+            handle, on_ready = self._queue.get()
+            sound = self._load_sound(handle.path)
+            # Hand the result back to the main thread
+            Clock.schedule_once(lambda dt, h=handle, cb=on_ready, s=sound: self._finish(h, cb, s), 0)
+
+
+class VoicePool:
+    """Several preloaded players for one effect so rapid triggers overlap instead of restarting
+
+    policy 'oldest' reuses an idle voice or steals the one started longest ago;
+    'round_robin' simply cycles through the voices. At most max_per_frame triggers
+    are honoured per frame - extra ones in the same frame would only add volume.
+    """
+
+    def __init__(self, handles, policy='oldest', max_per_frame=1):
+        self.voices = list(handles)
+        self.policy = policy
+        self.max_per_frame = max_per_frame
+        self._next = 0
+        self._started = [0] * len(self.voices)  # Trigger counter value when each voice last started
+        self._triggers = 0
+        self._frame = -1
+        self._frame_triggers = 0
+
+    def __bool__(self):
+        return any(self.voices)
+
+    def _pick_voice(self):
+        if self.policy == 'round_robin':
+            index = self._next
+            self._next = (index + 1) % len(self.voices)
+            return index
+        oldest = 0
+        for index, voice in enumerate(self.voices):
+            if voice.ready and not voice.playing:
+                return index
+            if self._started[index] < self._started[oldest]:
+                oldest = index
+        return oldest
+
+    def play(self):
+        frame = Clock.frames
+        if frame != self._frame:
+            self._frame = frame
+            self._frame_triggers = 0
+        if self._frame_triggers >= self.max_per_frame:
+            return
+        self._frame_triggers += 1
+
+        index = self._pick_voice()
+        voice = self.voices[index]
+        if voice.playing:
+            voice.stop()  # Steal it
+        self._triggers += 1
+        self._started[index] = self._triggers
+        voice.play()
+
+    def stop(self):
+        for voice in self.voices:
+            voice.stop()
+
+
+class SoundEffects:
+    """Named effects backed by voice pools, all loaded through one SoundBank"""
+
+    def __init__(self, bank):
+        self.bank = bank
+        self.pools = {}
+
+    def add(self, name, path, voices=4, policy='oldest', max_per_frame=1, on_ready=None):
+        """Register an effect with its own pool of preloaded voices"""
+        handles = [self.bank.request(path, on_ready=on_ready if i == 0 else None, voice=i)
+                   for i in range(voices)]
+        pool = VoicePool(handles, policy, max_per_frame)
+        self.pools[name] = pool
+        return pool
+
+    def play(self, name):
+        pool = self.pools.get(name)
+        if pool:
+            pool.play()
+
+    def stop_all(self):
+        for pool in self.pools.values():
+            pool.stop()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Offline sprite baking for the roulette game.
+
+Renders the chips, ball, pocket numbers, bet-amount digits and betting table
+labels with Pillow at every DPI bucket and packs each bucket into one Kivy
+.atlas file (JSON) plus its PNG page under roulette_game/assets/atlas.
+Kivy itself is not needed to bake; its Roboto font is used when it is installed
+so the sprites match the labels drawn at runtime.
+
+Usage:
+    python bake_atlas.py
+    python bake_atlas.py --buckets 1,2 --font /path/to/Roboto-Bold.ttf
+"""
+
+import importlib.util
+import json
+import os
+import sys
+
+from PIL import Image, ImageDraw, ImageFont
+
+import sprites
+from engine import TableState
+
+SUPERSAMPLE = 4  # Shapes are drawn this much larger and downsampled for anti-aliasing
+PADDING = 2
+MAX_ATLAS_SIZE = 4096
+
+FALLBACK_FONTS = [
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+    '/Library/Fonts/Arial Bold.ttf',
+    'C:\\Windows\\Fonts\\arialbd.ttf',
+]
+
+
+def find_font():
+    """Kivy's default bold font if Kivy is installed, otherwise a common system font"""
+    spec = importlib.util.find_spec('kivy')
+    candidates = []
+    if spec is not None and spec.origin:
+        candidates.append(os.path.join(os.path.dirname(spec.origin), 'data', 'fonts', 'Roboto-Bold.ttf'))
+    candidates.extend(FALLBACK_FONTS)
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_font(font_path, size):
+    if font_path:
+        return ImageFont.truetype(font_path, size)
+    return ImageFont.load_default(size)
+
+
+def rgba(color):
+    return tuple(int(round(c * 255)) for c in color)
+
+
+class Canvas:
+    """Supersampled RGBA layer with y-up coordinates centred on the sprite"""
+
+    def __init__(self, width, height, scale):
+        self.width, self.height = width, height
+        self.unit = scale * SUPERSAMPLE
+        self.image = Image.new('RGBA', (int(round(width * self.unit)), int(round(height * self.unit))), (0, 0, 0, 0))
+
+    def _box(self, x, y, w, h):
+        # (x, y) is the bottom-left corner relative to the sprite centre, as in Kivy
+        u = self.unit
+        left = (x + self.width / 2) * u
+        top = (self.height / 2 - y - h) * u
+        return [left, top, left + w * u, top + h * u]
+
+    def ellipse(self, x, y, w, h, color):
+        """Composite an ellipse 'over' what is already drawn (like a Kivy Ellipse with alpha)"""
+        layer = Image.new('RGBA', self.image.size, (0, 0, 0, 0))
+        ImageDraw.Draw(layer).ellipse(self._box(x, y, w, h), fill=rgba(color))
+        self.image = Image.alpha_composite(self.image, layer)
+
+    def pieslice(self, x, y, w, h, start, end, color):
+        layer = Image.new('RGBA', self.image.size, (0, 0, 0, 0))
+        ImageDraw.Draw(layer).pieslice(self._box(x, y, w, h), start, end, fill=rgba(color))
+        self.image = Image.alpha_composite(self.image, layer)
+
+    def text(self, text, font, color):
+        layer = Image.new('RGBA', self.image.size, (0, 0, 0, 0))
+        ImageDraw.Draw(layer).text((self.image.width / 2, self.image.height / 2), text,
+                                   font=font, fill=rgba(color), anchor='mm')
+        self.image = Image.alpha_composite(self.image, layer)
+
+    def result(self, scale):
+        size = (max(1, int(round(self.width * scale))), max(1, int(round(self.height * scale))))
+        return self.image.resize(size, Image.LANCZOS)
+
+
+def render_ball(scale):
+    """The layered ivory ball with its drop shadows, as RouletteWheel.draw() builds it"""
+    b = sprites.BALL_BASE_SIZE
+    box = b + 2 * sprites.BALL_SPRITE_MARGIN
+    c = Canvas(box, box, scale)
+    c.ellipse(-b / 2 + 5, -b / 2 - 3, b + 4, b + 4, (0, 0, 0, 0.25))
+    c.ellipse(-b / 2 + 4, -b / 2 - 2, b + 2, b + 2, (0, 0, 0, 0.35))
+    c.ellipse(-b / 2 + 3, -b / 2 - 1, b, b, (0, 0, 0, 0.5))
+    c.ellipse(-b / 2, -b / 2, b, b, (0.95, 0.92, 0.85, 1))
+    c.ellipse(-b / 2 + 0.5, -b / 2 + 0.5, b - 1, b - 1, (0.98, 0.96, 0.92, 1))
+    c.ellipse(-b / 3, -b / 4, b / 3, b / 3, (1.0, 1.0, 1.0, 0.8))
+    c.ellipse(-b / 4, -b / 6, b / 6, b / 6, (1.0, 1.0, 1.0, 0.9))
+    c.ellipse(-b / 4, b / 6, b / 4, b / 4, (0.8, 0.75, 0.7, 0.3))
+    return c.result(scale)
+
+
+def render_chip(value, scale, font_path):
+    """Casino chip in the get_chip_color colours with edge spots and its value"""
+    chip_color, text_color = TableState.CHIP_COLORS.get(value, TableState.DEFAULT_CHIP_COLOR)
+    spot_color = (0.8, 0.2, 0.2, 1) if chip_color[:3] == (1.0, 1.0, 1.0) else (1, 1, 1, 1)
+    d = sprites.CHIP_BASE_SIZE
+    c = Canvas(d, d, scale)
+    c.ellipse(-d / 2, -d / 2, d, d, (0, 0, 0, 0.4))  # Rim shadow
+    c.ellipse(-d / 2 + 1, -d / 2 + 1, d - 2, d - 2, chip_color)
+    for i in range(6):  # Edge spots
+        start = i * 60 - 10
+        c.pieslice(-d / 2 + 1, -d / 2 + 1, d - 2, d - 2, start, start + 20, spot_color)
+    c.ellipse(-d * 0.36, -d * 0.36, d * 0.72, d * 0.72, (0, 0, 0, 0.25))
+    c.ellipse(-d * 0.34, -d * 0.34, d * 0.68, d * 0.68, chip_color)
+    font_size = d * (0.36 if value < 100 else 0.3)
+    c.text(str(value), load_font(font_path, int(round(font_size * c.unit))), text_color)
+    return c.result(scale)
+
+
+def render_text(text, font_size, scale, font_path, color=(1, 1, 1, 1)):
+    """Text cropped to its ink plus one pixel, rendered directly at the target size"""
+    font = load_font(font_path, max(1, int(round(font_size * scale))))
+    left, top, right, bottom = font.getbbox(text)
+    image = Image.new('RGBA', (right - left + 2, bottom - top + 2), rgba(color[:3] + (0,)))
+    ImageDraw.Draw(image).text((1 - left, 1 - top), text, font=font, fill=rgba(color))
+    return image
+
+
+def render_sprites(scale, font_path):
+    """All sprites for one DPI bucket, by sprite name"""
+    images = {'ball': render_ball(scale)}
+    for value in TableState.CHIP_VALUES:
+        images[f'chip_{value}'] = render_chip(value, scale, font_path)
+    for number in range(37):
+        color = (1, 1, 1, 1) if number != 0 else (1, 1, 0.5, 1)
+        images[f'num_{number}'] = render_text(str(number), sprites.NUMBER_FONT_SIZE, scale, font_path, color)
+    for char in sprites.GLYPHS:
+        images[sprites.glyph_sprite(char)] = render_text(char, sprites.GLYPH_FONT_SIZE, scale, font_path)
+    for text, font_size in sprites.BETTING_LABELS:
+        images[sprites.label_sprite(text)] = render_text(text, font_size, scale, font_path)
+    for text in sprites.HIGHLIGHT_LABELS:
+        images[sprites.highlight_sprite(text)] = render_text(text, sprites.HIGHLIGHT_FONT_SIZE, scale, font_path)
+    return images
+
+
+def pack(images, padding=PADDING):
+    """Shelf-pack images into the smallest power-of-two square page
+
+    Returns the page and {name: (x, y, w, h)} with y measured from the bottom,
+    as Kivy's Atlas expects.
+    """
+    order = sorted(images, key=lambda name: (-images[name].height, name))
+    size = 64
+    while size <= MAX_ATLAS_SIZE:
+        placements = {}
+        x = y = shelf_height = 0
+        for name in order:
+            w, h = images[name].size
+            if x + w + padding > size:
+                x, y = 0, y + shelf_height
+                shelf_height = 0
+            if x + w + padding > size or y + h + padding > size:
+                break
+            placements[name] = (x + padding, y + padding)
+            x += w + padding
+            shelf_height = max(shelf_height, h + padding)
+        else:
+            page = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+            coords = {}
+            for name, (px, py) in placements.items():
+                image = images[name]
+                page.paste(image, (px, py))
+                coords[name] = [px, size - py - image.height, image.width, image.height]
+            return page, coords
+        size *= 2
+    raise ValueError(f"Sprites do not fit in a {MAX_ATLAS_SIZE}px atlas")
+
+
+def bake(buckets=sprites.DPI_BUCKETS, out_dir=None, font_path=None):
+    out_dir = out_dir or os.path.join(sprites.APP_DIR, sprites.ATLAS_DIR)
+    font_path = font_path or find_font()
+    if font_path is None:
+        print("✗ No TrueType font found - using Pillow's default font")
+    os.makedirs(out_dir, exist_ok=True)
+    for bucket in buckets:
+        page, coords = pack(render_sprites(bucket, font_path))
+        basename = sprites.atlas_basename(bucket)
+        page.save(os.path.join(out_dir, basename + '.png'), optimize=True)
+        with open(os.path.join(out_dir, basename + '.atlas'), 'w', encoding='utf-8') as f:
+            json.dump({basename + '.png': coords}, f, sort_keys=True)
+        print(f"✓ Baked {basename}: {len(coords)} sprites on a {page.width}x{page.height} page")
+
+
+def main(argv):
+    buckets = sprites.DPI_BUCKETS
+    font_path = None
+    if '--buckets' in argv:
+        buckets = [int(b) for b in argv[argv.index('--buckets') + 1].split(',')]
+    if '--font' in argv:
+        font_path = argv[argv.index('--font') + 1]
+    bake(buckets, font_path=font_path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Headless benchmarks for the roulette game.
+
+Times the wheel physics, RouletteWheel.update and draw() at several wheel
+sizes, process_payouts with a full bet book, update_previous_numbers_display
+and the betting table build. Kivy runs with its mock GL backend, so draw
+timings cover instruction generation only (nothing is rendered) and no display
+is needed.
+
+Results are written as JSON and compared with a stored baseline; the exit
+status is 1 when any median is slower than the baseline by more than the
+threshold (or the benchmark's own, wider one - see the @benchmark thresholds).
+Both sides are medians over runs of the whole suite in fresh processes:
+BASELINE_RUNS for a saved baseline, COMPARE_RUNS for a comparison (--runs N
+overrides either). Baselines are machine-specific - save one on the machine
+that runs the comparison.
+
+The canvas instructions of each draw() layer (felt, history, bumper, rim, hub,
+pockets, ball, dolly) in a spinning frame are also checked against
+LAYER_BUDGETS at every size; going over a budget fails the run too
+(--only budget runs just this check).
+
+Usage:
+    python benchmark.py
+    python benchmark.py --output results.json --threshold 0.25
+    python benchmark.py --only physics --runs 1
+    python benchmark.py --only draw --save-baseline
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+# Kivy redirects sys.stderr to its logger when console logging is off - report to the real one
+REPORT = sys.stderr
+
+# Headless Kivy: mock GL, no command line parsing, no console logging (set before Kivy is imported)
+os.environ.setdefault('KIVY_GL_BACKEND', 'mock')
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+os.environ.setdefault('ROULETTE_RNG_SEED', '1234')
+os.environ.setdefault('ROULETTE_QUALITY', 'ultra')  # Budgets and baselines are for the full look
+
+from engine import FIXED_DT, WheelPhysics
+from rng import RNGService
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+DEFAULT_THRESHOLD = 0.25  # Fail when a median is more than 25% slower than the baseline
+BASELINE_RUNS = 5  # Runs of the suite (separate processes) a saved baseline is the median of
+COMPARE_RUNS = 3  # Runs compared with the baseline - one run alone is at the mercy of a noisy moment
+
+# Wheel widget sizes: desktop window, phone, tablet (the wheel gets 60% of the window height)
+WHEEL_SIZES = [(450, 420), (1080, 1400), (1600, 1536)]
+
+# Most canvas instructions each layer of RouletteWheel.draw() may emit in a spinning frame
+# (background texture loaded) at any of WHEEL_SIZES. Raise a budget only deliberately.
+LAYER_BUDGETS = {
+    'felt': 12,
+    'history': 350,
+    'bumper': 115,
+    'rim': 130,
+    'hub': 105,
+    'pockets': 3000,
+    'ball': 20,
+    'dolly': 70,
+}
+
+BENCHMARKS = []  # (name, function returning a result dict, threshold or None for the default)
+
+
+def benchmark(name, threshold=None):
+    """Register a benchmark; threshold widens the regression limit for a noisy one"""
+    def register(function):
+        BENCHMARKS.append((name, function, threshold))
+        return function
+    return register
+
+
+def quiet():
+    """Swallow the game's status prints while it is being measured"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def measure(function, setup=None, repeat=30, warmup=3, number=1):
+    """Median and minimum time per call over `repeat` samples of `number` calls each
+
+    setup runs untimed before each sample. Cheap functions use a larger number so
+    timer resolution and scheduling noise do not dominate.
+    """
+    samples = []
+    for run in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        begin = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = (time.perf_counter() - begin) / number
+        if run >= warmup:
+            samples.append(elapsed)
+    return {
+        'median_ms': round(statistics.median(samples) * 1000, 4),
+        'min_ms': round(min(samples) * 1000, 4),
+        'runs': repeat,
+    }
+
+
+def keep_spinning(wheel):
+    """Start a new spin whenever the last one has finished, so the ball is always moving"""
+    if wheel.idle:
+        with quiet():
+            wheel.start_spin()
+            wheel.launch_ball()
+
+
+_game = None
+
+
+def game():
+    """One RouletteGame, fully built, shared by the Kivy benchmarks"""
+    global _game
+    if _game is None:
+        with quiet():
+            import main
+            _game = main.RouletteGame()
+            _game.ui_builder.finish()
+        _game.size = (WHEEL_SIZES[0][0], WHEEL_SIZES[0][1] / 0.6)
+    return _game
+
+
+@benchmark('physics_spin')
+def bench_physics():
+    """One complete seeded spin, launch to settle, in fixed steps (extracted engine, no Kivy)"""
+    steps = []
+
+    def run():
+        wheel = WheelPhysics(rng=RNGService(1234).stream('benchmark'), verbose=False)
+        wheel.start_spin()
+        wheel.launch_ball()
+        while not wheel.idle:
+            wheel.advance(FIXED_DT)
+        steps.append(wheel.tick)
+    result = measure(run, repeat=20)
+    result['steps'] = steps[-1]  # Same every run - the spin is seeded
+    return result
+
+
+@benchmark('wheel_update')
+def bench_wheel_update():
+    """RouletteWheel.update for one frame: physics plus redraw at the desktop size"""
+    wheel = game().wheel
+    wheel.size = WHEEL_SIZES[0]
+    with quiet():
+        return measure(lambda: wheel.update(1 / 60), setup=lambda: keep_spinning(wheel))
+
+
+def bench_draw(size):
+    from hud import count_canvas
+    wheel = game().wheel
+    wheel.size = size
+    keep_spinning(wheel)
+    with quiet():
+        wheel.advance(1.0)  # Ball well into its spin
+
+    def run():
+        wheel.canvas.clear()
+        wheel.draw()
+    result = measure(run)
+    result['instructions'], _ = count_canvas(wheel)
+    return result
+
+
+for _size in WHEEL_SIZES:
+    benchmark(f'wheel_draw_{_size[0]}x{_size[1]}')(lambda size=_size: bench_draw(size))
+
+
+# These three rebuild labels and history textures on every call, so collector and allocator
+# noise moves their medians by 40% or more between otherwise identical runs
+
+
+@benchmark('process_payouts_full_book', threshold=0.75)
+def bench_payouts():
+    """process_payouts with a bet on every bet type (the largest possible book)"""
+    g = game()
+    bet_ids = g.betting_grid.bet_ids
+    numbers = iter(range(10 ** 9))
+
+    def setup():
+        g.bets = {bet_id: 100 for bet_id in bet_ids}
+        g.total_bet = 100 * len(bet_ids)
+        g.balance = 10 ** 9
+        g.wheel.winning_number = next(numbers) % 37
+
+    with quiet():
+        result = measure(g.process_payouts, setup=setup, repeat=100)
+    result['bets'] = len(bet_ids)
+    return result
+
+
+@benchmark('previous_numbers_display', threshold=0.75)
+def bench_previous_numbers():
+    g = game()
+    return measure(g.wheel.update_previous_numbers_display, number=20)
+
+
+@benchmark('betting_table_build', threshold=0.75)
+def bench_betting_table():
+    """create_betting_table_in_container plus every staged step and the first full draw"""
+    from kivy.uix.boxlayout import BoxLayout
+    from staging import StagedBuilder
+    g = game()
+    width, height = g.width, g.height * 0.4
+    steps = []
+
+    def run():
+        g._shown_bets = {}
+        g.ui_builder = StagedBuilder(on_complete=g.on_ui_complete)
+        with quiet():
+            g.create_betting_table_in_container(BoxLayout())
+            g.ui_builder.finish()
+        g.betting_grid.size = (width, height * 0.92)  # Lays out and draws every cell
+        steps.append(max(seconds for _, seconds in g.ui_builder.timings))
+
+    result = measure(run, repeat=20)
+    result['max_step_ms'] = round(statistics.median(steps) * 1000, 4)
+    return result
+
+
+def check_layer_budgets():
+    """Instructions per draw() layer at every size, and the layers over LAYER_BUDGETS"""
+    from kivy.graphics.texture import Texture
+    wheel = game().wheel
+    keep_spinning(wheel)
+    with quiet():
+        wheel.advance(1.0)
+    saved_texture = wheel.background_texture
+    wheel.background_texture = Texture.create(size=(4, 4))  # As once the wood texture has loaded
+    counts, failures = {}, []
+    for width, height in WHEEL_SIZES:
+        wheel.size = (width, height)
+        wheel.canvas.clear()
+        wheel.draw()
+        size_counts = counts[f'{width}x{height}'] = wheel.layer_counts()
+        for layer, count in size_counts.items():
+            if count > LAYER_BUDGETS[layer]:
+                failures.append(f'{layer}@{width}x{height}')
+                print(f"✗ {layer} layer at {width}x{height}: {count} instructions, budget {LAYER_BUDGETS[layer]}",
+                      file=REPORT)
+    wheel.background_texture = saved_texture
+    if not failures:
+        print("✓ Every draw() layer is within its instruction budget", file=REPORT)
+    return {'counts': counts, 'budgets': LAYER_BUDGETS, 'over_budget': failures}
+
+
+def run_suite(only=None):
+    results = {}
+    for name, function, _ in BENCHMARKS:
+        if only and not any(part in name for part in only):
+            continue
+        results[name] = function()
+        print(f"  {name:<28}{results[name]['median_ms']:>10.3f} ms", file=REPORT)
+    return results
+
+
+def run_benchmarks(only=None, runs=1):
+    """Run the suite `runs` times, each in a fresh process; results keep the median of the runs
+
+    Separate processes because timings shift between processes (memory layout, hash
+    seeds) by more than between repeats in one, and a comparison run is a fresh process.
+    """
+    if runs == 1:
+        return run_suite(only)
+    import subprocess
+    import tempfile
+    samples = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for run in range(runs):
+            print(f" run {run + 1} of {runs}", file=REPORT)
+            path = os.path.join(tmp_dir, f'run-{run}.json')
+            command = [sys.executable, os.path.abspath(__file__), '--suite-only', '--output', path]
+            if only:
+                command += ['--only', ','.join(only)]
+            subprocess.run(command, check=True)
+            with open(path, encoding='utf-8') as f:
+                for name, result in json.load(f).items():
+                    samples.setdefault(name, []).append(result)
+    results = {}
+    for name, runs_of_name in samples.items():
+        result = dict(runs_of_name[0])
+        for key in result:
+            if key.endswith('_ms'):
+                values = [run_result[key] for run_result in runs_of_name]
+                result[key] = min(values) if key == 'min_ms' else round(statistics.median(values), 4)
+        result['run_medians_ms'] = [run_result['median_ms'] for run_result in runs_of_name]
+        results[name] = result
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Annotate results with their change from the baseline, returns the names that regressed"""
+    thresholds = {name: own for name, _, own in BENCHMARKS if own is not None}
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base or not base['median_ms']:
+            continue
+        change = result['median_ms'] / base['median_ms'] - 1
+        limit = max(threshold, thresholds.get(name, threshold))
+        result['baseline_ms'] = base['median_ms']
+        result['change'] = round(change, 3)
+        result['threshold'] = limit
+        if change > limit:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv):
+    threshold = DEFAULT_THRESHOLD
+    output = None
+    baseline_file = BASELINE_FILE
+    only = None
+    runs = BASELINE_RUNS if '--save-baseline' in argv else COMPARE_RUNS
+    if '--runs' in argv:
+        runs = int(argv[argv.index('--runs') + 1])
+    if '--threshold' in argv:
+        threshold = float(argv[argv.index('--threshold') + 1])
+    if '--output' in argv:
+        output = argv[argv.index('--output') + 1]
+    if '--baseline' in argv:
+        baseline_file = argv[argv.index('--baseline') + 1]
+    if '--only' in argv:
+        only = argv[argv.index('--only') + 1].split(',')
+
+    if '--suite-only' in argv:  # One run for run_benchmarks(), results only
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(run_suite(only), f)
+        return 0
+
+    print("Benchmarks (median):", file=REPORT)
+    results = run_benchmarks(only, runs)
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'runs': runs,
+        'results': results,
+    }
+
+    if '--save-baseline' in argv:
+        saved = dict(report, results=dict(results))
+        if only and os.path.exists(baseline_file):
+            with open(baseline_file, encoding='utf-8') as f:
+                saved['results'] = dict(json.load(f).get('results', {}), **results)  # Keep the others
+        with open(baseline_file, 'w', encoding='utf-8') as f:
+            json.dump(saved, f, indent=2, sort_keys=True)
+        print(f"✓ Saved baseline to {baseline_file}", file=REPORT)
+        regressions = []
+    elif os.path.exists(baseline_file):
+        with open(baseline_file, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), threshold)
+        for name in regressions:
+            result = results[name]
+            print(f"✗ {name}: {result['median_ms']:.3f} ms vs baseline {result['baseline_ms']:.3f} ms "
+                  f"({result['change']:+.0%}, limit {result['threshold']:+.0%})", file=REPORT)
+        if not regressions:
+            print(f"✓ No regressions beyond {threshold:.0%} (wider for noisy benchmarks) of {baseline_file}",
+                  file=REPORT)
+    else:
+        print(f"✗ No baseline at {baseline_file} - run with --save-baseline", file=REPORT)
+        regressions = []
+    report['regressions'] = regressions
+    if not only or 'budget' in only:
+        report['layer_budgets'] = check_layer_budgets()
+        regressions = regressions + report['layer_budgets']['over_budget']
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,487 @@
+"""
+Custom-drawn betting table for the roulette game.
+The whole table (chip selector, numbers, outside bets and controls) is one
+widget: cell backgrounds are a single Mesh coloured through a small palette
+texture, and labels are Meshes built from the pre-baked sprite atlas. The cell
+layout is computed once per widget size, and touches are hit-tested against a
+precomputed bucket index of the cell rectangles.
+"""
+
+from kivy.clock import Clock
+from kivy.uix.widget import Widget
+from kivy.graphics import Color, Mesh, Rectangle, InstructionGroup
+from kivy.graphics.texture import Texture
+
+import sprites
+from engine import TableState, RED_NUMBERS
+from text_cache import TEXT_CACHE
+
+# Kivy's default button image is ~35% grey and Buttons multiplied their background_color by it
+BUTTON_SHADE = 0.345
+
+RED = (0.85, 0.15, 0.15, 1)
+BLACK = (0.15, 0.15, 0.15, 1)
+CHIP_SELECTED = (0.85, 0.75, 0.3, 1.0)  # Gold
+HIGHLIGHT = (1.0, 0.9, 0.2, 1)  # Bright gold for the winning number
+CHIP_IDLE = (0.5, 0.5, 0.5, 1.0)  # Gray
+LIGHT_TEXT = (1, 1, 1, 1)
+DARK_TEXT = (0, 0, 0, 1)
+
+# Same European layout as the physical table: 3 rows x 12 columns
+NUMBER_ROWS = [
+    [3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36],
+    [2, 5, 8, 11, 14, 17, 20, 23, 26, 29, 32, 35],
+    [1, 4, 7, 10, 13, 16, 19, 22, 25, 28, 31, 34],
+]
+
+# Outside bets: (bet id, label, font size, background color)
+DOZEN_CELLS = [
+    ('dozen1', '1st 12', 17, (0.2, 0.6, 0.8, 1)),  # Blue
+    ('dozen2', '2nd 12', 17, (0.2, 0.7, 0.3, 1)),  # Green
+    ('dozen3', '3rd 12', 17, (0.6, 0.4, 0.8, 1)),  # Purple
+]
+EVEN_MONEY_CELLS = [
+    ('low', '1 to 18', 16, (0.2, 0.4, 0.8, 1)),  # Blue
+    ('even', 'EVEN', 16, (0.3, 0.3, 0.3, 1)),
+    ('red', 'RED', 16, (0.8, 0.1, 0.1, 1)),
+    ('black', 'BLACK', 16, (0.1, 0.1, 0.1, 1)),
+    ('odd', 'ODD', 16, (0.3, 0.3, 0.3, 1)),
+    ('high', '19 to 36', 16, (0.8, 0.4, 0.2, 1)),  # Orange/Red
+]
+CONTROL_CELLS = [
+    ('clear', 'CLEAR BETS', 16, (0.6, 0.2, 0.2, 1)),
+    ('rebet', 'REBET', 16, (0.4, 0.4, 0.8, 1)),
+    ('double', '2X', 16, (0.2, 0.7, 0.7, 1)),  # Teal/Cyan
+    ('spin', 'SPIN', 18, (0.2, 0.6, 0.2, 1)),
+]
+
+INDEX_BUCKETS = 16  # Hit-test index resolution per axis
+
+
+def shade(color):
+    """Background colour as a default-image Button with this background_color showed it"""
+    return tuple(c * BUTTON_SHADE for c in color[:3]) + (color[3],)
+
+
+def box_split(start, length, hints, spacing, padding=(0, 0)):
+    """Positions and sizes of children along one axis, the way BoxLayout distributes them"""
+    available = length - padding[0] - padding[1] - spacing * (len(hints) - 1)
+    total = float(sum(hints))
+    result = []
+    pos = start + padding[0]
+    for hint in hints:
+        size = available * hint / total
+        result.append((pos, size))
+        pos += size + spacing
+    return result
+
+
+class Cell:
+    """One drawn table cell"""
+
+    __slots__ = ('cell_id', 'text', 'font_size', 'shade', 'background', 'base_background', 'text_color',
+                 'highlighted', 'amount', 'action', 'rect')
+
+    def __init__(self, cell_id, text, font_size, background, action=None, shade=True):
+        self.cell_id = cell_id
+        self.text = text
+        self.font_size = font_size
+        self.shade = shade  # Tinted like a default-image Button rather than a flat colour
+        self.background = None
+        self.set_background(background)
+        self.base_background = self.background  # Restored when a highlight is cleared
+        self.text_color = LIGHT_TEXT
+        self.highlighted = False
+        self.amount = 0
+        self.action = action
+        self.rect = (0, 0, 0, 0)
+
+    def set_background(self, color):
+        """Set the background from a Button-style background_color; True if it changed"""
+        if color is not None and self.shade:
+            color = shade(color)
+        changed = color != self.background
+        self.background = color
+        return changed
+
+
+class BettingGrid(Widget):
+    """The chip row, betting table and control row drawn as one widget
+
+    actions maps 'bet' to a callable taking a bet id, 'chip' to one taking a chip
+    value, and 'clear'/'rebet'/'double'/'spin' to callables without arguments.
+
+    With build=False the grid starts empty and ignores touches; the caller adds
+    each of SECTIONS with build_section() (e.g. one per frame) and then sets
+    input_enabled.
+    """
+
+    SECTIONS = ('chips', 'zero', 'numbers_top', 'numbers_middle', 'numbers_bottom',
+                'dozens', 'even_money', 'controls')
+
+    def __init__(self, actions, sprite_sheet=None, font_scale=1.0, build=True, **kwargs):
+        super().__init__(**kwargs)
+        self.sprites = sprite_sheet
+        self.font_scale = font_scale
+        self.actions = actions
+        self.cells = {}
+        self.input_enabled = build
+        self.bet_ids = (['zero'] + [f'number_{n}' for n in range(1, 37)] +
+                        [cell[0] for cell in DOZEN_CELLS + EVEN_MONEY_CELLS])
+        self._index = {}
+        self._bucket_size = (1.0, 1.0)
+        self._layout_size = None
+        self._rects = {}
+        self._text_cache = {}  # cell id -> {(texture id, text colour): (texture, vertices)}
+        self._text_meshes = {}
+        self._dirty_text = set()
+        self._pressed = None
+
+        # Highlight colours are in the palette from the start so highlighting never rebuilds it
+        self._palette = [shade(HIGHLIGHT), CHIP_SELECTED]
+        self._palette_texture = None
+        self._background_vertices = []
+        self._background_offsets = {}  # cell id -> index of its first vertex value
+        self._dirty_backgrounds = set()
+        self.highlighted = None
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self._background_mesh = Mesh(mode='triangles')
+            self._press_color = Color(1, 1, 1, 0)
+            self._press_rect = Rectangle(pos=(0, 0), size=(0, 0))
+            self._text_group = InstructionGroup()
+        # State changes are coalesced into one pass per frame over the cells that changed
+        self._backgrounds_trigger = Clock.create_trigger(self._update_backgrounds, 0)
+        self._text_trigger = Clock.create_trigger(self._draw_text, 0)
+        self.bind(pos=self._redraw, size=self._redraw)
+        if build:
+            for section in self.SECTIONS:
+                self.cells.update((cell.cell_id, cell) for cell in self._section_cells(section))
+
+    def _section_cells(self, section):
+        bet, chip = self.actions['bet'], self.actions['chip']
+        if section == 'chips':
+            cells = [Cell('chip_label', 'CHIP:', 20, None, shade=False)]
+            for value in TableState.CHIP_VALUES:
+                cells.append(Cell(f'chip_{value}', f'${value}', 20, CHIP_IDLE,
+                                  lambda v=value: chip(v), shade=False))
+            return cells
+        if section == 'zero':
+            return [Cell('zero', '0', 20, (0.0, 0.6, 0.0, 1), lambda: bet('zero'))]
+        if section.startswith('numbers_'):
+            row = NUMBER_ROWS[('numbers_top', 'numbers_middle', 'numbers_bottom').index(section)]
+            return [Cell(f'number_{number}', str(number), 18, RED if number in RED_NUMBERS else BLACK,
+                         lambda n=number: bet(f'number_{n}')) for number in row]
+        if section in ('dozens', 'even_money'):
+            specs = DOZEN_CELLS if section == 'dozens' else EVEN_MONEY_CELLS
+            return [Cell(cell_id, text, font_size, color, lambda b=cell_id: bet(b))
+                    for cell_id, text, font_size, color in specs]
+        if section == 'controls':
+            return [Cell(cell_id, text, font_size, color, self.actions[cell_id])
+                    for cell_id, text, font_size, color in CONTROL_CELLS]
+        raise ValueError(f"Unknown betting grid section: {section}")
+
+    def build_section(self, section):
+        """Add one section's cells; only they are laid out and have their text drawn"""
+        cells = self._section_cells(section)
+        for cell in cells:
+            self.cells[cell.cell_id] = cell
+            if cell.cell_id in self._rects:
+                cell.rect = self._rects[cell.cell_id]
+            self._dirty_text.add(cell.cell_id)
+            self._dirty_backgrounds.add(cell.cell_id)
+        if self._layout_size is not None:
+            self._build_index()
+        self._backgrounds_trigger()
+        self._text_trigger()
+
+    # Layout
+
+    def compute_layout(self, width, height):
+        """Cell rectangles (x, y, w, h) relative to the widget, mirroring the old BoxLayouts"""
+        rects = {}
+        # Rows bottom-up: controls, table area, chip selector
+        rows = box_split(0, height, [0.1, 0.74, 0.08], 0)
+        (control_y, control_h), (table_y, table_h), (chip_y, chip_h) = rows
+
+        chip_ids = ['chip_label'] + [f'chip_{v}' for v in TableState.CHIP_VALUES]
+        chip_hints = [0.12] + [1 / len(TableState.CHIP_VALUES)] * len(TableState.CHIP_VALUES)
+        for cell_id, (x, w) in zip(chip_ids, box_split(0, width, chip_hints, 2, (5, 5))):
+            rects[cell_id] = (x, chip_y + 2, w, chip_h - 4)
+
+        # Table area: numbers (0.7), dozens (0.15), even-money bets (0.15), top to bottom
+        (low_y, low_h), (dozen_y, dozen_h), (top_y, top_h) = box_split(table_y, table_h, [0.15, 0.15, 0.7], 2, (2, 2))
+        (zero_x, zero_w), (numbers_x, numbers_w) = box_split(0, width, [0.08, 0.92], 3, (5, 5))
+        rects['zero'] = (zero_x, top_y, zero_w, top_h)
+        row_slots = box_split(top_y, top_h, [1, 1, 1], 2)[::-1]  # Top row first
+        for row, (row_y, row_h) in zip(NUMBER_ROWS, row_slots):
+            for number, (x, w) in zip(row, box_split(numbers_x, numbers_w, [1] * 12, 1)):
+                rects[f'number_{number}'] = (x, row_y, w, row_h)
+
+        _, (dozens_x, dozens_w) = box_split(0, width, [0.08, 0.92], 2, (5, 5))
+        for (cell_id, _, _, _), (x, w) in zip(DOZEN_CELLS, box_split(dozens_x, dozens_w, [1, 1, 1], 2)):
+            rects[cell_id] = (x, dozen_y, w, dozen_h)
+        for (cell_id, _, _, _), (x, w) in zip(EVEN_MONEY_CELLS, box_split(0, width, [1] * 6, 2, (5, 5))):
+            rects[cell_id] = (x, low_y, w, low_h)
+
+        for (cell_id, _, _, _), (x, w) in zip(CONTROL_CELLS, box_split(0, width, [1] * 4, 10, (10, 10))):
+            rects[cell_id] = (x, control_y + 5, w, control_h - 10)
+        return rects
+
+    def _apply_layout(self):
+        size = (int(self.width), int(self.height))
+        if size == self._layout_size:
+            return
+        self._layout_size = size
+        self._rects = self.compute_layout(*size)
+        for cell_id, cell in self.cells.items():
+            cell.rect = self._rects[cell_id]
+        self._build_index()
+
+    def _build_index(self):
+        """Bucket grid over the widget: each bucket lists the interactive cells overlapping it"""
+        self._index = {}
+        bucket_w = max(1.0, self.width / INDEX_BUCKETS)
+        bucket_h = max(1.0, self.height / INDEX_BUCKETS)
+        self._bucket_size = (bucket_w, bucket_h)
+        for cell in self.cells.values():
+            if cell.action is None:
+                continue
+            x, y, w, h = cell.rect
+            for bx in range(int(x // bucket_w), int((x + w) // bucket_w) + 1):
+                for by in range(int(y // bucket_h), int((y + h) // bucket_h) + 1):
+                    self._index.setdefault((bx, by), []).append(cell)
+
+    def cell_at(self, x, y):
+        """Interactive cell under a point in window coordinates, or None"""
+        x -= self.x
+        y -= self.y
+        bucket_w, bucket_h = self._bucket_size
+        for cell in self._index.get((int(x // bucket_w), int(y // bucket_h)), ()):
+            cx, cy, w, h = cell.rect
+            if cx <= x <= cx + w and cy <= y <= cy + h:
+                return cell
+        return None
+
+    # Drawing
+
+    def _update_palette_texture(self):
+        """One texel per background colour - quads pick their colour through texture coordinates"""
+        colors = [cell.background for cell in self.cells.values() if cell.background is not None]
+        new_colors = [color for color in dict.fromkeys(colors) if color not in self._palette]
+        if not new_colors and self._palette_texture is not None:
+            return
+        self._palette.extend(new_colors)
+        pixels = bytes(int(round(c * 255)) for color in self._palette for c in color)
+        texture = Texture.create(size=(len(self._palette), 1), colorfmt='rgba')
+        texture.mag_filter = texture.min_filter = 'nearest'
+        texture.blit_buffer(pixels, colorfmt='rgba', bufferfmt='ubyte')
+        self._palette_texture = texture
+        self._background_mesh.texture = texture
+
+    def _redraw(self, *args):
+        self._apply_layout()
+        self._backgrounds_trigger.cancel()
+        self._text_trigger.cancel()
+        self._draw_backgrounds()
+        self._dirty_text.update(self.cells)
+        self._draw_text()
+
+    def _draw_backgrounds(self, *args):
+        self._update_palette_texture()
+        texel = 1.0 / len(self._palette)
+        vertices, indices = [], []
+        self._background_offsets = {}
+        self._dirty_backgrounds.clear()
+        for cell in self.cells.values():
+            if cell.background is None:
+                continue
+            u, v = (self._palette.index(cell.background) + 0.5) * texel, 0.5
+            x, y, w, h = cell.rect
+            x += self.x
+            y += self.y
+            base = len(vertices) // 4
+            self._background_offsets[cell.cell_id] = len(vertices)
+            vertices.extend((x, y, u, v, x + w, y, u, v, x + w, y + h, u, v, x, y + h, u, v))
+            indices.extend((base, base + 1, base + 2, base, base + 2, base + 3))
+        self._background_vertices = vertices
+        self._background_mesh.vertices = vertices
+        self._background_mesh.indices = indices
+
+    def _update_backgrounds(self, *args):
+        """Patch the palette coordinates of the cells whose background changed"""
+        dirty = [self.cells[cell_id] for cell_id in self._dirty_backgrounds]
+        self._dirty_backgrounds.clear()
+        if any(cell.background is not None and (cell.background not in self._palette or
+                                                cell.cell_id not in self._background_offsets)
+               for cell in dirty):
+            self._draw_backgrounds()  # New colour or new cell - rebuild the mesh
+            return
+        texel = 1.0 / len(self._palette)
+        vertices = self._background_vertices
+        for cell in dirty:
+            u = (self._palette.index(cell.background) + 0.5) * texel
+            offset = self._background_offsets[cell.cell_id]
+            for corner in range(4):
+                vertices[offset + corner * 4 + 2] = u
+        self._background_mesh.vertices = vertices
+
+    def _label_texture(self, text, font_size, highlighted=False):
+        """Atlas sprite for a label, or a cached CoreLabel texture when it has not been baked"""
+        if highlighted:
+            name, font_size = sprites.highlight_sprite(text), sprites.HIGHLIGHT_FONT_SIZE
+        else:
+            name = sprites.label_sprite(text)
+        texture = self.sprites.texture(name) if self.sprites else None
+        if texture is not None:
+            return texture, self.sprites.draw_size(texture, self.font_scale)
+        texture = TEXT_CACHE.texture(text, int(font_size * self.font_scale), bold=True)
+        return texture, texture.size
+
+    def _amount_quads(self, text, font_size):
+        """Glyph sprites for a '$123' string, or one CoreLabel texture without the atlas"""
+        glyphs = [self.sprites.texture(sprites.glyph_sprite(c)) for c in text] if self.sprites else [None]
+        if None in glyphs:
+            texture, size = self._label_texture(text, font_size)
+            return [(texture, size)]
+        scale = self.font_scale * font_size / sprites.GLYPH_FONT_SIZE
+        return [(glyph, self.sprites.draw_size(glyph, scale)) for glyph in glyphs]
+
+    def _cell_text_quads(self, cell):
+        """(texture, x, y, w, h) for the label and bet amount, centred in the cell"""
+        if cell.text.startswith('$'):
+            label = self._amount_quads(cell.text, cell.font_size)
+        else:
+            label = [self._label_texture(cell.text, cell.font_size, cell.highlighted)]
+        lines = [label]
+        if cell.amount > 0:
+            lines.append(self._amount_quads(f'${cell.amount}', cell.font_size))
+
+        heights = [max(h for _, (_, h) in line) for line in lines]
+        gap = 2 * self.font_scale
+        x, y, w, h = cell.rect
+        top = self.y + y + (h + sum(heights) + gap * (len(lines) - 1)) / 2
+        quads = []
+        for line, line_height in zip(lines, heights):
+            top -= line_height
+            left = self.x + x + (w - sum(qw for _, (qw, _) in line)) / 2
+            for texture, (qw, qh) in line:
+                quads.append((texture, left, top + (line_height - qh) / 2, qw, qh))
+                left += qw
+            top -= gap
+        return quads
+
+    def _cell_vertices(self, cell):
+        """Text vertices of one cell, grouped by (texture page, text colour)"""
+        groups = {}
+        for texture, x, y, w, h in self._cell_text_quads(cell):
+            key = (texture.id, cell.text_color)
+            if key not in groups:
+                groups[key] = (texture, [])
+            t = texture.tex_coords  # Bottom-left, bottom-right, top-right, top-left
+            groups[key][1].extend((x, y, t[0], t[1], x + w, y, t[2], t[3],
+                                   x + w, y + h, t[4], t[5], x, y + h, t[6], t[7]))
+        return groups
+
+    def _draw_text(self, *args):
+        """Re-layout the text of dirty cells only, then refill the meshes they belong to
+
+        There is one mesh per (texture page, text colour) - with the atlas that is
+        one or two meshes for the whole table.
+        """
+        touched = set()
+        for cell_id in self._dirty_text:
+            touched.update(self._text_cache.get(cell_id, {}))
+            self._text_cache[cell_id] = self._cell_vertices(self.cells[cell_id])
+            touched.update(self._text_cache[cell_id])
+        self._dirty_text.clear()
+
+        for key in touched:
+            texture, vertices = None, []
+            for groups in self._text_cache.values():
+                group = groups.get(key)
+                if group is not None:
+                    texture = group[0]
+                    vertices.extend(group[1])
+            quads = len(vertices) // 16
+            indices = [i for q in range(0, quads * 4, 4) for i in (q, q + 1, q + 2, q, q + 2, q + 3)]
+            mesh = self._text_meshes.get(key)
+            if mesh is None:
+                self._text_group.add(Color(*key[1]))
+                mesh = self._text_meshes[key] = Mesh(mode='triangles')
+                self._text_group.add(mesh)
+            if texture is not None:
+                mesh.texture = texture
+            mesh.vertices = vertices
+            mesh.indices = indices
+
+    # State
+
+    def set_amount(self, cell_id, amount):
+        cell = self.cells[cell_id]
+        if cell.amount != amount:
+            cell.amount = amount
+            self._dirty_text.add(cell_id)
+            self._text_trigger()
+
+    def set_style(self, cell_id, background=None, text_color=None):
+        """Change a cell's background (RGBA as given to a Button) or text colour, if different"""
+        cell = self.cells[cell_id]
+        if background is not None and cell.set_background(background):
+            cell.base_background = cell.background
+            self._dirty_backgrounds.add(cell_id)
+            self._backgrounds_trigger()
+        if text_color is not None and text_color != cell.text_color:
+            cell.text_color = text_color
+            self._dirty_text.add(cell_id)
+            self._text_trigger()
+
+    def _set_highlight(self, cell, on):
+        cell.highlighted = on
+        if on:
+            cell.set_background(HIGHLIGHT)
+        else:
+            cell.background = cell.base_background
+        cell.text_color = DARK_TEXT if on else LIGHT_TEXT
+        self._dirty_backgrounds.add(cell.cell_id)
+        self._dirty_text.add(cell.cell_id)
+        self._backgrounds_trigger()
+        self._text_trigger()
+
+    def highlight(self, cell_id):
+        """Highlight one cell (gold, dark larger text), restoring only the previously highlighted one"""
+        if cell_id == self.highlighted:
+            return
+        self.clear_highlight()
+        self._set_highlight(self.cells[cell_id], True)
+        self.highlighted = cell_id
+
+    def clear_highlight(self):
+        if self.highlighted is not None:
+            self._set_highlight(self.cells[self.highlighted], False)
+            self.highlighted = None
+
+    # Input
+
+    def on_touch_down(self, touch):
+        if not self.input_enabled or not self.collide_point(*touch.pos):
+            return super().on_touch_down(touch)
+        cell = self.cell_at(*touch.pos)
+        if cell is None:
+            return True
+        touch.grab(self)
+        self._pressed = cell
+        x, y, w, h = cell.rect
+        self._press_rect.pos = (self.x + x, self.y + y)
+        self._press_rect.size = (w, h)
+        self._press_color.a = 0.25  # Pressed feedback like a Button
+        cell.action()
+        return True
+
+    def on_touch_up(self, touch):
+        if touch.grab_current is not self:
+            return super().on_touch_up(touch)
+        touch.ungrab(self)
+        self._pressed = None
+        self._press_color.a = 0
+        return True
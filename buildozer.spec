@@ -22,7 +22,7 @@ source.include_patterns = roulette_game/**/*,sounds/*.mp3,sounds/*.wav
 #source.exclude_exts = spec
 
 # (list) List of directory to exclude (let empty to not exclude anything)
-#source.exclude_dirs = tests, bin
+source.exclude_dirs = cache, sounds/cache, tests
 
 # (str) Application versioning (method 1)
 version = 0.1
@@ -33,7 +33,7 @@ version = 0.1
 
 # (list) Application requirements
 # comma separated e.g. requirements = sqlite3,kivy
-requirements = python3,kivy
+requirements = python3,kivy,pillow
 
 # (str) Custom source folders for requirements
 #requirements.source.kivy = ../../kivy
@@ -0,0 +1,475 @@
+"""
+Roulette game engine - wheel/ball physics and table rules without any Kivy dependency.
+RouletteWheel and RouletteGame in main.py build on these classes; replay.py drives
+them headlessly.
+"""
+
+import math
+
+from rng import RNGService
+
+# Physics runs at a fixed step so a round is fully determined by the seed and the
+# tick at which each player input arrived. Kivy caps the main loop at 60 FPS, so the
+# per-step friction constants below were tuned (in practice) for 60 steps per second.
+PHYSICS_HZ = 60
+FIXED_DT = 1.0 / PHYSICS_HZ
+MAX_STEPS_PER_ADVANCE = PHYSICS_HZ  # Never try to catch up more than one second
+
+TWO_PI = 2 * math.pi
+
+# European roulette numbers in proper order
+NUMBERS = [
+    0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23,
+    10, 5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26
+]
+
+# Color mapping
+RED_NUMBERS = [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]
+BLACK_NUMBERS = [2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35]
+
+SPACEBAR = 32
+
+# WheelPhysics attributes saved by snapshot() - everything a spin in progress needs to continue
+PHYSICS_STATE = ('angle', 'spinning', 'spin_speed', 'winning_number', 'ball_angle', 'ball_active',
+                 'ball_speed', 'ball_on_bumper', 'ball_rotations', 'ball_settled',
+                 'wheel_rotations_after_drop', 'ball_has_dropped', 'tick', 'spin_start_tick',
+                 'settle_tick', 'prev_ball_angle', 'prev_wheel_angle')
+
+
+def calculate_payout(bet_type, amount, win_number):
+    """Return the payout (stake included) for one bet, or 0 if it lost"""
+    if bet_type == 'red' and win_number in RED_NUMBERS:
+        return amount * 2
+    elif bet_type == 'black' and win_number not in RED_NUMBERS and win_number != 0:
+        return amount * 2
+    elif bet_type == 'even' and win_number != 0 and win_number % 2 == 0:
+        return amount * 2
+    elif bet_type == 'odd' and win_number != 0 and win_number % 2 == 1:
+        return amount * 2
+    elif bet_type == 'low' and win_number >= 1 and win_number <= 18:
+        return amount * 2
+    elif bet_type == 'high' and win_number >= 19 and win_number <= 36:
+        return amount * 2
+    elif bet_type == 'dozen1' and win_number >= 1 and win_number <= 12:
+        return amount * 3
+    elif bet_type == 'dozen2' and win_number >= 13 and win_number <= 24:
+        return amount * 3
+    elif bet_type == 'dozen3' and win_number >= 25 and win_number <= 36:
+        return amount * 3
+    elif bet_type == 'zero' and win_number == 0:
+        return amount * 36  # House edge makes this payout high
+    elif bet_type.startswith('number_'):
+        bet_num = int(bet_type.split('_')[1])
+        if win_number == bet_num:
+            return amount * 36
+    return 0
+
+
+class WheelPhysics:
+    """Wheel and ball simulation (usable as a mixin in front of a Kivy Widget)"""
+
+    NUMBERS = NUMBERS
+    RED_NUMBERS = RED_NUMBERS
+    BLACK_NUMBERS = BLACK_NUMBERS
+
+    def __init__(self, rng=None, verbose=True, **kwargs):
+        # Seeded random stream for this table (spin speed, ball launch, drop chance)
+        self.rng = rng if rng is not None else RNGService().stream('table-1')
+        self.verbose = verbose
+        self.angle = 0.0
+        self.spinning = False
+        self.spin_speed = 0.0
+        self.winning_number = None
+        self.ball_angle = 0.0
+        self.ball_active = False
+        self.ball_speed = 0.0
+        self.ball_on_bumper = True  # Ball starts on bumper track
+        self.ball_rotations = 0.0  # Track rotations on bumper
+        self.ball_settled = False  # Ball has settled in pocket
+        self.wheel_rotations_after_drop = 0.0  # Track wheel rotations after ball drops
+        self.ball_has_dropped = False  # Flag when ball drops from bumper
+        self.angle_per_pocket = TWO_PI / len(self.NUMBERS)  # Pre-calculate angle per pocket
+        self.tick = 0  # Physics steps taken since start
+        self.spin_start_tick = None  # Tick when spinning started (for timeout)
+        self.settle_tick = None  # Tick the ball last settled on (recorded with the round result)
+        self.max_spin_time = 30.0  # Maximum spin time in seconds (safety timeout)
+        self.prev_ball_angle = 0.0  # Previous ball angle for interpolation
+        self.prev_wheel_angle = 0.0  # Previous wheel angle for interpolation
+        self._accumulator = 0.0  # Frame time not yet consumed by fixed steps
+        super().__init__(**kwargs)
+
+    def log(self, message):
+        """Print a status message unless running silently (headless replay)"""
+        if self.verbose:
+            print(message)
+
+    def on_ball_dropped(self):
+        """Hook called when the ball leaves the bumper track"""
+        pass
+
+    @property
+    def idle(self):
+        """True when neither the wheel nor the ball is moving"""
+        return not self.spinning and not self.ball_active
+
+    def start_spin(self):
+        """Start spinning the wheel"""
+        if not self.spinning:
+            self.spinning = True
+            self.spin_speed = self.rng.uniform(5.0, 8.0)  # radians per second
+            self.spin_start_tick = None  # Will be set on the next step
+            self.log("Wheel spinning!")
+
+    def launch_ball(self):
+        """Launch the ball on the bumper track"""
+        if not self.ball_active:
+            self.ball_active = True
+            self.ball_on_bumper = True  # Start on bumper track
+            self.ball_settled = False  # Reset settled flag
+            self.ball_has_dropped = False  # Reset drop flag
+            self.wheel_rotations_after_drop = 0.0  # Reset wheel rotation counter
+            self.spin_start_tick = None  # Reset spin timer
+            self.ball_angle = self.rng.uniform(0, TWO_PI)
+            self.ball_speed = self.rng.uniform(8.0, 12.0)  # radians per second
+            self.ball_rotations = 0.0  # Reset rotation counter
+            self.log("Ball launched on bumper track!")
+
+    def advance(self, dt):
+        """Consume frame time in fixed physics steps, returns the number of steps taken"""
+        self._accumulator += dt
+        steps = int(self._accumulator / FIXED_DT)
+        if steps > MAX_STEPS_PER_ADVANCE:
+            # Long stall (e.g. app in background) - drop the backlog instead of spiralling
+            steps = MAX_STEPS_PER_ADVANCE
+            self._accumulator = 0.0
+        else:
+            self._accumulator -= steps * FIXED_DT
+        for _ in range(steps):
+            self.step()
+        return steps
+
+    def snapshot(self):
+        """Wheel and ball state as a JSON-serialisable dict"""
+        return {name: getattr(self, name) for name in PHYSICS_STATE}
+
+    def restore(self, state):
+        """Continue from a snapshot() (the frame time backlog is dropped)"""
+        for name in PHYSICS_STATE:
+            if name in state:
+                setattr(self, name, state[name])
+        self._accumulator = 0.0
+
+    def skip_idle(self, ticks):
+        """Advance the tick counter without simulating (only valid while idle)"""
+        self.tick += ticks
+
+    def _snap_ball_to_winner(self):
+        """Snap ball to the exact center of the winning pocket"""
+        if self.winning_number is not None:
+            pocket_index = self.NUMBERS.index(self.winning_number)
+            self.ball_angle = (self.angle + (pocket_index * self.angle_per_pocket)) % TWO_PI
+
+    def step(self, dt=FIXED_DT):
+        """Advance wheel and ball physics by one fixed step"""
+        self.tick += 1
+
+        # Track spin start tick for timeout
+        if self.spinning and self.spin_start_tick is None:
+            self.spin_start_tick = self.tick
+
+        # Emergency timeout: Force stop if spinning too long (30 seconds)
+        if self.spinning:
+            elapsed_time = (self.tick - self.spin_start_tick) * FIXED_DT
+            if elapsed_time > self.max_spin_time:
+                self.log(f"⚠️ EMERGENCY STOP: Spinning for {elapsed_time:.1f} seconds, forcing stop!")
+                self.spinning = False
+                self.spin_speed = 0.0
+                if self.ball_active:
+                    self.ball_active = False
+                    self.ball_speed = 0.0
+                    self.ball_settled = True
+                    if not self.ball_has_dropped:
+                        self.ball_has_dropped = True
+                        self.ball_on_bumper = False
+                    self.determine_ball_pocket()
+                    self._snap_ball_to_winner()
+                    self.settle_tick = self.tick
+
+        # Update wheel rotation
+        if self.spinning:
+            old_angle = self.angle
+            self.prev_wheel_angle = old_angle
+            self.angle += self.spin_speed * dt
+            self.spin_speed *= 0.99938  # Friction per physics step
+
+            # Track wheel rotations after ball drops
+            if self.ball_has_dropped:
+                angle_diff = self.angle - old_angle
+                if angle_diff < 0:  # Handle angle wraparound
+                    angle_diff += TWO_PI
+                self.wheel_rotations_after_drop += angle_diff / TWO_PI
+
+                # Stop wheel after exactly 1 rotation
+                if self.wheel_rotations_after_drop >= 1.0:
+                    self.spinning = False
+                    self.spin_speed = 0.0
+
+                    # Stop ball at the same time and determine winning pocket
+                    if self.ball_active and not self.ball_on_bumper:
+                        self.ball_active = False
+                        self.ball_speed = 0.0
+                        self.ball_settled = True
+                        self.determine_ball_pocket()
+                        self._snap_ball_to_winner()
+                        self.settle_tick = self.tick
+
+                    self.log(f"Wheel and ball stopped after {self.wheel_rotations_after_drop:.1f} rotations!")
+                    self.spin_start_tick = None  # Reset spin timer
+            elif self.spin_speed < 0.05:  # Fallback if ball hasn't dropped yet
+                self.spinning = False
+                self.spin_speed = 0.0
+                self.spin_start_tick = None  # Reset spin timer
+                self.log("Wheel stopped!")
+
+        # Update ball
+        if self.ball_active:
+            # Ball drops from bumper to number section after some time
+            if self.ball_on_bumper:
+                old_angle = self.ball_angle
+                self.prev_ball_angle = old_angle
+                # Normalize ball angle to prevent precision issues
+                self.ball_angle = (old_angle + self.ball_speed * dt) % TWO_PI
+
+                # Track rotations on bumper
+                angle_diff = self.ball_angle - old_angle
+                if angle_diff < 0:  # Handle angle wraparound
+                    angle_diff += TWO_PI
+                self.ball_rotations += angle_diff / TWO_PI
+
+                # Force drop after exactly 4 rotations (maximum limit)
+                if self.ball_rotations >= 4.0:
+                    self._drop_ball("(forced at 4.0 limit)")
+                elif self.ball_rotations >= 3.0:
+                    # Chance to drop from bumper to number section (more likely as speed decreases)
+                    # But only between 3.0 and 4.0 rotations
+                    drop_chance = (12.0 - self.ball_speed) / 12.0 * 0.03
+                    if self.rng.random() < drop_chance * dt * 240:  # Scale by step length
+                        self._drop_ball()
+
+                self.ball_speed *= 0.99938  # Friction per physics step
+            else:
+                # Ball on number section - moves with wheel and slows down
+                self.prev_ball_angle = self.ball_angle
+                self.ball_angle = (self.ball_angle + (self.ball_speed + self.spin_speed) * dt) % TWO_PI
+                self.ball_speed *= 0.99625  # Friction per physics step
+
+    def _drop_ball(self, reason=""):
+        """Move the ball from the bumper track to the pocket section"""
+        self.ball_on_bumper = False
+        self.ball_has_dropped = True  # Mark that ball has dropped
+        self.ball_speed *= 0.7  # Speed reduction when dropping
+        self.log(f"Ball dropped from bumper to number section after {self.ball_rotations:.1f} rotations! {reason}".rstrip())
+        self.on_ball_dropped()
+
+    def determine_winning_number(self):
+        """Determine winning number based on wheel angle"""
+        # Normalize angle to 0-2π
+        normalized_angle = self.angle % TWO_PI
+        if normalized_angle < 0:
+            normalized_angle += TWO_PI
+
+        # Calculate which pocket (accounting for rotation direction)
+        num_pockets = len(self.NUMBERS)
+        pocket_index = int((normalized_angle / TWO_PI) * num_pockets)
+        pocket_index = num_pockets - pocket_index - 1  # Reverse for clockwise
+        pocket_index = pocket_index % num_pockets
+
+        self.winning_number = self.NUMBERS[pocket_index]
+        return self.winning_number
+
+    def determine_ball_pocket(self):
+        """Determine which pocket the ball settled in based on ball angle relative to wheel"""
+        # Calculate relative angle between ball and wheel
+        relative_angle = (self.ball_angle - self.angle) % TWO_PI
+        if relative_angle < 0:
+            relative_angle += TWO_PI
+
+        # Calculate which pocket the ball is in
+        num_pockets = len(self.NUMBERS)
+        pocket_index = int((relative_angle / TWO_PI) * num_pockets)
+        pocket_index = pocket_index % num_pockets
+
+        self.winning_number = self.NUMBERS[pocket_index]
+        self.log(f"Ball settled in pocket: {self.winning_number}")
+        return self.winning_number
+
+
+class TableState:
+    """Bets, balance and round settlement for one table (usable as a mixin)"""
+
+    CHIP_VALUES = [1, 5, 10, 25, 50, 100]
+    # Casino-standard (chip color, text color) per chip value
+    CHIP_COLORS = {
+        1: ((1.0, 1.0, 1.0, 1), (0, 0, 0, 1)),      # White chip, black text
+        5: ((0.8, 0.2, 0.2, 1), (1, 1, 1, 1)),       # Red chip, white text
+        10: ((0.2, 0.4, 0.8, 1), (1, 1, 1, 1)),      # Blue chip, white text
+        25: ((0.2, 0.6, 0.2, 1), (1, 1, 1, 1)),      # Green chip, white text
+        50: ((0.9, 0.7, 0.2, 1), (0, 0, 0, 1)),      # Orange/Yellow chip, black text
+        100: ((0.1, 0.1, 0.1, 1), (1, 1, 1, 1))      # Black chip, white text
+    }
+    DEFAULT_CHIP_COLOR = ((0.8, 0.6, 0.2, 1), (0, 0, 0, 1))
+    HISTORY_LENGTH = 35
+
+    verbose = True
+
+    def init_table(self, wheel, balance=1000, current_chip=5, previous_numbers=None):
+        """Set up table state - call once the wheel exists"""
+        self.wheel = wheel
+        self.balance = balance
+        self.last_win = None
+        self.current_chip = current_chip
+        self.bets = {}
+        self.total_bet = 0
+        self.last_bet = 0  # Track the last total bet value
+        self.last_bets = {}  # Track the last bets dictionary for rebet
+        self.previous_numbers = previous_numbers if previous_numbers is not None else []
+
+    def log(self, message):
+        """Print a status message unless running silently (headless replay)"""
+        if self.verbose:
+            print(message)
+
+    def snapshot(self):
+        """Table and wheel state of the round in progress as a JSON-serialisable dict"""
+        return {
+            'balance': self.balance,
+            'last_win': self.last_win,
+            'current_chip': self.current_chip,
+            'bets': dict(self.bets),
+            'total_bet': self.total_bet,
+            'last_bet': self.last_bet,
+            'last_bets': dict(self.last_bets),
+            'previous_numbers': list(self.previous_numbers),
+            'wheel': self.wheel.snapshot(),
+        }
+
+    def restore(self, state):
+        """Continue from a snapshot() - bets on the table and a spin in progress included"""
+        self.balance = state['balance']
+        self.last_win = state['last_win']
+        self.current_chip = state['current_chip']
+        self.bets = dict(state['bets'])
+        self.total_bet = state['total_bet']
+        self.last_bet = state['last_bet']
+        self.last_bets = dict(state['last_bets'])
+        self.previous_numbers = list(state['previous_numbers'])
+        self.wheel.restore(state['wheel'])
+
+    def apply_select_chip(self, value):
+        """Select chip value for betting"""
+        self.current_chip = value
+
+    def apply_bet(self, bet_type):
+        """Place the current chip on bet_type, returns False on insufficient balance"""
+        if self.balance < self.current_chip:
+            return False
+        self.bets[bet_type] = self.bets.get(bet_type, 0) + self.current_chip
+        self.total_bet += self.current_chip
+        self.balance -= self.current_chip
+        return True
+
+    def apply_rebet(self):
+        """Repeat the last bets - None if there are none, False if unaffordable"""
+        if not self.last_bets:
+            return None
+        # Check if we have enough balance for the last bets
+        last_total = sum(self.last_bets.values())
+        if self.balance < last_total:
+            return False
+        # Refund current bets, then restore the last ones
+        self.balance += self.total_bet
+        self.bets = self.last_bets.copy()
+        self.total_bet = last_total
+        self.balance -= self.total_bet
+        return True
+
+    def apply_double(self):
+        """Double all current bets - None if there are none, False if unaffordable"""
+        if not self.bets:
+            return None
+        # Need enough balance to double (need to add the same amount again)
+        if self.balance < self.total_bet:
+            return False
+        for bet_type in self.bets:
+            self.bets[bet_type] *= 2
+        # Subtract only the additional amount (the original total_bet)
+        self.balance -= self.total_bet
+        self.total_bet *= 2
+        return True
+
+    def apply_clear(self):
+        """Clear all bets and refund them to the balance"""
+        self.balance += self.total_bet
+        # Don't update last_bet when manually clearing - it should keep the previous spin's total
+        self.bets = {}
+        self.total_bet = 0
+
+    def apply_spin(self):
+        """Spin wheel and launch ball - None without bets, False if already spinning"""
+        if self.total_bet <= 0:
+            return None
+        if not self.wheel.idle:
+            return False
+        self.wheel.start_spin()
+        self.wheel.launch_ball()
+        return True
+
+    def apply_key(self, key):
+        """Keyboard control - returns True when a new spin was started"""
+        if key != SPACEBAR:
+            return False
+        if self.wheel.idle:
+            self.wheel.start_spin()
+            self.wheel.launch_ball()
+            return True
+        if self.wheel.spinning and not self.wheel.ball_active:
+            # Launch ball if wheel is spinning but ball isn't active
+            self.wheel.launch_ball()
+        return False
+
+    def poll_round(self):
+        """Return the winning number once when a spin has just completed, else None"""
+        wheel = self.wheel
+        if not wheel.spinning and wheel.winning_number is not None and wheel.winning_number != self.last_win:
+            self.last_win = wheel.winning_number
+            return wheel.winning_number
+        return None
+
+    def settle_round(self, win_number):
+        """Pay out winning bets and record the number, returns the total payout"""
+        total_payout = 0
+        for bet_type, amount in self.bets.items():
+            payout = calculate_payout(bet_type, amount, win_number)
+            if payout > 0:
+                total_payout += payout
+                self.log(f"WIN! {bet_type}: bet ${amount}, payout ${payout}")
+
+        if total_payout > 0:
+            self.balance += total_payout
+            self.log(f"Total payout: ${total_payout}, New balance: ${self.balance}")
+        else:
+            self.log("No winning bets this round")
+
+        # Add winning number to previous numbers list
+        self.previous_numbers.append(win_number)
+        if len(self.previous_numbers) > self.HISTORY_LENGTH:
+            self.previous_numbers.pop(0)  # Keep only the last 35 numbers
+
+        return total_payout
+
+    def finish_round(self):
+        """Take the bets off the table after a round, remembering them for rebet"""
+        self.last_bet = self.total_bet  # Save total bet as last bet before clearing
+        self.last_bets = self.bets.copy()  # Save bets dictionary for rebet
+        self.bets = {}
+        self.total_bet = 0
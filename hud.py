@@ -0,0 +1,124 @@
+"""
+Performance HUD for the roulette game.
+A small text overlay with frame time, wheel physics and draw() percentiles,
+canvas size (also per draw() layer), garbage collection rate and text cache
+hits. Toggled with F3; while it is hidden the wheel keeps no timings at all.
+"""
+
+import time
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.uix.label import Label
+
+from perf import FrameTimings, gc_collections
+from text_cache import TEXT_CACHE
+
+HUD_KEY = 284  # F3
+REFRESH_INTERVAL = 0.5
+
+
+def count_canvas(root):
+    """Canvas instructions and distinct GL textures used by a widget tree"""
+    instructions = 0
+    textures = set()
+    for widget in root.walk():
+        canvas = widget.canvas
+        stack = [canvas]
+        if canvas.has_before:
+            stack.append(canvas.before)
+        if canvas.has_after:
+            stack.append(canvas.after)
+        while stack:
+            group = stack.pop()
+            for instruction in group.children:
+                instructions += 1
+                texture = getattr(instruction, 'texture', None)
+                if texture is not None:
+                    textures.add(texture.id)  # Atlas regions share their page's id
+                if hasattr(instruction, 'children'):
+                    stack.append(instruction)
+    return instructions, len(textures)
+
+
+class PerfHUD(Label):
+    """Overlay on the window showing where frame time goes"""
+
+    def __init__(self, game, **kwargs):
+        super().__init__(font_name='RobotoMono-Regular', font_size=12, color=(0.6, 1, 0.6, 1),
+                         halign='left', valign='top', size_hint=(None, None), **kwargs)
+        self.game = game
+        self.visible = False
+        self.timings = None
+        self._event = None
+        self._last_flip = None
+        self._gc_count = 0
+        self._gc_at = 0.0
+        with self.canvas.before:
+            Color(0, 0, 0, 0.6)
+            self._bg = Rectangle(pos=self.pos, size=self.size)
+        self.bind(texture_size=self._fit, pos=self._move_bg)
+
+    def _fit(self, instance, size):
+        self.size = (size[0] + 12, size[1] + 8)
+        self._place()
+
+    def _move_bg(self, instance, pos):
+        self._bg.pos = pos
+        self._bg.size = self.size
+
+    def _place(self, *args):
+        self.pos = (6, Window.height - self.height - 6)
+
+    def toggle(self):
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+
+    def show(self):
+        self.visible = True
+        self.timings = FrameTimings()
+        self.game.wheel.probes.append(self.timings)  # The wheel times its update only while attached
+        self._last_flip = None
+        self._gc_count, self._gc_at = gc_collections(), time.perf_counter()
+        Window.bind(on_flip=self._on_flip, size=self._place)
+        Window.add_widget(self)
+        self._event = Clock.schedule_interval(self.refresh, REFRESH_INTERVAL)
+        self.refresh(0)
+
+    def hide(self):
+        self.visible = False
+        self.game.wheel.probes.remove(self.timings)
+        self.timings = None
+        Window.unbind(on_flip=self._on_flip, size=self._place)
+        Window.remove_widget(self)
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _on_flip(self, window):
+        now = time.perf_counter()
+        if self._last_flip is not None:
+            self.timings.frame.add(now - self._last_flip)
+        self._last_flip = now
+
+    def refresh(self, dt):
+        timings = self.timings
+        now = time.perf_counter()
+        collections = gc_collections()
+        gc_rate = (collections - self._gc_count) / max(now - self._gc_at, 1e-6)
+        self._gc_count, self._gc_at = collections, now
+        instructions, textures = count_canvas(self.game)
+        frame_ms = timings.frame.mean() * 1000
+        text = TEXT_CACHE.stats()
+        self.text = '\n'.join([
+            f"frame   {frame_ms:6.2f} ms  {1000 / frame_ms if frame_ms else 0:5.1f} fps",
+            f"physics p50 {timings.physics.percentile(50) * 1000:6.3f}  p99 {timings.physics.percentile(99) * 1000:6.3f} ms",
+            f"draw    p50 {timings.draw.percentile(50) * 1000:6.3f}  p99 {timings.draw.percentile(99) * 1000:6.3f} ms",
+            f"canvas  {instructions} instructions, {textures} textures",
+            "layers  " + ' '.join(f"{layer} {count}" for layer, count in self.game.wheel.layer_counts().items()),
+            f"gc      {gc_rate:5.1f} collections/s",
+            f"text    {text['hits']} hits, {text['misses']} misses, {text['textures']} textures, {text['resident_kb']} KB",
+        ])
@@ -4,104 +4,113 @@
 A beautiful 2D European roulette simulation for Android and iOS using Kivy.
 """
 
+from perf import STARTUP, MemoryProfiler, flag_enabled  # First import: starts the startup clock
 from kivy.app import App
 from kivy.uix.widget import Widget
-from kivy.graphics import Color, Ellipse, Line, Rectangle, PushMatrix, PopMatrix, Rotate, Triangle, InstructionGroup, Translate, Scale
+from kivy.graphics import Color, Ellipse, Line, Rectangle, PushMatrix, PopMatrix, Rotate, Triangle
 from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.uix.label import Label
-from kivy.uix.button import Button
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.relativelayout import RelativeLayout
-from kivy.uix.floatlayout import FloatLayout
-from kivy.uix.popup import Popup
-from kivy.core.text import Label as CoreLabel
-from kivy.core.audio import SoundLoader
-from kivy.core.image import Image as CoreImage
+import gc
+import json
 import math
-import random
 import os
-try:
-    import wave
-    import struct
-    WAVE_AVAILABLE = True
-except ImportError:
-    WAVE_AVAILABLE = False
+import time
+from rng import RNGService
+from engine import WheelPhysics, TableState
+from replay import RoundRecorder
+from audio import SoundBank, SoundEffects, PCMCache
+from assets import TextureLoader, TEXTURE_DIR, APP_DIR
+from sprites import load_sprites, BALL_BASE_SIZE
+from betting_grid import BettingGrid, CHIP_SELECTED, CHIP_IDLE, LIGHT_TEXT, DARK_TEXT
+from staging import StagedBuilder
+from hud import PerfHUD, HUD_KEY
+from text_cache import TEXT_CACHE
+from quality import QUALITY_PRESETS, QualityGovernor, arc_segments, choose_quality, configured_tier
+# Layouts, CoreImage and the synth/sound cache modules (NumPy) are imported where first used
+
+# Print the startup phase timings once the first frame is on screen
+PROFILE_STARTUP = flag_enabled('--profile-startup', 'ROULETTE_PROFILE_STARTUP')
+# Capture a trace of the hot paths from startup (Ctrl+F3 captures one at any time)
+TRACE_AT_STARTUP = flag_enabled('--trace', 'ROULETTE_TRACE')
+# Record garbage collector pauses (and with tracemalloc, a sampled frame's allocations) per frame phase
+GC_PROFILE = flag_enabled('--gc-profile', 'ROULETTE_GC_PROFILE')
+TRACE_ALLOCATIONS = flag_enabled('--tracemalloc', 'ROULETTE_TRACEMALLOC')
+MEMORY_REPORT_INTERVAL = float(os.environ.get('ROULETTE_MEMORY_REPORT_SECONDS', 10))
+# Move everything allocated while building the UI out of the collector's reach
+GC_FREEZE = flag_enabled('--gc-freeze', 'ROULETTE_GC_FREEZE')
+# Draw the static wheel body (bumper, rim, hub) with one fragment shader (wheel_shader.py)
+WHEEL_SHADER = flag_enabled('--wheel-shader', 'ROULETTE_WHEEL_SHADER')
 
 # Font scaling for Android - fonts are too small on mobile devices
 try:
     from kivy.utils import platform
     FONT_SCALE = 2.5 if platform == 'android' else 1.0
 except:
+    platform = 'unknown'
     FONT_SCALE = 1.0
 
+# Round state is written here when the app is paused, so a game the OS kills in the
+# background carries on where it was at the next launch
+SESSION_FILE = os.environ.get('ROULETTE_SESSION_FILE', os.path.join(APP_DIR, 'cache', 'session.json'))
+# Drop textures and loaded sounds while paused (always on Android, and on any memory warning)
+RELEASE_ON_PAUSE = platform == 'android' or flag_enabled('--release-on-pause', 'ROULETTE_RELEASE_ON_PAUSE')
+
+WHEEL_TEXTURE = os.path.join(TEXTURE_DIR, 'close-up-wood-texture.jpg')
+TABLE_TEXTURE = os.path.join(TEXTURE_DIR, '2696.jpg')
+
+# Layers of RouletteWheel.draw(), back to front, for the per-layer instruction counts
+DRAW_LAYERS = ('felt', 'history', 'bumper', 'rim', 'hub', 'pockets', 'ball', 'dolly')
 
-class RouletteWheel(Widget):
+STARTUP.mark('imports')
+
+
+class RouletteWheel(WheelPhysics, Widget):
     """2D Roulette Wheel Widget"""
-    
-    # European roulette numbers in proper order
-    NUMBERS = [
-        0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23,
-        10, 5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26
-    ]
-    
-    # Color mapping
-    RED_NUMBERS = [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]
-    BLACK_NUMBERS = [2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35]
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.angle = 0.0
-        self.spinning = False
-        self.spin_speed = 0.0
-        self.winning_number = None
-        self.ball_angle = 0.0
-        self.ball_active = False
-        self.ball_speed = 0.0
-        self.ball_on_bumper = True  # Ball starts on bumper track
-        self.ball_rotations = 0.0  # Track rotations on bumper
-        self.ball_settled = False  # Ball has settled in pocket
-        self.wheel_rotations_after_drop = 0.0  # Track wheel rotations after ball drops
-        self.ball_has_dropped = False  # Flag when ball drops from bumper
-        self.angle_per_pocket = 2 * math.pi / len(self.NUMBERS)  # Pre-calculate angle per pocket
-        self.spin_start_time = 0.0  # Track when spinning started (for timeout)
-        self.max_spin_time = 30.0  # Maximum spin time in seconds (safety timeout)
-        self.prev_ball_angle = 0.0  # Previous ball angle for interpolation
-        self.prev_wheel_angle = 0.0  # Previous wheel angle for interpolation
+
+    def __init__(self, rng=None, textures=None, **kwargs):
+        super().__init__(rng=rng, **kwargs)
 
         # Create win text box in center of roulette frame
         self.create_win_text_box()
 
+        # Sprites baked by bake_atlas.py (pocket numbers, ball) for this display scale
+        self.sprites = load_sprites(FONT_SCALE)
+
         # Previous numbers data and cached textures
         self.previous_numbers_data = []
         self.previous_numbers_textures = []
         
-        # Load background texture for roulette frame
+        # Background texture for the roulette frame - decoded off the main thread and
+        # downscaled to the widget size once the layout has sized the widget
         self.background_texture = None
-        # Try multiple paths: relative (for Android) and absolute (for desktop)
-        texture_paths = [
-            'roulette_game/assets/textures/close-up-wood-texture.jpg',
-            r'C:\Users\aminz\OneDrive\Documents\GitHub\Roullett\roulette_game\assets\textures\close-up-wood-texture.jpg'
-        ]
-        
-        texture_path = None
-        for path in texture_paths:
-            if os.path.exists(path):
-                texture_path = path
-                break
-        
-        if texture_path:
-            try:
-                img = CoreImage(texture_path)
-                self.background_texture = img.texture
-                print(f"✓✓✓ SUCCESS: Loaded roulette background texture from: {os.path.abspath(texture_path)}")
-                print(f"  Texture size: {self.background_texture.size}")
-            except Exception as e:
-                print(f"✗ Failed to load texture from {texture_path}: {e}")
-        else:
-            print(f"✗✗✗ WARNING: Texture file not found in any location")
-            print("  Falling back to solid blue-gray color.")
+        self.textures = textures if textures is not None else TextureLoader()
+        self._texture_requested_at = time.perf_counter()
+        self._background_trigger = Clock.create_trigger(self._request_background_texture, 0.1)
+        self.bind(size=self._background_trigger)
+
+        # Frame probes (perf.py) told which phase of update() is running - empty unless the
+        # HUD or the memory profiler is on, and then update() takes the instrumented path
+        self.probes = []
+        self._layer_starts = []  # (layer, canvas index) noted by the last draw()
 
+        # Detail draw() spends on shadows, grain, pocket arcs and highlights (see quality.py)
+        self.quality = QUALITY_PRESETS['ultra']
+
+        # Shader for the bumper, rim and hub - None draws them with instructions
+        self.body_shader = None
+        if WHEEL_SHADER:
+            from wheel_shader import create_body_shader
+            self.body_shader = create_body_shader()
+
+    def _request_background_texture(self, dt=None):
+        self.textures.request(WHEEL_TEXTURE, self.size, self._on_background_texture)
+
+    def _on_background_texture(self, texture):
+        if self.background_texture is None:
+            STARTUP.record('wheel_texture', self._texture_requested_at)
+        self.background_texture = texture
 
     def create_win_text_box(self):
         """Create a text box in the center of the roulette frame"""
@@ -134,188 +143,41 @@ class RouletteWheel(Widget):
         else:
             return (0.15, 0.15, 0.15)  # Deep black
     
-    def start_spin(self):
-        """Start spinning the wheel"""
-        if not self.spinning:
-            self.spinning = True
-            self.spin_speed = random.uniform(5.0, 8.0)  # radians per second
-            self.spin_start_time = 0.0  # Will be set in update() with Clock.get_time()
-            print("Wheel spinning!")
-    
-    def launch_ball(self):
-        """Launch the ball on the bumper track"""
-        if not self.ball_active:
-            self.ball_active = True
-            self.ball_on_bumper = True  # Start on bumper track
-            self.ball_settled = False  # Reset settled flag
-            self.ball_has_dropped = False  # Reset drop flag
-            self.wheel_rotations_after_drop = 0.0  # Reset wheel rotation counter
-            self.spin_start_time = 0.0  # Reset spin timer
-            self.ball_angle = random.uniform(0, 2 * math.pi)
-            self.ball_speed = random.uniform(8.0, 12.0)  # radians per second
-            self.ball_rotations = 0.0  # Reset rotation counter
-            print("Ball launched on bumper track!")
-    
+    def on_ball_dropped(self):
+        """Stop the ball sound when the ball drops from the bumper"""
+        if hasattr(self, 'game') and self.game.ball_drop_sound:
+            self.game.ball_drop_sound.stop()
+
     def update(self, dt):
-        """Update wheel and ball physics"""
-        # Track spin start time for timeout
-        if self.spinning and self.spin_start_time == 0.0:
-            self.spin_start_time = Clock.get_time()
-        
-        # Emergency timeout: Force stop if spinning too long (30 seconds)
-        if self.spinning and self.spin_start_time > 0.0:
-            elapsed_time = Clock.get_time() - self.spin_start_time
-            if elapsed_time > self.max_spin_time:
-                print(f"⚠️ EMERGENCY STOP: Spinning for {elapsed_time:.1f} seconds, forcing stop!")
-                self.spinning = False
-                self.spin_speed = 0.0
-                if self.ball_active:
-                    self.ball_active = False
-                    self.ball_speed = 0.0
-                    self.ball_settled = True
-                    if not self.ball_has_dropped:
-                        self.ball_has_dropped = True
-                        self.ball_on_bumper = False
-                    self.determine_ball_pocket()
-                    if self.winning_number is not None:
-                        pocket_index = self.NUMBERS.index(self.winning_number)
-                        self.ball_angle = (self.angle + (pocket_index * self.angle_per_pocket)) % (2 * math.pi)
-        
-        # Update wheel rotation
-        if self.spinning:
-            old_angle = self.angle
-            self.prev_wheel_angle = self.angle
-            self.angle += self.spin_speed * dt
-            self.spin_speed *= 0.99938  # Adjusted friction for 480 FPS
-
-            # Track wheel rotations after ball drops
-            if self.ball_has_dropped:
-                angle_diff = self.angle - old_angle
-                if angle_diff < 0:  # Handle angle wraparound
-                    angle_diff += 2 * math.pi
-                self.wheel_rotations_after_drop += angle_diff / (2 * math.pi)
-
-                # Stop wheel after exactly 1 rotation
-                if self.wheel_rotations_after_drop >= 1.0:
-                    self.spinning = False
-                    self.spin_speed = 0.0
-
-                    # Stop ball at the same time and determine winning pocket
-                    if self.ball_active and not self.ball_on_bumper:
-                        self.ball_active = False
-                        self.ball_speed = 0.0
-                        self.ball_settled = True
-                        self.determine_ball_pocket()
-                        # Snap ball to the exact center of the winning pocket
-                        if self.winning_number is not None:
-                            pocket_index = self.NUMBERS.index(self.winning_number)
-                            self.ball_angle = (self.angle + (pocket_index * self.angle_per_pocket)) % (2 * math.pi)
-
-                        # Play ball settle sound (disabled - only using ball sound)
-                        # if hasattr(self, 'game') and self.game.ball_settle_sound:
-                        #     self.game.ball_settle_sound.play()
-
-                    print(f"Wheel and ball stopped after {self.wheel_rotations_after_drop:.1f} rotations!")
-                    self.spin_start_time = 0.0  # Reset spin timer
-
-                    # Stop wheel spinning sound (disabled - only using ball sound)
-                    # if hasattr(self, 'game') and self.game.wheel_spin_sound:
-                    #     self.game.wheel_spin_sound.stop()
-            elif self.spin_speed < 0.05:  # Fallback if ball hasn't dropped yet
-                self.spinning = False
-                self.spin_speed = 0.0
-                self.spin_start_time = 0.0  # Reset spin timer
-                print("Wheel stopped!")
-        
-        # Update ball
-        if self.ball_active:
-            # Ball drops from bumper to number section after some time
-            if self.ball_on_bumper:
-                old_angle = self.ball_angle
-                self.prev_ball_angle = self.ball_angle
-                self.ball_angle += self.ball_speed * dt
-
-                # Normalize ball angle to prevent precision issues
-                self.ball_angle = self.ball_angle % (2 * math.pi)
-
-                # Track rotations on bumper
-                angle_diff = self.ball_angle - old_angle
-                if angle_diff < 0:  # Handle angle wraparound
-                    angle_diff += 2 * math.pi
-                self.ball_rotations += angle_diff / (2 * math.pi)
-
-                # Force drop after exactly 4 rotations (maximum limit)
-                if self.ball_rotations >= 4.0:
-                    # FORCE drop after 4 rotations - no random chance needed
-                    self.ball_on_bumper = False
-                    self.ball_has_dropped = True  # Mark that ball has dropped
-                    self.ball_speed *= 0.7  # Speed reduction when dropping
-                    print(f"Ball dropped from bumper to number section after {self.ball_rotations:.1f} rotations! (forced at 4.0 limit)")
-                    
-                    # Stop the sound when ball drops
-                    if hasattr(self, 'game') and self.game.ball_drop_sound:
-                        self.game.ball_drop_sound.stop()
-                elif self.ball_rotations >= 3.0:
-                    # Chance to drop from bumper to number section (more likely as speed decreases)
-                    # But only between 3.0 and 4.0 rotations
-                    drop_chance = (12.0 - self.ball_speed) / 12.0 * 0.03  # Increased chance
-                    if random.random() < drop_chance * dt * 240:  # Scale by framerate (480 FPS)
-                        self.ball_on_bumper = False
-                        self.ball_has_dropped = True  # Mark that ball has dropped
-                        self.ball_speed *= 0.7  # Speed reduction when dropping
-                        print(f"Ball dropped from bumper to number section after {self.ball_rotations:.1f} rotations!")
-
-                        # Stop the sound when ball drops
-                        if hasattr(self, 'game') and self.game.ball_drop_sound:
-                            self.game.ball_drop_sound.stop()
-
-                self.ball_speed *= 0.99938  # Adjusted friction for 480 FPS
-            else:
-                # Ball on number section - moves with wheel and slows down
-                self.prev_ball_angle = self.ball_angle
-                self.ball_angle += (self.ball_speed + self.spin_speed) * dt  # Ball moves with wheel
-                # Normalize ball angle to prevent precision issues
-                self.ball_angle = self.ball_angle % (2 * math.pi)
-                self.ball_speed *= 0.99625  # Adjusted friction for 480 FPS
-
-            # Ball stops only when wheel stops after 4 rotations (handled above)
-            # No separate ball stopping condition needed
-        
+        """Advance wheel and ball physics in fixed steps, then redraw"""
+        probes = self.probes
+        if not probes:
+            self.advance(dt)
+            self.canvas.clear()
+            self.draw()
+            return
+        for probe in probes:
+            probe.phase('physics')
+        self.advance(dt)
+        for probe in probes:
+            probe.phase('draw')
         self.canvas.clear()
         self.draw()
-    
-    def determine_winning_number(self):
-        """Determine winning number based on wheel angle"""
-        # Normalize angle to 0-2π
-        normalized_angle = self.angle % (2 * math.pi)
-        if normalized_angle < 0:
-            normalized_angle += 2 * math.pi
-
-        # Calculate which pocket (accounting for rotation direction)
-        num_pockets = len(self.NUMBERS)
-        pocket_index = int((normalized_angle / (2 * math.pi)) * num_pockets)
-        pocket_index = num_pockets - pocket_index - 1  # Reverse for clockwise
-        pocket_index = pocket_index % num_pockets
+        for probe in probes:
+            probe.phase('other')
 
-        self.winning_number = self.NUMBERS[pocket_index]
-        return self.winning_number
+    def _begin_layer(self, name):
+        """Note where a layer of draw() starts in the canvas (see layer_counts)"""
+        self._layer_starts.append((name, len(self.canvas.children)))
 
-    def determine_ball_pocket(self):
-        """Determine which pocket the ball settled in based on ball angle relative to wheel"""
-        # Calculate relative angle between ball and wheel
-        relative_angle = (self.ball_angle - self.angle) % (2 * math.pi)
-        if relative_angle < 0:
-            relative_angle += 2 * math.pi
+    def layer_counts(self):
+        """Canvas instructions emitted by the last draw(), per layer"""
+        counts = {name: 0 for name in DRAW_LAYERS}
+        starts = self._layer_starts + [(None, len(self.canvas.children))]
+        for (name, start), (_, end) in zip(starts, starts[1:]):
+            counts[name] += end - start
+        return counts
 
-        # Calculate which pocket the ball is in
-        num_pockets = len(self.NUMBERS)
-        pocket_index = int((relative_angle / (2 * math.pi)) * num_pockets)
-        pocket_index = pocket_index % num_pockets
-
-        self.winning_number = self.NUMBERS[pocket_index]
-        print(f"Ball settled in pocket: {self.winning_number}")
-        return self.winning_number
-    
     def draw(self):
         """Draw the roulette wheel with casino-style realism"""
         # Shift center to the right by 5% of width (smaller shift)
@@ -329,7 +191,12 @@ class RouletteWheel(Widget):
         pocket_inner = radius * 0.70  # Pocket inner edge
         
         num_pockets = len(self.NUMBERS)
-        
+        quality = self.quality
+        shadows = quality.shadow_layers
+        highlights = quality.highlight_passes
+        self._layer_starts = []
+
+        self._begin_layer('felt')
         # Draw blue-gray felt background with texture and 3D depth
         with self.canvas:
             # Wheel shadow removed - no shadow on roulette
@@ -345,11 +212,14 @@ class RouletteWheel(Widget):
                 Rectangle(pos=(0, 0), size=(self.width, self.height))
                 
                 # Felt texture (subtle pattern) - only if no texture loaded
-                Color(0.2, 0.2, 0.25, 0.3)  # Slightly lighter very dark blue-gray
-                for i in range(0, int(self.width), 20):
-                    for j in range(0, int(self.height), 20):
-                        Ellipse(pos=(i, j), size=(2, 2))
-
+                if quality.grain_spacing:
+                    Color(0.2, 0.2, 0.25, 0.3)  # Slightly lighter very dark blue-gray
+                    felt_step = 20 * quality.grain_spacing
+                    for i in range(0, int(self.width), felt_step):
+                        for j in range(0, int(self.height), felt_step):
+                            Ellipse(pos=(i, j), size=(2, 2))
+
+            self._begin_layer('history')
             # Draw previous winning numbers on the blue-gray background using cached textures
             if hasattr(self, 'previous_numbers_textures') and self.previous_numbers_textures:
                 # Scale frame and spacing based on platform (mobile needs larger frames, but not too large)
@@ -418,6 +288,7 @@ class RouletteWheel(Widget):
                         else:
                             Rectangle(texture=texture_data['texture'], pos=(texture_x, texture_y), size=texture_data['texture'].size)
 
+            self._begin_layer('felt')
             # Table border
             Color(0.4, 0.25, 0.1, 1)  # Wood border
             Line(rectangle=(0, 0, self.width, self.height), width=8)
@@ -426,220 +297,18 @@ class RouletteWheel(Widget):
             Color(0.5, 0.35, 0.15, 1)  # Lighter wood
             Line(rectangle=(4, 4, self.width-8, self.height-8), width=2)
 
-        # Draw outer bumper track (raised margin) with enhanced wood grain and 3D depth
-        with self.canvas:
-            # Enhanced shadow cast by bumper track onto background (creates depth)
-            Color(0, 0, 0, 0.3)  # Soft shadow
-            Ellipse(pos=(center_x - bumper_outer + 3, center_y - bumper_outer - 3),
-                   size=(bumper_outer * 2, bumper_outer * 2))
-            
-            # Secondary shadow layer for more depth
-            Color(0, 0, 0, 0.2)  # Lighter shadow
-            Ellipse(pos=(center_x - bumper_outer + 5, center_y - bumper_outer - 5),
-                   size=(bumper_outer * 2, bumper_outer * 2))
-
-            # Bumper track base (dark mahogany wood) - raised effect
-            Color(0.12, 0.06, 0.03, 1)  # Even deeper mahogany for base
-            Ellipse(pos=(center_x - bumper_outer, center_y - bumper_outer),
-                   size=(bumper_outer * 2, bumper_outer * 2))
-
-            # Main bumper surface
-            Color(0.15, 0.08, 0.04, 1)  # Deep mahogany
-            Ellipse(pos=(center_x - bumper_outer + 1, center_y - bumper_outer + 1),
-                   size=(bumper_outer * 2 - 2, bumper_outer * 2 - 2))
-
-            # Enhanced wood grain layers for realistic texture
-            for grain_radius in [bumper_outer, bumper_outer * 0.99, bumper_inner + 2, (bumper_inner + 2) * 0.99]:
-                Color(0.25, 0.12, 0.06, 1)  # Medium mahogany
-                Line(circle=(center_x, center_y, grain_radius), width=3)
-            
-            # Additional radial wood grain for texture
-            for i in range(0, 360, 20):  # Every 20 degrees
-                grain_angle = math.radians(i)
-                grain_start = bumper_inner + 3
-                grain_end = bumper_outer - 1
-                x1 = center_x + math.cos(grain_angle) * grain_start
-                y1 = center_y + math.sin(grain_angle) * grain_start
-                x2 = center_x + math.cos(grain_angle) * grain_end
-                y2 = center_y + math.sin(grain_angle) * grain_end
-                Color(0.22, 0.11, 0.05, 0.5)  # Subtle grain lines
-                Line(points=[x1, y1, x2, y2], width=1)
-
-            # Inner shadow for depth
-            Color(0.1, 0.05, 0.02, 0.8)  # Dark inner shadow
-            Ellipse(pos=(center_x - bumper_inner - 2, center_y - bumper_inner - 2),
-                   size=(bumper_inner * 2 + 4, bumper_inner * 2 + 4))
-
-            # Wood highlights for raised effect
-            Color(0.35, 0.18, 0.08, 1)  # Lighter mahogany highlights
-            Line(circle=(center_x, center_y, bumper_outer - 1), width=2)
-            Line(circle=(center_x, center_y, bumper_inner + 1), width=2)
-
-            # Top highlight for 3D effect
-            Color(0.45, 0.25, 0.12, 0.6)  # Bright highlight
-            Ellipse(pos=(center_x - bumper_outer + 2, center_y - bumper_outer + 2),
-                   size=(bumper_outer * 1.8, bumper_outer * 1.8))
-
-            # Enhanced metallic rim with depth and polish
-            Color(0.6, 0.5, 0.3, 1)  # Antique brass
-            Line(circle=(center_x, center_y, bumper_outer), width=2)
-            Line(circle=(center_x, center_y, bumper_inner), width=2)
-            
-            # Rim polish highlights
-            Color(0.85, 0.75, 0.45, 1)  # Bright brass highlight
-            Line(circle=(center_x, center_y, bumper_outer - 0.5), width=1)
-            Line(circle=(center_x, center_y, bumper_inner + 0.5), width=1)
-            
-            # Rim shine effect
-            Color(0.95, 0.85, 0.5, 0.6)  # Very bright shine
-            Line(circle=(center_x, center_y, bumper_outer - 1), width=0.5)
-
-        # Draw outer wheel rim (polished mahogany wood) with enhanced 3D depth and material detail
-        with self.canvas:
-            # Enhanced shadow cast by wheel rim onto background (creates depth)
-            Color(0, 0, 0, 0.25)  # Soft shadow
-            Ellipse(pos=(center_x - radius + 2, center_y - radius - 2),
-                   size=(radius * 2, radius * 2))
-            
-            # Secondary shadow for more depth
-            Color(0, 0, 0, 0.15)  # Lighter shadow
-            Ellipse(pos=(center_x - radius + 4, center_y - radius - 4),
-                   size=(radius * 2, radius * 2))
-
-            # Base wood layer - recessed effect with shadow
-            Color(0.1, 0.05, 0.02, 1)  # Very dark shadow base
-            Ellipse(pos=(center_x - radius + 1, center_y - radius + 1),
-                   size=(radius * 2, radius * 2))
-            
-            # Base wood layer - recessed effect
-            Color(0.18, 0.09, 0.04, 1)  # Darker mahogany base
-            Ellipse(pos=(center_x - radius, center_y - radius),
-                   size=(radius * 2, radius * 2))
-
-            # Main wood surface - raised with texture
-            Color(0.22, 0.12, 0.06, 1)  # Rich mahogany
-            Ellipse(pos=(center_x - radius + 2, center_y - radius + 2),
-                   size=(radius * 2 - 4, radius * 2 - 4))
-
-            # Enhanced wood grain rings for realistic texture
-            for grain_ring in [radius, radius * 0.98, radius * 0.96, radius * 0.94]:
-                Color(0.28, 0.16, 0.08, 1)  # Medium mahogany grain
-                Line(circle=(center_x, center_y, grain_ring), width=2)
-            
-            # Additional wood grain detail - radial lines for realistic wood texture
-            for i in range(0, 360, 15):  # Every 15 degrees
-                grain_angle = math.radians(i)
-                grain_start = radius * 0.92
-                grain_end = radius * 0.98
-                x1 = center_x + math.cos(grain_angle) * grain_start
-                y1 = center_y + math.sin(grain_angle) * grain_start
-                x2 = center_x + math.cos(grain_angle) * grain_end
-                y2 = center_y + math.sin(grain_angle) * grain_end
-                Color(0.25, 0.14, 0.07, 0.6)  # Subtle grain lines
-                Line(points=[x1, y1, x2, y2], width=1)
-
-            # Inner shadow for depth
-            Color(0.15, 0.08, 0.04, 0.7)  # Inner shadow
-            Ellipse(pos=(center_x - pocket_outer - 2, center_y - pocket_outer - 2),
-                   size=(pocket_outer * 2 + 4, pocket_outer * 2 + 4))
-
-            # Wood highlights and grain for raised effect
-            Color(0.38, 0.22, 0.10, 1)  # Light mahogany highlights
-            Line(circle=(center_x, center_y, radius - 1), width=2)
-            Line(circle=(center_x, center_y, radius * 0.96), width=1)
-
-            # Polished wood shine with 3D effect
-            Color(0.5, 0.3, 0.15, 0.8)  # Warm highlight
-            Line(circle=(center_x, center_y, radius - 0.5), width=1)
-
-            # Top surface highlight for 3D raised effect
-            Color(0.6, 0.4, 0.2, 0.4)  # Bright surface highlight
-            Ellipse(pos=(center_x - radius + 3, center_y - radius + 3),
-                   size=(radius * 1.5, radius * 1.5))
-            
-            # Metallic rim detail - polished brass edge
-            Color(0.7, 0.55, 0.25, 1)  # Polished brass
-            Line(circle=(center_x, center_y, radius), width=2)
-            Color(0.9, 0.75, 0.35, 1)  # Bright brass highlight
-            Line(circle=(center_x, center_y, radius - 0.5), width=1)
-        
-        # Draw inner center circle with enhanced wood inlay and 3D depth
-        with self.canvas:
-            # Enhanced center hub shadow with multiple layers for depth
-            # Outer shadow (softer)
-            Color(0, 0, 0, 0.3)  # Soft outer shadow
-            Ellipse(pos=(center_x - inner_radius + 5, center_y - inner_radius + 5),
-                   size=(inner_radius * 2, inner_radius * 2))
-            
-            # Middle shadow
-            Color(0, 0, 0, 0.45)  # Medium shadow
-            Ellipse(pos=(center_x - inner_radius + 4, center_y - inner_radius + 4),
-                   size=(inner_radius * 2, inner_radius * 2))
-            
-            # Center hub shadow for depth
-            Color(0, 0, 0, 0.6)  # Deep shadow
-            Ellipse(pos=(center_x - inner_radius + 3, center_y - inner_radius + 3),
-                   size=(inner_radius * 2, inner_radius * 2))
-
-            # Dark wood center - recessed
-            Color(0.12, 0.06, 0.03, 1)  # Very dark mahogany base
-            Ellipse(pos=(center_x - inner_radius, center_y - inner_radius),
-                   size=(inner_radius * 2, inner_radius * 2))
-
-            # Main center surface - raised
-            Color(0.18, 0.09, 0.05, 1)  # Very dark mahogany
-            Ellipse(pos=(center_x - inner_radius + 1, center_y - inner_radius + 1),
-                   size=(inner_radius * 2 - 2, inner_radius * 2 - 2))
-
-            # Enhanced decorative wood inlay with multiple rings
-            for inlay_radius in [inner_radius, inner_radius * 0.9, inner_radius * 0.8, inner_radius * 0.7]:
-                Color(0.25, 0.12, 0.06, 1)  # Medium mahogany for inlay base
-                Line(circle=(center_x, center_y, inlay_radius), width=2)
-                Color(0.35, 0.18, 0.08, 0.6)  # Light mahogany highlight
-                Line(circle=(center_x, center_y, inlay_radius - 0.5), width=1)
-
-            # Radial inlay details for decorative effect
-            for i in range(0, 360, 30):  # Every 30 degrees
-                inlay_angle = math.radians(i)
-                inlay_start = inner_radius * 0.65
-                inlay_end = inner_radius * 0.95
-                x1 = center_x + math.cos(inlay_angle) * inlay_start
-                y1 = center_y + math.sin(inlay_angle) * inlay_start
-                x2 = center_x + math.cos(inlay_angle) * inlay_end
-                y2 = center_y + math.sin(inlay_angle) * inlay_end
-                Color(0.3, 0.15, 0.07, 0.7)  # Decorative radial lines
-                Line(points=[x1, y1, x2, y2], width=1.5)
-
-            # Center hub detail - deeply recessed with metallic accent
-            Color(0.08, 0.04, 0.02, 1)  # Very dark hub base
-            Ellipse(pos=(center_x - inner_radius * 0.3, center_y - inner_radius * 0.3),
-                   size=(inner_radius * 0.6, inner_radius * 0.6))
-
-            # Hub surface - polished wood
-            Color(0.4, 0.2, 0.08, 1)  # Lighter wood hub
-            Ellipse(pos=(center_x - inner_radius * 0.25, center_y - inner_radius * 0.25),
-                   size=(inner_radius * 0.5, inner_radius * 0.5))
+        if self.body_shader is not None:
+            self._begin_layer('bumper')  # The whole static body is one shaded quad
+            self.body_shader.draw(self.canvas, center_x, center_y, radius, bumper_outer, bumper_inner,
+                                  pocket_outer, inner_radius, quality)
+        else:
+            self.draw_body(center_x, center_y, radius, bumper_outer, bumper_inner, pocket_outer, inner_radius)
 
-            # Hub decorative ring
-            Color(0.5, 0.3, 0.12, 1)  # Medium wood ring
-            Line(circle=(center_x, center_y, inner_radius * 0.25), width=2)
-            
-            # Hub highlight for 3D effect
-            Color(0.6, 0.35, 0.15, 0.6)  # Bright hub highlight
-            Ellipse(pos=(center_x - inner_radius * 0.2, center_y - inner_radius * 0.2),
-                   size=(inner_radius * 0.3, inner_radius * 0.3))
-            
-            # Hub center - metallic accent
-            Color(0.7, 0.55, 0.25, 1)  # Polished brass center
-            Ellipse(pos=(center_x - inner_radius * 0.1, center_y - inner_radius * 0.1),
-                   size=(inner_radius * 0.2, inner_radius * 0.2))
-            
-            # Hub center highlight
-            Color(0.9, 0.75, 0.35, 0.8)  # Bright brass highlight
-            Ellipse(pos=(center_x - inner_radius * 0.08, center_y - inner_radius * 0.08),
-                   size=(inner_radius * 0.16, inner_radius * 0.16))
-        
+        self._begin_layer('pockets')
         # Draw pockets with rotation
+        # As few arc segments as keep the outermost (shadow) edge within the tier's pixel error
+        segments = arc_segments(pocket_outer + 2, self.angle_per_pocket, quality.arc_error)
+        passes = quality.pocket_passes
         with self.canvas:
             PushMatrix()
             Rotate(angle=math.degrees(self.angle), origin=(center_x, center_y))
@@ -654,68 +323,70 @@ class RouletteWheel(Widget):
                 
                 # Draw pocket depth effects with enhanced shadows
                 # Deep pocket shadow for recessed effect
-                Color(0, 0, 0, 0.5)  # Stronger shadow for depth
-                segments = 12
-                for j in range(segments):
-                    a1 = angle_start + (angle_end - angle_start) * (j / segments)
-                    a2 = angle_start + (angle_end - angle_start) * ((j + 1) / segments)
-
-                    # Shadow points (more offset for deeper shadow)
-                    x1_outer_shadow = center_x + math.cos(a1) * (pocket_outer + 2) + 2
-                    y1_outer_shadow = center_y + math.sin(a1) * (pocket_outer + 2) + 2
-                    x2_outer_shadow = center_x + math.cos(a2) * (pocket_outer + 2) + 2
-                    y2_outer_shadow = center_y + math.sin(a2) * (pocket_outer + 2) + 2
-
-                    x1_inner_shadow = center_x + math.cos(a1) * (pocket_inner + 2) + 2
-                    y1_inner_shadow = center_y + math.sin(a1) * (pocket_inner + 2) + 2
-                    x2_inner_shadow = center_x + math.cos(a2) * (pocket_inner + 2) + 2
-                    y2_inner_shadow = center_y + math.sin(a2) * (pocket_inner + 2) + 2
-
-                    Triangle(points=[x1_outer_shadow, y1_outer_shadow, x2_outer_shadow, y2_outer_shadow, x1_inner_shadow, y1_inner_shadow])
-                    Triangle(points=[x2_outer_shadow, y2_outer_shadow, x2_inner_shadow, y2_inner_shadow, x1_inner_shadow, y1_inner_shadow])
+                if passes >= 4:
+                    Color(0, 0, 0, 0.5)  # Stronger shadow for depth
+                    for j in range(segments):
+                        a1 = angle_start + (angle_end - angle_start) * (j / segments)
+                        a2 = angle_start + (angle_end - angle_start) * ((j + 1) / segments)
+
+                        # Shadow points (more offset for deeper shadow)
+                        x1_outer_shadow = center_x + math.cos(a1) * (pocket_outer + 2) + 2
+                        y1_outer_shadow = center_y + math.sin(a1) * (pocket_outer + 2) + 2
+                        x2_outer_shadow = center_x + math.cos(a2) * (pocket_outer + 2) + 2
+                        y2_outer_shadow = center_y + math.sin(a2) * (pocket_outer + 2) + 2
+
+                        x1_inner_shadow = center_x + math.cos(a1) * (pocket_inner + 2) + 2
+                        y1_inner_shadow = center_y + math.sin(a1) * (pocket_inner + 2) + 2
+                        x2_inner_shadow = center_x + math.cos(a2) * (pocket_inner + 2) + 2
+                        y2_inner_shadow = center_y + math.sin(a2) * (pocket_inner + 2) + 2
+
+                        Triangle(points=[x1_outer_shadow, y1_outer_shadow, x2_outer_shadow, y2_outer_shadow, x1_inner_shadow, y1_inner_shadow])
+                        Triangle(points=[x2_outer_shadow, y2_outer_shadow, x2_inner_shadow, y2_inner_shadow, x1_inner_shadow, y1_inner_shadow])
                 
                 # Additional inner shadow for deeper recessed effect
-                Color(0, 0, 0, 0.4)  # Inner shadow
-                for j in range(segments):
-                    a1 = angle_start + (angle_end - angle_start) * (j / segments)
-                    a2 = angle_start + (angle_end - angle_start) * ((j + 1) / segments)
-
-                    # Inner shadow points
-                    x1_inner = center_x + math.cos(a1) * pocket_inner
-                    y1_inner = center_y + math.sin(a1) * pocket_inner
-                    x2_inner = center_x + math.cos(a2) * pocket_inner
-                    y2_inner = center_y + math.sin(a2) * pocket_inner
-                    x1_center = center_x + math.cos(a1) * (pocket_inner * 0.85)
-                    y1_center = center_y + math.sin(a1) * (pocket_inner * 0.85)
-                    x2_center = center_x + math.cos(a2) * (pocket_inner * 0.85)
-                    y2_center = center_y + math.sin(a2) * (pocket_inner * 0.85)
-
-                    Triangle(points=[x1_inner, y1_inner, x2_inner, y2_inner, x1_center, y1_center])
-                    Triangle(points=[x2_inner, y2_inner, x2_center, y2_center, x1_center, y1_center])
+                if passes >= 3:
+                    Color(0, 0, 0, 0.4)  # Inner shadow
+                    for j in range(segments):
+                        a1 = angle_start + (angle_end - angle_start) * (j / segments)
+                        a2 = angle_start + (angle_end - angle_start) * ((j + 1) / segments)
+
+                        # Inner shadow points
+                        x1_inner = center_x + math.cos(a1) * pocket_inner
+                        y1_inner = center_y + math.sin(a1) * pocket_inner
+                        x2_inner = center_x + math.cos(a2) * pocket_inner
+                        y2_inner = center_y + math.sin(a2) * pocket_inner
+                        x1_center = center_x + math.cos(a1) * (pocket_inner * 0.85)
+                        y1_center = center_y + math.sin(a1) * (pocket_inner * 0.85)
+                        x2_center = center_x + math.cos(a2) * (pocket_inner * 0.85)
+                        y2_center = center_y + math.sin(a2) * (pocket_inner * 0.85)
+
+                        Triangle(points=[x1_inner, y1_inner, x2_inner, y2_inner, x1_center, y1_center])
+                        Triangle(points=[x2_inner, y2_inner, x2_center, y2_center, x1_center, y1_center])
 
                 # Draw pocket filled segment using multiple small rectangles with depth
                 # Base pocket color (slightly darker for depth)
-                base_color = [max(0, c * 0.8) for c in color]
-                Color(*base_color, 0.95)
-                for j in range(segments):
-                    a1 = angle_start + (angle_end - angle_start) * (j / segments)
-                    a2 = angle_start + (angle_end - angle_start) * ((j + 1) / segments)
-
-                    # Outer points
-                    x1_outer = center_x + math.cos(a1) * pocket_outer
-                    y1_outer = center_y + math.sin(a1) * pocket_outer
-                    x2_outer = center_x + math.cos(a2) * pocket_outer
-                    y2_outer = center_y + math.sin(a2) * pocket_outer
-
-                    # Inner points
-                    x1_inner = center_x + math.cos(a1) * pocket_inner
-                    y1_inner = center_y + math.sin(a1) * pocket_inner
-                    x2_inner = center_x + math.cos(a2) * pocket_inner
-                    y2_inner = center_y + math.sin(a2) * pocket_inner
-
-                    # Draw as quad using two triangles
-                    Triangle(points=[x1_outer, y1_outer, x2_outer, y2_outer, x1_inner, y1_inner])
-                    Triangle(points=[x2_outer, y2_outer, x2_inner, y2_inner, x1_inner, y1_inner])
+                if passes >= 2:
+                    base_color = [max(0, c * 0.8) for c in color]
+                    Color(*base_color, 0.95)
+                    for j in range(segments):
+                        a1 = angle_start + (angle_end - angle_start) * (j / segments)
+                        a2 = angle_start + (angle_end - angle_start) * ((j + 1) / segments)
+
+                        # Outer points
+                        x1_outer = center_x + math.cos(a1) * pocket_outer
+                        y1_outer = center_y + math.sin(a1) * pocket_outer
+                        x2_outer = center_x + math.cos(a2) * pocket_outer
+                        y2_outer = center_y + math.sin(a2) * pocket_outer
+
+                        # Inner points
+                        x1_inner = center_x + math.cos(a1) * pocket_inner
+                        y1_inner = center_y + math.sin(a1) * pocket_inner
+                        x2_inner = center_x + math.cos(a2) * pocket_inner
+                        y2_inner = center_y + math.sin(a2) * pocket_inner
+
+                        # Draw as quad using two triangles
+                        Triangle(points=[x1_outer, y1_outer, x2_outer, y2_outer, x1_inner, y1_inner])
+                        Triangle(points=[x2_outer, y2_outer, x2_inner, y2_inner, x1_inner, y1_inner])
 
                 # Main pocket surface with slight highlight
                 Color(*color, 0.98)
@@ -745,10 +416,11 @@ class RouletteWheel(Widget):
                 y2 = center_y + math.sin(angle_start) * pocket_inner
                 
                 # Divider shadow for depth
-                Color(0.4, 0.3, 0.1, 0.6)  # Dark shadow
-                shadow_offset = 1
-                Line(points=[x1 + shadow_offset, y1 + shadow_offset, 
-                            x2 + shadow_offset, y2 + shadow_offset], width=4)
+                if shadows >= 1:
+                    Color(0.4, 0.3, 0.1, 0.6)  # Dark shadow
+                    shadow_offset = 1
+                    Line(points=[x1 + shadow_offset, y1 + shadow_offset, 
+                                x2 + shadow_offset, y2 + shadow_offset], width=4)
                 
                 # Main gold divider base
                 Color(0.7, 0.55, 0.15, 1)  # Darker gold base
@@ -759,18 +431,21 @@ class RouletteWheel(Widget):
                 Line(points=[x1, y1, x2, y2], width=3)
 
                 # Gold highlight - metallic shine
-                Color(1.0, 0.9, 0.4, 1)  # Light gold highlight
-                Line(points=[x1, y1, x2, y2], width=1.5)
+                if highlights >= 1:
+                    Color(1.0, 0.9, 0.4, 1)  # Light gold highlight
+                    Line(points=[x1, y1, x2, y2], width=1.5)
                 
                 # Bright metallic edge
-                Color(1.0, 0.95, 0.5, 1)  # Very bright gold edge
-                Line(points=[x1, y1, x2, y2], width=0.5)
+                if highlights >= 2:
+                    Color(1.0, 0.95, 0.5, 1)  # Very bright gold edge
+                    Line(points=[x1, y1, x2, y2], width=0.5)
 
                 # Metallic shadow for 3D effect
-                Color(0.6, 0.45, 0.1, 0.8)  # Darker gold shadow
-                offset_x = math.cos(angle_start + math.pi/2) * 0.5
-                offset_y = math.sin(angle_start + math.pi/2) * 0.5
-                Line(points=[x1 + offset_x, y1 + offset_y, x2 + offset_x, y2 + offset_y], width=1)
+                if highlights >= 3:
+                    Color(0.6, 0.45, 0.1, 0.8)  # Darker gold shadow
+                    offset_x = math.cos(angle_start + math.pi/2) * 0.5
+                    offset_y = math.sin(angle_start + math.pi/2) * 0.5
+                    Line(points=[x1 + offset_x, y1 + offset_y, x2 + offset_x, y2 + offset_y], width=1)
                 
                 # Draw number on pocket
                 number_angle = angle
@@ -778,24 +453,28 @@ class RouletteWheel(Widget):
                 number_x = center_x + math.cos(number_angle) * number_radius
                 number_y = center_y + math.sin(number_angle) * number_radius
                 
-                # Create text label for number
-                text_label = CoreLabel(text=str(number), font_size=int(14 * FONT_SCALE), 
-                                     color=(1, 1, 1, 1) if number != 0 else (1, 1, 0.5, 1))
-                text_label.refresh()
-                text_texture = text_label.texture
-                
+                # Number text from the pre-baked atlas, rasterised here only if it has not been baked
+                text_texture = self.sprites.texture(f'num_{number}') if self.sprites else None
+                if text_texture is not None:
+                    text_size = self.sprites.draw_size(text_texture, FONT_SCALE)
+                else:
+                    text_texture = TEXT_CACHE.texture(str(number), int(14 * FONT_SCALE),
+                                                      color=(1, 1, 1, 1) if number != 0 else (1, 1, 0.5, 1))
+                    text_size = text_texture.size
+
                 # Draw number background circle
                 Color(0.2, 0.2, 0.2, 0.8)  # Dark background
                 Ellipse(pos=(number_x - 12, number_y - 12), size=(24, 24))
                 
                 # Draw number text
                 Color(1, 1, 1, 1)
-                Rectangle(texture=text_texture, 
-                         pos=(number_x - text_texture.width/2, number_y - text_texture.height/2),
-                         size=text_texture.size)
+                Rectangle(texture=text_texture,
+                         pos=(number_x - text_size[0]/2, number_y - text_size[1]/2),
+                         size=text_size)
             
             PopMatrix()
         
+        self._begin_layer('ball')
         # Draw ball with realistic appearance
         if self.ball_active or self.ball_settled:
             # Calculate ball size (larger on mobile)
@@ -841,47 +520,55 @@ class RouletteWheel(Widget):
                 ball_x = center_x + math.cos(ball_angle) * ball_track_radius
                 ball_y = center_y + math.sin(ball_angle) * ball_track_radius
                 
-                # Enhanced ball shadow with multiple layers for depth
-                # Outer shadow (softer, larger)
-                Color(0, 0, 0, 0.25)
-                Ellipse(pos=(ball_x - ball_size/2 + 5, ball_y - ball_size/2 - 3),
-                        size=(ball_size + 4, ball_size + 4))
+                ball_texture = self.sprites.texture('ball') if self.sprites else None
+                if ball_texture is not None:
+                    # Pre-baked ball with its shadows in one quad
+                    w, h = self.sprites.draw_size(ball_texture, ball_size / BALL_BASE_SIZE)
+                    Color(1, 1, 1, 1)
+                    Rectangle(texture=ball_texture, pos=(ball_x - w / 2, ball_y - h / 2), size=(w, h))
+                else:
+                    # Enhanced ball shadow with multiple layers for depth
+                    # Outer shadow (softer, larger)
+                    Color(0, 0, 0, 0.25)
+                    Ellipse(pos=(ball_x - ball_size/2 + 5, ball_y - ball_size/2 - 3),
+                            size=(ball_size + 4, ball_size + 4))
                 
-                # Middle shadow
-                Color(0, 0, 0, 0.35)
-                Ellipse(pos=(ball_x - ball_size/2 + 4, ball_y - ball_size/2 - 2),
-                        size=(ball_size + 2, ball_size + 2))
+                    # Middle shadow
+                    Color(0, 0, 0, 0.35)
+                    Ellipse(pos=(ball_x - ball_size/2 + 4, ball_y - ball_size/2 - 2),
+                            size=(ball_size + 2, ball_size + 2))
                 
-                # Main shadow (more realistic)
-                Color(0, 0, 0, 0.5)
-                Ellipse(pos=(ball_x - ball_size/2 + 3, ball_y - ball_size/2 - 1),
-                        size=(ball_size, ball_size))
-
-                # Ball base (warm ivory)
-                Color(0.95, 0.92, 0.85, 1)  # Warm ivory base
-                Ellipse(pos=(ball_x - ball_size/2, ball_y - ball_size/2),
-                       size=(ball_size, ball_size))
-
-                # Ball main body (polished ivory)
-                Color(0.98, 0.96, 0.92, 1)  # Polished ivory
-                Ellipse(pos=(ball_x - ball_size/2 + 0.5, ball_y - ball_size/2 + 0.5),
-                       size=(ball_size - 1, ball_size - 1))
-
-                # Primary highlight (top-left)
-                Color(1.0, 1.0, 1.0, 0.8)
-                Ellipse(pos=(ball_x - ball_size/3, ball_y - ball_size/4),
-                       size=(ball_size/3, ball_size/3))
-
-                # Secondary highlight (brighter spot)
-                Color(1.0, 1.0, 1.0, 0.9)
-                Ellipse(pos=(ball_x - ball_size/4, ball_y - ball_size/6),
-                       size=(ball_size/6, ball_size/6))
-
-                # Subtle shadow on the bottom
-                Color(0.8, 0.75, 0.7, 0.3)
-                Ellipse(pos=(ball_x - ball_size/4, ball_y + ball_size/6),
-                       size=(ball_size/4, ball_size/4))
-        
+                    # Main shadow (more realistic)
+                    Color(0, 0, 0, 0.5)
+                    Ellipse(pos=(ball_x - ball_size/2 + 3, ball_y - ball_size/2 - 1),
+                            size=(ball_size, ball_size))
+
+                    # Ball base (warm ivory)
+                    Color(0.95, 0.92, 0.85, 1)  # Warm ivory base
+                    Ellipse(pos=(ball_x - ball_size/2, ball_y - ball_size/2),
+                           size=(ball_size, ball_size))
+
+                    # Ball main body (polished ivory)
+                    Color(0.98, 0.96, 0.92, 1)  # Polished ivory
+                    Ellipse(pos=(ball_x - ball_size/2 + 0.5, ball_y - ball_size/2 + 0.5),
+                           size=(ball_size - 1, ball_size - 1))
+
+                    # Primary highlight (top-left)
+                    Color(1.0, 1.0, 1.0, 0.8)
+                    Ellipse(pos=(ball_x - ball_size/3, ball_y - ball_size/4),
+                           size=(ball_size/3, ball_size/3))
+
+                    # Secondary highlight (brighter spot)
+                    Color(1.0, 1.0, 1.0, 0.9)
+                    Ellipse(pos=(ball_x - ball_size/4, ball_y - ball_size/6),
+                           size=(ball_size/6, ball_size/6))
+
+                    # Subtle shadow on the bottom
+                    Color(0.8, 0.75, 0.7, 0.3)
+                    Ellipse(pos=(ball_x - ball_size/4, ball_y + ball_size/6),
+                           size=(ball_size/4, ball_size/4))
+
+        self._begin_layer('dolly')
         # Draw center dolly (decorative marker/pointer) with enhanced 3D detail
         with self.canvas:
             dolly_base_radius = inner_radius * 0.15  # Base circle size
@@ -890,19 +577,22 @@ class RouletteWheel(Widget):
             
             # Enhanced dolly base shadow with multiple layers for depth
             # Outer shadow (softer)
-            Color(0, 0, 0, 0.3)
-            Ellipse(pos=(center_x - dolly_base_radius - 3, center_y - dolly_base_radius - 3),
-                   size=(dolly_base_radius * 2 + 6, dolly_base_radius * 2 + 6))
+            if shadows >= 3:
+                Color(0, 0, 0, 0.3)
+                Ellipse(pos=(center_x - dolly_base_radius - 3, center_y - dolly_base_radius - 3),
+                       size=(dolly_base_radius * 2 + 6, dolly_base_radius * 2 + 6))
             
             # Middle shadow
-            Color(0, 0, 0, 0.4)
-            Ellipse(pos=(center_x - dolly_base_radius - 2.5, center_y - dolly_base_radius - 2.5),
-                   size=(dolly_base_radius * 2 + 5, dolly_base_radius * 2 + 5))
+            if shadows >= 2:
+                Color(0, 0, 0, 0.4)
+                Ellipse(pos=(center_x - dolly_base_radius - 2.5, center_y - dolly_base_radius - 2.5),
+                       size=(dolly_base_radius * 2 + 5, dolly_base_radius * 2 + 5))
             
             # Dolly base shadow for depth
-            Color(0, 0, 0, 0.5)
-            Ellipse(pos=(center_x - dolly_base_radius - 2, center_y - dolly_base_radius - 2),
-                   size=(dolly_base_radius * 2 + 4, dolly_base_radius * 2 + 4))
+            if shadows >= 1:
+                Color(0, 0, 0, 0.5)
+                Ellipse(pos=(center_x - dolly_base_radius - 2, center_y - dolly_base_radius - 2),
+                       size=(dolly_base_radius * 2 + 4, dolly_base_radius * 2 + 4))
             
             # Dolly base - polished brass/metal base
             Color(0.6, 0.45, 0.2, 1)  # Dark brass base
@@ -964,60 +654,301 @@ class RouletteWheel(Widget):
             ]
             Triangle(points=shadow_points)
             
-            # Pointer base (darker metal)
-            Color(0.65, 0.5, 0.18, 1)  # Dark brass
-            pointer_base_points = [
-                center_x, center_y + dolly_base_radius,
-                center_x - pointer_width/2, center_y + dolly_base_radius + dolly_pointer_length,
-                center_x + pointer_width/2, center_y + dolly_base_radius + dolly_pointer_length
-            ]
-            Triangle(points=pointer_base_points)
+            # Pointer base (darker metal)
+            Color(0.65, 0.5, 0.18, 1)  # Dark brass
+            pointer_base_points = [
+                center_x, center_y + dolly_base_radius,
+                center_x - pointer_width/2, center_y + dolly_base_radius + dolly_pointer_length,
+                center_x + pointer_width/2, center_y + dolly_base_radius + dolly_pointer_length
+            ]
+            Triangle(points=pointer_base_points)
+            
+            # Main pointer body (polished brass)
+            Color(0.85, 0.65, 0.25, 1)  # Bright brass
+            pointer_points = [
+                center_x, center_y + dolly_base_radius + 1,
+                center_x - pointer_width/2 * 0.9, center_y + dolly_base_radius + dolly_pointer_length - 2,
+                center_x + pointer_width/2 * 0.9, center_y + dolly_base_radius + dolly_pointer_length - 2
+            ]
+            Triangle(points=pointer_points)
+            
+            # Pointer highlight - metallic shine
+            Color(0.95, 0.8, 0.35, 1)  # Very bright brass
+            highlight_points = [
+                center_x, center_y + dolly_base_radius + 2,
+                center_x - pointer_width/4, center_y + dolly_base_radius + dolly_pointer_length * 0.6,
+                center_x + pointer_width/4, center_y + dolly_base_radius + dolly_pointer_length * 0.6
+            ]
+            Triangle(points=highlight_points)
+            
+            # Pointer tip - sharp gold tip
+            Color(1.0, 0.9, 0.2, 1)  # Gold tip
+            tip_points = [
+                center_x, center_y + dolly_base_radius + dolly_pointer_length - 1,
+                center_x - pointer_width/6, center_y + dolly_base_radius + dolly_pointer_length - 3,
+                center_x + pointer_width/6, center_y + dolly_base_radius + dolly_pointer_length - 3
+            ]
+            Triangle(points=tip_points)
+            
+            # Bright tip highlight
+            Color(1.0, 1.0, 0.5, 0.9)  # Very bright tip
+            bright_tip_points = [
+                center_x, center_y + dolly_base_radius + dolly_pointer_length - 0.5,
+                center_x - pointer_width/8, center_y + dolly_base_radius + dolly_pointer_length - 2,
+                center_x + pointer_width/8, center_y + dolly_base_radius + dolly_pointer_length - 2
+            ]
+            Triangle(points=bright_tip_points)
+            
+            # Decorative side details on pointer
+            Color(0.7, 0.55, 0.2, 0.8)  # Side accent
+            for side_offset in [-pointer_width/3, pointer_width/3]:
+                side_points = [
+                    center_x + side_offset, center_y + dolly_base_radius + dolly_pointer_length * 0.3,
+                    center_x + side_offset * 0.7, center_y + dolly_base_radius + dolly_pointer_length * 0.5,
+                    center_x + side_offset * 0.7, center_y + dolly_base_radius + dolly_pointer_length * 0.7
+                ]
+                Line(points=side_points, width=1.5)
+
+    def draw_body(self, center_x, center_y, radius, bumper_outer, bumper_inner, pocket_outer, inner_radius):
+        """Draw the static wheel body - bumper track, rim and hub - with canvas instructions"""
+        quality = self.quality
+        shadows = quality.shadow_layers
+        highlights = quality.highlight_passes
+
+        self._begin_layer('bumper')
+        # Draw outer bumper track (raised margin) with enhanced wood grain and 3D depth
+        with self.canvas:
+            # Enhanced shadow cast by bumper track onto background (creates depth)
+            if shadows >= 1:
+                Color(0, 0, 0, 0.3)  # Soft shadow
+                Ellipse(pos=(center_x - bumper_outer + 3, center_y - bumper_outer - 3),
+                       size=(bumper_outer * 2, bumper_outer * 2))
+            
+            # Secondary shadow layer for more depth
+            if shadows >= 2:
+                Color(0, 0, 0, 0.2)  # Lighter shadow
+                Ellipse(pos=(center_x - bumper_outer + 5, center_y - bumper_outer - 5),
+                       size=(bumper_outer * 2, bumper_outer * 2))
+
+            # Bumper track base (dark mahogany wood) - raised effect
+            Color(0.12, 0.06, 0.03, 1)  # Even deeper mahogany for base
+            Ellipse(pos=(center_x - bumper_outer, center_y - bumper_outer),
+                   size=(bumper_outer * 2, bumper_outer * 2))
+
+            # Main bumper surface
+            Color(0.15, 0.08, 0.04, 1)  # Deep mahogany
+            Ellipse(pos=(center_x - bumper_outer + 1, center_y - bumper_outer + 1),
+                   size=(bumper_outer * 2 - 2, bumper_outer * 2 - 2))
+
+            # Enhanced wood grain layers for realistic texture
+            grain_rings = [bumper_outer, bumper_outer * 0.99, bumper_inner + 2, (bumper_inner + 2) * 0.99]
+            for grain_radius in grain_rings[:quality.grain_rings]:
+                Color(0.25, 0.12, 0.06, 1)  # Medium mahogany
+                Line(circle=(center_x, center_y, grain_radius), width=3)
+            
+            # Additional radial wood grain for texture (every 20 degrees in the full look)
+            for i in range(0, 360 if quality.grain_spacing else 0, 20 * max(1, quality.grain_spacing)):
+                grain_angle = math.radians(i)
+                grain_start = bumper_inner + 3
+                grain_end = bumper_outer - 1
+                x1 = center_x + math.cos(grain_angle) * grain_start
+                y1 = center_y + math.sin(grain_angle) * grain_start
+                x2 = center_x + math.cos(grain_angle) * grain_end
+                y2 = center_y + math.sin(grain_angle) * grain_end
+                Color(0.22, 0.11, 0.05, 0.5)  # Subtle grain lines
+                Line(points=[x1, y1, x2, y2], width=1)
+
+            # Inner shadow for depth
+            Color(0.1, 0.05, 0.02, 0.8)  # Dark inner shadow
+            Ellipse(pos=(center_x - bumper_inner - 2, center_y - bumper_inner - 2),
+                   size=(bumper_inner * 2 + 4, bumper_inner * 2 + 4))
+
+            # Wood highlights for raised effect
+            if highlights >= 2:
+                Color(0.35, 0.18, 0.08, 1)  # Lighter mahogany highlights
+                Line(circle=(center_x, center_y, bumper_outer - 1), width=2)
+                Line(circle=(center_x, center_y, bumper_inner + 1), width=2)
+
+            # Top highlight for 3D effect
+            if highlights >= 1:
+                Color(0.45, 0.25, 0.12, 0.6)  # Bright highlight
+                Ellipse(pos=(center_x - bumper_outer + 2, center_y - bumper_outer + 2),
+                       size=(bumper_outer * 1.8, bumper_outer * 1.8))
+
+            # Enhanced metallic rim with depth and polish
+            Color(0.6, 0.5, 0.3, 1)  # Antique brass
+            Line(circle=(center_x, center_y, bumper_outer), width=2)
+            Line(circle=(center_x, center_y, bumper_inner), width=2)
+            
+            # Rim polish highlights
+            if highlights >= 2:
+                Color(0.85, 0.75, 0.45, 1)  # Bright brass highlight
+                Line(circle=(center_x, center_y, bumper_outer - 0.5), width=1)
+                Line(circle=(center_x, center_y, bumper_inner + 0.5), width=1)
+            
+            # Rim shine effect
+            if highlights >= 3:
+                Color(0.95, 0.85, 0.5, 0.6)  # Very bright shine
+                Line(circle=(center_x, center_y, bumper_outer - 1), width=0.5)
+
+        self._begin_layer('rim')
+        # Draw outer wheel rim (polished mahogany wood) with enhanced 3D depth and material detail
+        with self.canvas:
+            # Enhanced shadow cast by wheel rim onto background (creates depth)
+            if shadows >= 1:
+                Color(0, 0, 0, 0.25)  # Soft shadow
+                Ellipse(pos=(center_x - radius + 2, center_y - radius - 2),
+                       size=(radius * 2, radius * 2))
+            
+            # Secondary shadow for more depth
+            if shadows >= 2:
+                Color(0, 0, 0, 0.15)  # Lighter shadow
+                Ellipse(pos=(center_x - radius + 4, center_y - radius - 4),
+                       size=(radius * 2, radius * 2))
+
+            # Base wood layer - recessed effect with shadow
+            Color(0.1, 0.05, 0.02, 1)  # Very dark shadow base
+            Ellipse(pos=(center_x - radius + 1, center_y - radius + 1),
+                   size=(radius * 2, radius * 2))
+            
+            # Base wood layer - recessed effect
+            Color(0.18, 0.09, 0.04, 1)  # Darker mahogany base
+            Ellipse(pos=(center_x - radius, center_y - radius),
+                   size=(radius * 2, radius * 2))
+
+            # Main wood surface - raised with texture
+            Color(0.22, 0.12, 0.06, 1)  # Rich mahogany
+            Ellipse(pos=(center_x - radius + 2, center_y - radius + 2),
+                   size=(radius * 2 - 4, radius * 2 - 4))
+
+            # Enhanced wood grain rings for realistic texture
+            for grain_ring in [radius, radius * 0.98, radius * 0.96, radius * 0.94][:quality.grain_rings]:
+                Color(0.28, 0.16, 0.08, 1)  # Medium mahogany grain
+                Line(circle=(center_x, center_y, grain_ring), width=2)
+            
+            # Additional wood grain detail - radial lines for realistic wood texture (every 15 degrees)
+            for i in range(0, 360 if quality.grain_spacing else 0, 15 * max(1, quality.grain_spacing)):
+                grain_angle = math.radians(i)
+                grain_start = radius * 0.92
+                grain_end = radius * 0.98
+                x1 = center_x + math.cos(grain_angle) * grain_start
+                y1 = center_y + math.sin(grain_angle) * grain_start
+                x2 = center_x + math.cos(grain_angle) * grain_end
+                y2 = center_y + math.sin(grain_angle) * grain_end
+                Color(0.25, 0.14, 0.07, 0.6)  # Subtle grain lines
+                Line(points=[x1, y1, x2, y2], width=1)
+
+            # Inner shadow for depth
+            Color(0.15, 0.08, 0.04, 0.7)  # Inner shadow
+            Ellipse(pos=(center_x - pocket_outer - 2, center_y - pocket_outer - 2),
+                   size=(pocket_outer * 2 + 4, pocket_outer * 2 + 4))
+
+            # Wood highlights and grain for raised effect
+            if highlights >= 2:
+                Color(0.38, 0.22, 0.10, 1)  # Light mahogany highlights
+                Line(circle=(center_x, center_y, radius - 1), width=2)
+                Line(circle=(center_x, center_y, radius * 0.96), width=1)
+
+            # Polished wood shine with 3D effect
+            if highlights >= 3:
+                Color(0.5, 0.3, 0.15, 0.8)  # Warm highlight
+                Line(circle=(center_x, center_y, radius - 0.5), width=1)
+
+            # Top surface highlight for 3D raised effect
+            if highlights >= 1:
+                Color(0.6, 0.4, 0.2, 0.4)  # Bright surface highlight
+                Ellipse(pos=(center_x - radius + 3, center_y - radius + 3),
+                       size=(radius * 1.5, radius * 1.5))
+            
+            # Metallic rim detail - polished brass edge
+            Color(0.7, 0.55, 0.25, 1)  # Polished brass
+            Line(circle=(center_x, center_y, radius), width=2)
+            if highlights >= 1:
+                Color(0.9, 0.75, 0.35, 1)  # Bright brass highlight
+                Line(circle=(center_x, center_y, radius - 0.5), width=1)
+        
+        self._begin_layer('hub')
+        # Draw inner center circle with enhanced wood inlay and 3D depth
+        with self.canvas:
+            # Enhanced center hub shadow with multiple layers for depth
+            # Outer shadow (softer)
+            if shadows >= 3:
+                Color(0, 0, 0, 0.3)  # Soft outer shadow
+                Ellipse(pos=(center_x - inner_radius + 5, center_y - inner_radius + 5),
+                       size=(inner_radius * 2, inner_radius * 2))
             
-            # Main pointer body (polished brass)
-            Color(0.85, 0.65, 0.25, 1)  # Bright brass
-            pointer_points = [
-                center_x, center_y + dolly_base_radius + 1,
-                center_x - pointer_width/2 * 0.9, center_y + dolly_base_radius + dolly_pointer_length - 2,
-                center_x + pointer_width/2 * 0.9, center_y + dolly_base_radius + dolly_pointer_length - 2
-            ]
-            Triangle(points=pointer_points)
+            # Middle shadow
+            if shadows >= 2:
+                Color(0, 0, 0, 0.45)  # Medium shadow
+                Ellipse(pos=(center_x - inner_radius + 4, center_y - inner_radius + 4),
+                       size=(inner_radius * 2, inner_radius * 2))
             
-            # Pointer highlight - metallic shine
-            Color(0.95, 0.8, 0.35, 1)  # Very bright brass
-            highlight_points = [
-                center_x, center_y + dolly_base_radius + 2,
-                center_x - pointer_width/4, center_y + dolly_base_radius + dolly_pointer_length * 0.6,
-                center_x + pointer_width/4, center_y + dolly_base_radius + dolly_pointer_length * 0.6
-            ]
-            Triangle(points=highlight_points)
+            # Center hub shadow for depth
+            if shadows >= 1:
+                Color(0, 0, 0, 0.6)  # Deep shadow
+                Ellipse(pos=(center_x - inner_radius + 3, center_y - inner_radius + 3),
+                       size=(inner_radius * 2, inner_radius * 2))
+
+            # Dark wood center - recessed
+            Color(0.12, 0.06, 0.03, 1)  # Very dark mahogany base
+            Ellipse(pos=(center_x - inner_radius, center_y - inner_radius),
+                   size=(inner_radius * 2, inner_radius * 2))
+
+            # Main center surface - raised
+            Color(0.18, 0.09, 0.05, 1)  # Very dark mahogany
+            Ellipse(pos=(center_x - inner_radius + 1, center_y - inner_radius + 1),
+                   size=(inner_radius * 2 - 2, inner_radius * 2 - 2))
+
+            # Enhanced decorative wood inlay with multiple rings
+            for inlay_radius in [inner_radius, inner_radius * 0.9, inner_radius * 0.8, inner_radius * 0.7][:quality.grain_rings]:
+                Color(0.25, 0.12, 0.06, 1)  # Medium mahogany for inlay base
+                Line(circle=(center_x, center_y, inlay_radius), width=2)
+                if highlights >= 2:
+                    Color(0.35, 0.18, 0.08, 0.6)  # Light mahogany highlight
+                    Line(circle=(center_x, center_y, inlay_radius - 0.5), width=1)
+
+            # Radial inlay details for decorative effect (every 30 degrees)
+            for i in range(0, 360 if quality.grain_spacing else 0, 30 * max(1, quality.grain_spacing)):
+                inlay_angle = math.radians(i)
+                inlay_start = inner_radius * 0.65
+                inlay_end = inner_radius * 0.95
+                x1 = center_x + math.cos(inlay_angle) * inlay_start
+                y1 = center_y + math.sin(inlay_angle) * inlay_start
+                x2 = center_x + math.cos(inlay_angle) * inlay_end
+                y2 = center_y + math.sin(inlay_angle) * inlay_end
+                Color(0.3, 0.15, 0.07, 0.7)  # Decorative radial lines
+                Line(points=[x1, y1, x2, y2], width=1.5)
+
+            # Center hub detail - deeply recessed with metallic accent
+            Color(0.08, 0.04, 0.02, 1)  # Very dark hub base
+            Ellipse(pos=(center_x - inner_radius * 0.3, center_y - inner_radius * 0.3),
+                   size=(inner_radius * 0.6, inner_radius * 0.6))
+
+            # Hub surface - polished wood
+            Color(0.4, 0.2, 0.08, 1)  # Lighter wood hub
+            Ellipse(pos=(center_x - inner_radius * 0.25, center_y - inner_radius * 0.25),
+                   size=(inner_radius * 0.5, inner_radius * 0.5))
+
+            # Hub decorative ring
+            Color(0.5, 0.3, 0.12, 1)  # Medium wood ring
+            Line(circle=(center_x, center_y, inner_radius * 0.25), width=2)
             
-            # Pointer tip - sharp gold tip
-            Color(1.0, 0.9, 0.2, 1)  # Gold tip
-            tip_points = [
-                center_x, center_y + dolly_base_radius + dolly_pointer_length - 1,
-                center_x - pointer_width/6, center_y + dolly_base_radius + dolly_pointer_length - 3,
-                center_x + pointer_width/6, center_y + dolly_base_radius + dolly_pointer_length - 3
-            ]
-            Triangle(points=tip_points)
+            # Hub highlight for 3D effect
+            if highlights >= 1:
+                Color(0.6, 0.35, 0.15, 0.6)  # Bright hub highlight
+                Ellipse(pos=(center_x - inner_radius * 0.2, center_y - inner_radius * 0.2),
+                       size=(inner_radius * 0.3, inner_radius * 0.3))
             
-            # Bright tip highlight
-            Color(1.0, 1.0, 0.5, 0.9)  # Very bright tip
-            bright_tip_points = [
-                center_x, center_y + dolly_base_radius + dolly_pointer_length - 0.5,
-                center_x - pointer_width/8, center_y + dolly_base_radius + dolly_pointer_length - 2,
-                center_x + pointer_width/8, center_y + dolly_base_radius + dolly_pointer_length - 2
-            ]
-            Triangle(points=bright_tip_points)
+            # Hub center - metallic accent
+            Color(0.7, 0.55, 0.25, 1)  # Polished brass center
+            Ellipse(pos=(center_x - inner_radius * 0.1, center_y - inner_radius * 0.1),
+                   size=(inner_radius * 0.2, inner_radius * 0.2))
             
-            # Decorative side details on pointer
-            Color(0.7, 0.55, 0.2, 0.8)  # Side accent
-            for side_offset in [-pointer_width/3, pointer_width/3]:
-                side_points = [
-                    center_x + side_offset, center_y + dolly_base_radius + dolly_pointer_length * 0.3,
-                    center_x + side_offset * 0.7, center_y + dolly_base_radius + dolly_pointer_length * 0.5,
-                    center_x + side_offset * 0.7, center_y + dolly_base_radius + dolly_pointer_length * 0.7
-                ]
-                Line(points=side_points, width=1.5)
+            # Hub center highlight
+            if highlights >= 3:
+                Color(0.9, 0.75, 0.35, 0.8)  # Bright brass highlight
+                Ellipse(pos=(center_x - inner_radius * 0.08, center_y - inner_radius * 0.08),
+                       size=(inner_radius * 0.16, inner_radius * 0.16))
 
 
 
@@ -1050,10 +981,8 @@ class RouletteWheel(Widget):
                 else:
                     text_color = (0, 0, 0, 1)  # Black for black numbers
 
-                # Create and cache texture
-                label = CoreLabel(text=str(number), font_size=font_size, bold=True, color=text_color)
-                label.refresh()
-                texture = label.texture
+                # Rendered once per number and colour, then shared through the text cache
+                texture = TEXT_CACHE.texture(str(number), font_size, bold=True, color=text_color)
 
                 self.previous_numbers_textures.append({
                     'texture': texture,
@@ -1062,17 +991,15 @@ class RouletteWheel(Widget):
                 })
 
     def draw_text(self, text, x, y, font_size=16, bold=False):
-        """Draw text on the canvas using Kivy's Label rendering"""
-        label = CoreLabel(text=text, font_size=font_size, bold=bold)
-        label.refresh()
-        texture = label.texture
+        """Draw text on the canvas using Kivy's Label rendering (textures come from the shared cache)"""
+        texture = TEXT_CACHE.texture(text, font_size, bold=bold)
 
         if texture:
             # Draw the texture at the specified position
             return Rectangle(texture=texture, pos=(x, y), size=texture.size)
 
 
-class RouletteGame(BoxLayout):
+class RouletteGame(TableState, BoxLayout):
     """Main game layout"""
     
     def __init__(self, **kwargs):
@@ -1083,104 +1010,121 @@ class RouletteGame(BoxLayout):
         
         # CRITICAL: Ensure this widget fills the entire screen
         self.size_hint = (1, 1)
+
+        # The GC pause recorder starts first so collections during startup are recorded too
+        self.memory_profiler = None
+        if GC_PROFILE or TRACE_ALLOCATIONS:
+            self.memory_profiler = MemoryProfiler(trace_allocations=TRACE_ALLOCATIONS,
+                                                  sample_interval=MEMORY_REPORT_INTERVAL)
+            self.memory_profiler.install()
         
-        # Game state (must be set before create_ui)
-        self.balance = 1000
-        self.last_win = None
+        # Seeded RNG service - log the seed so rounds can be audited and replayed
+        self.rng_service = RNGService.from_environment()
+        print(f"RNG backend: {self.rng_service.backend_name}, seed: {self.rng_service.seed}")
 
         # Track previous winning numbers - initialize with 35 random numbers
-        self.previous_numbers = [random.randint(0, 36) for _ in range(35)]
+        history_rng = self.rng_service.stream('history')
+        previous_numbers = [history_rng.randint(0, 36) for _ in range(35)]
 
         # Initialize casino sounds
-        self.load_sounds()
+        self._sound_cache = None
+        with STARTUP.phase('load_sounds'):
+            self.load_sounds()
         
         # Create wheel
-        self.wheel = RouletteWheel()
+        self.texture_loader = TextureLoader()
+        self.wheel = RouletteWheel(rng=self.rng_service.stream('table-1'), textures=self.texture_loader)
         self.wheel.game = self  # Give wheel reference to game for sound access
+        with STARTUP.phase('quality'):
+            self.wheel.quality = choose_quality()
+        # A benchmarked tier is adjusted to the frame times of real spins; a configured one is kept
+        self.quality_governor = None
+        if configured_tier() not in QUALITY_PRESETS:
+            self.quality_governor = QualityGovernor(self.wheel)
 
-        # Initialize betting system
-        self.current_chip = 5
-        self.bets = {}
-        self.total_bet = 0
-        self.balance = 1000
-        
-        # Load background texture for betting table
+        # Game state (must be set before create_ui)
+        self.init_table(self.wheel, balance=1000, current_chip=5, previous_numbers=previous_numbers)
+        restored = self.restore_session()
+
+        # Record every input against the physics tick so rounds can be replayed headlessly
+        # (a restored round starts the record from its bets and spin in progress)
+        self.recorder = RoundRecorder(self.rng_service.seed, self.rng_service.backend_name,
+                                      stream='table-1', balance=self.balance, chip=self.current_chip,
+                                      state=self.snapshot() if restored else None,
+                                      draws=self.wheel.rng.draws)
+        self.record_path = os.environ.get('ROULETTE_RECORD_FILE')  # Saved after every round if set
+
+        # Background texture for the betting table (loaded at its size by create_betting_table_in_container)
         self.betting_texture = None
-        # Try multiple paths: relative (for Android) and absolute (for desktop)
-        texture_paths = [
-            'roulette_game/assets/textures/2696.jpg',
-            r'C:\Users\aminz\OneDrive\Documents\GitHub\Roullett\roulette_game\assets\textures\2696.jpg'
-        ]
-        
-        texture_path = None
-        for path in texture_paths:
-            if os.path.exists(path):
-                texture_path = path
-                break
-        
-        if texture_path:
-            try:
-                img = CoreImage(texture_path)
-                self.betting_texture = img.texture
-                print(f"✓✓✓ SUCCESS: Loaded betting table background texture from: {os.path.abspath(texture_path)}")
-                print(f"  Texture size: {self.betting_texture.size}")
-            except Exception as e:
-                print(f"✗ Failed to load texture from {texture_path}: {e}")
-        else:
-            print(f"✗✗✗ WARNING: Texture file not found in any location")
-            print("  Falling back to solid blue-gray color.")
-        self.last_bet = 0  # Track the last total bet value
-        self.last_bets = {}  # Track the last bets dictionary for rebet
 
+        # Bet amounts currently drawn on the table (update_betting_buttons only touches the difference)
+        self._shown_bets = {}
+
+        if self.memory_profiler is not None:
+            self.wheel.probes.append(self.memory_profiler)
+            Clock.schedule_interval(lambda dt: print(self.memory_profiler.report()), MEMORY_REPORT_INTERVAL)
 
-        # Store references to betting buttons for updating bet amounts
-        self.betting_buttons = {}
+        # Performance overlay, created the first time it is toggled
+        self.hud = None
+        self.tracer = None
+        if TRACE_AT_STARTUP:
+            self.start_trace()
 
-        # Create UI
-        self.create_ui()
+        # Create UI - only the wheel is built before the first frame; the betting table
+        # is built by ui_builder over the following frames (see RouletteApp._on_first_frame)
+        self.ui_ready = False
+        self.ui_builder = StagedBuilder(on_complete=self.on_ui_complete)
+        with STARTUP.phase('create_ui'):
+            self.create_ui()
 
         # Initialize previous numbers display
         self.wheel.update_previous_numbers_display()
 
         # Start update loop - Maximum FPS for ultra-smooth ball animation
-        Clock.schedule_interval(self.update, 1.0 / 480.0)  # 480 FPS for ultra-smooth animation
+        self.paused = False
+        self.resources_released = False
+        self._update_event = Clock.schedule_interval(self.update, 1.0 / 480.0)  # 480 FPS for ultra-smooth animation
 
         # Bind keyboard events
-        Window.bind(on_key_down=self.on_key_down)
+        Window.bind(on_key_down=self.on_key_down, on_memorywarning=self.on_memory_warning)
 
 
 
+    @property
+    def sound_cache(self):
+        """Generated clips are cached by generator + parameters (created on first use)"""
+        if self._sound_cache is None:
+            from sound_cache import SoundCache
+            self._sound_cache = SoundCache()
+        return self._sound_cache
+
     def load_sounds(self):
-        """Load casino sound effects - professional ball sound and coin drop sound"""
+        """Start loading casino sound effects in the background - professional ball sound and coin drop sound"""
         print("Loading professional casino sound...")
 
-        # Load the professional ball sound
-        professional_sound = SoundLoader.load('sounds/a-roulette-ball-429831.mp3')
-        if professional_sound:
-            # Use the professional sound for ball drop effect
-            self.ball_drop_sound = professional_sound
-            print("Professional ball sound loaded successfully!")
-        else:
-            print("Professional sound file not found, no sound will play.")
-            self.ball_drop_sound = None
-
-        # Load the coin drop sound for betting
-        coin_sound = SoundLoader.load('sounds/coin-dropped.mp3')
-        if coin_sound:
-            self.coin_drop_sound = coin_sound
-            print("Coin drop sound loaded successfully!")
-        else:
-            print("Coin drop sound file not found.")
-            self.coin_drop_sound = None
-
-        # Load the win sound for winning money
-        win_sound = SoundLoader.load('sounds/win-sound.mp3')
-        if win_sound:
-            self.winning_sound = win_sound
-            print("Win sound loaded successfully!")
-        else:
-            print("Win sound file not found.")
-            self.winning_sound = None
+        def report(name):
+            def on_ready(handle):
+                if handle.failed:
+                    print(f"{name} sound file not found, no sound will play.")
+                else:
+                    print(f"{name} sound loaded successfully!")
+            return on_ready
+
+        # Handles are placeholders until decoding finishes: the ball sound queues an early
+        # play() until it is ready, coin and win sounds simply skip it
+        # Compressed clips are decoded once to a PCM cache and every caller shares the loaded object
+        self.sound_bank = SoundBank(pcm_cache=PCMCache())
+        self.ball_drop_sound = self.sound_bank.request('sounds/a-roulette-ball-429831.mp3', queue_play=True,
+                                                       on_ready=report("Professional ball"))
+
+        # Coin and win sounds play through pools of preloaded voices so rapid chip taps overlap
+        # (the coin clip is ~0.5 s, so 10 voices cover 20 taps per second before stealing)
+        self.sound_effects = SoundEffects(self.sound_bank)
+        self.coin_drop_sound = self.sound_effects.add('coin', 'sounds/coin-dropped.mp3', voices=10,
+                                                      on_ready=report("Coin drop"))
+        self.winning_sound = self.sound_effects.add('win', 'sounds/win-sound.mp3', voices=2,
+                                                    on_ready=report("Win"))
+        self.sound_bank.start()
 
         # Don't use any other sounds - only the professional ball sound, win sound, and coin sound
         self.wheel_spin_sound = None
@@ -1190,32 +1134,30 @@ class RouletteGame(BoxLayout):
 
     def create_simple_sounds(self):
         """Create realistic casino sound effects programmatically"""
-        # Create sounds directory if it doesn't exist
-        os.makedirs('sounds', exist_ok=True)
-
+        from synth import WAVE_AVAILABLE
         if WAVE_AVAILABLE:
             try:
-                # Create more sophisticated casino sounds
-                self.create_wheel_spin_sound('sounds/wheel_spin.wav')
-                self.create_ball_launch_sound('sounds/ball_launch.wav')
-                self.create_ball_drop_sound('sounds/ball_drop.wav')
-                self.create_ball_settle_sound('sounds/ball_settle.wav')
-                self.create_casino_ambiance('sounds/casino_ambiance.wav')
-
-                # Reload the sounds after creating them
-                self.wheel_spin_sound = SoundLoader.load('sounds/wheel_spin.wav')
-                self.ball_launch_sound = SoundLoader.load('sounds/ball_launch.wav')
-
-                # Try to load the user's professional ball sound first
-                user_ball_sound = SoundLoader.load('sounds/a-roulette-ball-429831.mp3')
+                # Create more sophisticated casino sounds (served from the cache when unchanged)
+                wheel_spin_path = self.create_wheel_spin_sound()
+                ball_launch_path = self.create_ball_launch_sound()
+                ball_drop_path = self.create_ball_drop_sound()
+                ball_settle_path = self.create_ball_settle_sound()
+                casino_ambiance_path = self.create_casino_ambiance()
+
+                # Load the generated sounds
+                self.wheel_spin_sound = self.sound_bank.request(wheel_spin_path)
+                self.ball_launch_sound = self.sound_bank.request(ball_launch_path)
+
+                # Try to use the user's professional ball sound first (shared with load_sounds)
+                user_ball_sound = self.sound_bank.request('sounds/a-roulette-ball-429831.mp3', queue_play=True)
                 if user_ball_sound:
                     self.ball_drop_sound = user_ball_sound
                     print("Using professional ball sound effect!")
                 else:
-                    self.ball_drop_sound = SoundLoader.load('sounds/ball_drop.wav')
+                    self.ball_drop_sound = self.sound_bank.request(ball_drop_path)
 
-                self.ball_settle_sound = SoundLoader.load('sounds/ball_settle.wav')
-                self.casino_ambiance = SoundLoader.load('sounds/casino_ambiance.wav')
+                self.ball_settle_sound = self.sound_bank.request(ball_settle_path)
+                self.casino_ambiance = self.sound_bank.request(casino_ambiance_path)
 
                 if self.wheel_spin_sound and self.ball_launch_sound and self.ball_drop_sound and self.ball_settle_sound:
                     print("Realistic casino sound effects generated successfully!")
@@ -1229,227 +1171,44 @@ class RouletteGame(BoxLayout):
         print("Using system beep sounds as fallback...")
         self.create_beep_functions()
 
-    def create_beep_sound(self, filename, frequency=440, duration=0.5, volume=0.5):
-        """Create a simple beep sound programmatically"""
-        sample_rate = 44100
-        num_samples = int(sample_rate * duration)
-
-        # Create sine wave
-        samples = []
-        for i in range(num_samples):
-            # Create a fading envelope to avoid clicks
-            envelope = min(i / 1000, (num_samples - i) / 1000, 1.0)
-            sample = volume * envelope * math.sin(2 * math.pi * frequency * i / sample_rate)
-            samples.append(int(sample * 32767))
-
-        # Write WAV file
-        with wave.open(filename, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-
-            # Convert to bytes
-            for sample in samples:
-                wav_file.writeframes(struct.pack('<h', sample))
-
-    def create_wheel_spin_sound(self, filename):
-        """Create a realistic wheel spinning sound with mechanical whirring"""
-        sample_rate = 44100
-        duration = 3.0  # Longer for looping
-        num_samples = int(sample_rate * duration)
-
-        samples = []
-        for i in range(num_samples):
-            # Create a complex mechanical sound with multiple frequencies
-            t = i / sample_rate
-
-            # Base low frequency rumble
-            base_freq = 80 + 20 * math.sin(2 * math.pi * 0.5 * t)
-            base_wave = 0.3 * math.sin(2 * math.pi * base_freq * t)
-
-            # Higher frequency whirring that changes pitch
-            whir_freq = 200 + 50 * math.sin(2 * math.pi * 2 * t)
-            whir_wave = 0.2 * math.sin(2 * math.pi * whir_freq * t)
-
-            # Add some mechanical clicking/rumbling
-            click_freq = 1500 * (1 + 0.5 * math.sin(2 * math.pi * 3 * t))
-            click_wave = 0.1 * math.sin(2 * math.pi * click_freq * t) * math.exp(-t * 2)
-
-            # Combine waves with fade envelope
-            envelope = min(0.8, i / (sample_rate * 0.1))  # Quick fade in
-            envelope *= max(0.1, 1 - (i / num_samples) * 0.5)  # Slow fade out
-
-            sample = envelope * (base_wave + whir_wave + click_wave)
-            samples.append(int(sample * 32767))
-
-        # Write WAV file
-        with wave.open(filename, 'wb') as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            for sample in samples:
-                wav_file.writeframes(struct.pack('<h', sample))
-
-    def create_ball_launch_sound(self, filename):
-        """Create a realistic ball launch sound - sharp mechanical click"""
-        sample_rate = 44100
-        duration = 0.15
-        num_samples = int(sample_rate * duration)
-
-        samples = []
-        for i in range(num_samples):
-            t = i / sample_rate
-
-            # Sharp attack with metallic ring
-            attack = math.exp(-t * 50)  # Quick decay
-            metallic = 0.7 * math.sin(2 * math.pi * 2500 * t) * attack
-            click = 0.3 * (1 if i < sample_rate * 0.01 else 0)  # Sharp click
-
-            sample = metallic + click
-            samples.append(int(sample * 32767))
-
-        with wave.open(filename, 'wb') as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            for sample in samples:
-                wav_file.writeframes(struct.pack('<h', sample))
-
-    def create_ball_drop_sound(self, filename):
-        """Create a realistic ball drop sound - cascading metallic bounces"""
-        sample_rate = 44100
-        duration = 0.4
-        num_samples = int(sample_rate * duration)
-
-        samples = []
-        for i in range(num_samples):
-            t = i / sample_rate
-
-            # Multiple bouncing frequencies
-            bounce1 = 0.4 * math.sin(2 * math.pi * 800 * t) * math.exp(-t * 8)
-            bounce2 = 0.2 * math.sin(2 * math.pi * 1200 * t) * math.exp(-(t-0.1) * 12) if t > 0.1 else 0
-            bounce3 = 0.1 * math.sin(2 * math.pi * 600 * t) * math.exp(-(t-0.2) * 15) if t > 0.2 else 0
-
-            sample = bounce1 + bounce2 + bounce3
-            samples.append(int(sample * 32767))
-
-        with wave.open(filename, 'wb') as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            for sample in samples:
-                wav_file.writeframes(struct.pack('<h', sample))
-
-    def create_ball_settle_sound(self, filename):
-        """Create a realistic ball settling sound - final metallic click"""
-        sample_rate = 44100
-        duration = 0.08
-        num_samples = int(sample_rate * duration)
+    def create_beep_sound(self, frequency=440, duration=0.5, volume=0.5):
+        """Create a simple beep sound programmatically, returns the cached WAV path"""
+        return self.sound_cache.get('beep', frequency=frequency, duration=duration, volume=volume)
 
-        samples = []
-        for i in range(num_samples):
-            t = i / sample_rate
+    def create_wheel_spin_sound(self):
+        """Create a realistic wheel spinning sound with mechanical whirring"""
+        return self.sound_cache.get('wheel_spin')
 
-            # Sharp metallic ping with quick decay
-            ping = 0.8 * math.sin(2 * math.pi * 1800 * t) * math.exp(-t * 80)
-            undertone = 0.2 * math.sin(2 * math.pi * 900 * t) * math.exp(-t * 40)
+    def create_ball_launch_sound(self):
+        """Create a realistic ball launch sound - sharp mechanical click"""
+        return self.sound_cache.get('ball_launch')
 
-            sample = ping + undertone
-            samples.append(int(sample * 32767))
+    def create_ball_drop_sound(self):
+        """Create a realistic ball drop sound - cascading metallic bounces"""
+        return self.sound_cache.get('ball_drop')
 
-        with wave.open(filename, 'wb') as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            for sample in samples:
-                wav_file.writeframes(struct.pack('<h', sample))
+    def create_ball_settle_sound(self):
+        """Create a realistic ball settling sound - final metallic click"""
+        return self.sound_cache.get('ball_settle')
 
-    def create_casino_ambiance(self, filename):
+    def create_casino_ambiance(self):
         """Create subtle casino background ambiance"""
-        sample_rate = 44100
-        duration = 2.0
-        num_samples = int(sample_rate * duration)
-
-        samples = []
-        for i in range(num_samples):
-            t = i / sample_rate
-
-            # Subtle crowd murmur simulation
-            noise1 = 0.05 * math.sin(2 * math.pi * random.uniform(100, 200) * t)
-            noise2 = 0.03 * math.sin(2 * math.pi * random.uniform(150, 250) * t)
-
-            # Occasional chip sounds
-            chip_sound = 0.02 * math.sin(2 * math.pi * 800 * t) * math.exp(-(t % 0.5) * 20) if random.random() < 0.01 else 0
-
-            sample = (noise1 + noise2 + chip_sound) * 0.3
-            samples.append(int(sample * 32767))
-
-        with wave.open(filename, 'wb') as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            for sample in samples:
-                wav_file.writeframes(struct.pack('<h', sample))
+        return self.sound_cache.get('casino_ambiance')
 
     def create_winning_sound(self):
         """Create a celebratory winning sound effect"""
+        from synth import WAVE_AVAILABLE
         if not WAVE_AVAILABLE:
             print("Wave module not available, no winning sound will play.")
             self.winning_sound = None
             return
 
         try:
-            sample_rate = 44100
-            duration = 1.5
-            num_samples = int(sample_rate * duration)
-
-            samples = []
-            for i in range(num_samples):
-                t = i / sample_rate
-
-                # Create a triumphant chord with multiple frequencies
-                # Major chord: C4, E4, G4
-                freq1, freq2, freq3 = 261.63, 329.63, 392.00  # C4, E4, G4
-
-                # Create ascending arpeggio effect
-                if t < 0.5:
-                    # First note (C4)
-                    wave1 = 0.3 * math.sin(2 * math.pi * freq1 * t)
-                elif t < 1.0:
-                    # Second note (E4)
-                    wave1 = 0.3 * math.sin(2 * math.pi * freq2 * (t - 0.5))
-                else:
-                    # Third note (G4)
-                    wave1 = 0.3 * math.sin(2 * math.pi * freq3 * (t - 1.0))
-
-                # Add some sparkle with higher harmonics
-                sparkle = 0.1 * math.sin(2 * math.pi * freq3 * 2 * t) * math.exp(-t * 2)
-
-                # Add a celebratory "ta-da" ending
-                if t > 1.2:
-                    tada_freq = 523.25  # C5
-                    tada = 0.2 * math.sin(2 * math.pi * tada_freq * (t - 1.2)) * math.exp(-(t - 1.2) * 5)
-                else:
-                    tada = 0
-
-                # Combine waves with envelope
-                envelope = min(1.0, i / (sample_rate * 0.1))  # Quick attack
-                envelope *= max(0.0, 1.0 - (i / num_samples) * 0.3)  # Slow release
-
-                sample = envelope * (wave1 + sparkle + tada)
-                samples.append(int(sample * 32767))
-
-            # Write winning sound file
-            filename = 'sounds/winning_sound.wav'
-            with wave.open(filename, 'wb') as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(sample_rate)
-                for sample in samples:
-                    wav_file.writeframes(struct.pack('<h', sample))
+            # Winning sound file (resynthesised only when the generator changes)
+            filename = self.sound_cache.get('winning')
 
             # Load the sound
-            self.winning_sound = SoundLoader.load(filename)
+            self.winning_sound = self.sound_bank.request(filename)
             if self.winning_sound:
                 print("Winning sound created successfully!")
             else:
@@ -1486,8 +1245,8 @@ class RouletteGame(BoxLayout):
             def stop(self):
                 pass
 
-        # Try to load the user's professional ball sound
-        user_ball_sound = SoundLoader.load('sounds/a-roulette-ball-429831.mp3')
+        # Use the user's professional ball sound (the same loaded object as load_sounds)
+        user_ball_sound = self.sound_bank.request('sounds/a-roulette-ball-429831.mp3', queue_play=True)
 
         self.wheel_spin_sound = MockSound(lambda: system_beep(200, 1000), loop=True)
         self.ball_launch_sound = MockSound(lambda: system_beep(1000, 150))
@@ -1507,6 +1266,7 @@ class RouletteGame(BoxLayout):
         """Create an invisible overlay frame matching the roulette frame size for announcements"""
         # Create a RelativeLayout that will overlay the wheel
         # RelativeLayout has NO background by default - completely invisible/transparent
+        from kivy.uix.relativelayout import RelativeLayout
         overlay = RelativeLayout(size_hint=(1, 1))
         
         # No canvas drawing on overlay - it's completely transparent
@@ -1590,6 +1350,7 @@ class RouletteGame(BoxLayout):
         self.add_widget(betting_container_outer)
 
         # Wheel container at bottom - use FloatLayout for absolute positioning
+        from kivy.uix.floatlayout import FloatLayout
         wheel_container = FloatLayout(size_hint_y=0.6)  # Take 60% from bottom
         
         # Add wheel - it will fill the container
@@ -1606,163 +1367,47 @@ class RouletteGame(BoxLayout):
         
         self.add_widget(wheel_container)
 
-    def create_betting_table(self):
-        """Create the betting table interface"""
-        betting_container = BoxLayout(size_hint_y=0.4, orientation='vertical', spacing=3, padding=[3, 0, 3, 3])  # no top padding
+    def create_betting_table_in_container(self, container):
+        """Create a traditional European roulette betting table interface
+
+        Only the felt is created here; the info bar and the grid sections are queued
+        on ui_builder so they are built after the first frame.
+        """
+        betting_container = BoxLayout(size_hint_y=1.0, orientation='vertical', spacing=0, padding=0)
 
-        # Set blue-gray background for betting table
+        # Solid blue-gray felt until the background texture has loaded at the container's size
         with betting_container.canvas.before:
-            Color(0.15, 0.15, 0.2, 1)  # Very dark blue-gray felt
+            self.bg_color = Color(0.15, 0.15, 0.2, 1)  # Very dark blue-gray felt
             self.bg_rect = Rectangle(pos=betting_container.pos, size=betting_container.size)
 
-        # Bind the rectangle to update when container size changes
-        def update_bg(instance, value):
-            self.bg_rect.pos = instance.pos
-            self.bg_rect.size = instance.size
-
-        betting_container.bind(pos=update_bg, size=update_bg)
-
-        # Balance and bet display row
-        info_row = BoxLayout(size_hint_y=0.08, spacing=10)
-        self.balance_label = Label(text=f'BALANCE: ${self.balance}', font_size=int(12 * FONT_SCALE), color=(1,1,0.8,1),
-                                 halign='left', valign='middle')
-        self.balance_label.bind(size=self.balance_label.setter('text_size'))
-        info_row.add_widget(self.balance_label)
-
-        self.bet_label = Label(text=f'TOTAL BET: ${self.total_bet}', font_size=int(12 * FONT_SCALE), color=(1,0.8,1,1),
-                             halign='right', valign='middle')
-        self.bet_label.bind(size=self.bet_label.setter('text_size'))
-        info_row.add_widget(self.bet_label)
-
-        betting_container.add_widget(info_row)
-
-        # Chip selection row
-        chip_row = BoxLayout(size_hint_y=0.12, spacing=3)
-        chip_label = Label(text='CHIP:', font_size=int(12 * FONT_SCALE), color=(1,1,1,1), size_hint_x=0.15)
-        chip_row.add_widget(chip_label)
-
-        self.chip_buttons = []
-        chip_values = [1, 5, 10, 25, 50, 100]
-        for value in chip_values:
-            # Start with gray (will be updated by update_chip_buttons)
-            btn = Button(text=f'${value}', font_size=int(10 * FONT_SCALE), size_hint_x=1/len(chip_values),
-                        background_color=(0.5, 0.5, 0.5, 1.0), color=(1, 1, 1, 1))
-            # Prevent button from changing color when pressed - keep highlight permanent
-            btn.background_normal = ''
-            btn.background_down = ''
-            btn.bind(on_press=lambda instance, val=value: self.select_chip(val))
-            # Bind state change to restore highlight if it gets reset
-            btn.fbind('state', lambda instance, state, val=value: self._maintain_chip_highlight(instance, val))
-            self.chip_buttons.append(btn)
-            chip_row.add_widget(btn)
-
-        betting_container.add_widget(chip_row)
-
-        # Outside bets row
-        outside_row = BoxLayout(size_hint_y=0.15, spacing=2)
-
-        # Red/Black
-        red_btn = Button(text='RED', font_size=int(10 * FONT_SCALE), background_color=(0.8, 0.1, 0.1, 1), color=(1,1,1,1))
-        red_btn.bind(on_press=lambda instance: self.place_bet('red'))
-        outside_row.add_widget(red_btn)
-
-        black_btn = Button(text='BLACK', font_size=int(10 * FONT_SCALE), background_color=(0.1, 0.1, 0.1, 1), color=(1,1,1,1))
-        black_btn.bind(on_press=lambda instance: self.place_bet('black'))
-        outside_row.add_widget(black_btn)
-
-        # Even/Odd
-        even_btn = Button(text='EVEN', font_size=int(10 * FONT_SCALE), background_color=(0.4, 0.4, 0.8, 1), color=(1,1,1,1))
-        even_btn.bind(on_press=lambda instance: self.place_bet('even'))
-        outside_row.add_widget(even_btn)
-
-        odd_btn = Button(text='ODD', font_size=int(10 * FONT_SCALE), background_color=(0.4, 0.4, 0.8, 1), color=(1,1,1,1))
-        odd_btn.bind(on_press=lambda instance: self.place_bet('odd'))
-        outside_row.add_widget(odd_btn)
-
-        # High/Low
-        low_btn = Button(text='1-18', font_size=int(10 * FONT_SCALE), background_color=(0.2, 0.4, 0.8, 1), color=(1,1,1,1))  # Blue
-        low_btn.bind(on_press=lambda instance: self.place_bet('low'))
-        outside_row.add_widget(low_btn)
-
-        high_btn = Button(text='19-36', font_size=int(10 * FONT_SCALE), background_color=(0.8, 0.4, 0.2, 1), color=(1,1,1,1))  # Orange/Red
-        high_btn.bind(on_press=lambda instance: self.place_bet('high'))
-        outside_row.add_widget(high_btn)
-
-        betting_container.add_widget(outside_row)
+        requested_at = time.perf_counter()
 
-        # Dozens row
-        dozens_row = BoxLayout(size_hint_y=0.15, spacing=2)
-
-        doz1_btn = Button(text='1st 12', font_size=int(9 * FONT_SCALE), background_color=(0.6, 0.4, 0.8, 1), color=(1,1,1,1))
-        doz1_btn.bind(on_press=lambda instance: self.place_bet('dozen1'))
-        dozens_row.add_widget(doz1_btn)
-
-        doz2_btn = Button(text='2nd 12', font_size=int(9 * FONT_SCALE), background_color=(0.2, 0.7, 0.3, 1), color=(1,1,1,1))
-        doz2_btn.bind(on_press=lambda instance: self.place_bet('dozen2'))
-        dozens_row.add_widget(doz2_btn)
-
-        doz3_btn = Button(text='3rd 12', font_size=int(9 * FONT_SCALE), background_color=(0.6, 0.4, 0.8, 1), color=(1,1,1,1))
-        doz3_btn.bind(on_press=lambda instance: self.place_bet('dozen3'))
-        dozens_row.add_widget(doz3_btn)
-
-        zero_btn = Button(text='0', font_size=int(10 * FONT_SCALE), background_color=(0.0, 0.6, 0.0, 1), color=(1,1,1,1))
-        zero_btn.bind(on_press=lambda instance: self.place_bet('zero'))
-        dozens_row.add_widget(zero_btn)
-
-        betting_container.add_widget(dozens_row)
-
-        # Number grid (simplified - just a few key numbers for demo)
-        numbers_row = BoxLayout(size_hint_y=0.15, spacing=1)
-        key_numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
-
-        for num in key_numbers:
-            color = (0.8, 0.1, 0.1, 1) if num in self.wheel.RED_NUMBERS else (0.1, 0.1, 0.1, 1)
-            num_btn = Button(text=str(num), font_size=int(16 * FONT_SCALE), background_color=color, color=(1,1,1,1),
-                           size_hint_x=1/len(key_numbers))
-            num_btn.bind(on_press=lambda instance, n=num: self.place_bet(f'number_{n}'))
-            numbers_row.add_widget(num_btn)
-
-        betting_container.add_widget(numbers_row)
-
-        # Control buttons row
-        control_row = BoxLayout(size_hint_y=0.2, spacing=5)
-
-        clear_btn = Button(text='CLEAR', font_size=int(12 * FONT_SCALE), background_color=(0.6, 0.2, 0.2, 1), color=(1,1,1,1))
-        clear_btn.bind(on_press=self.clear_bets)
-        control_row.add_widget(clear_btn)
-
-        spin_btn = Button(text='SPIN', font_size=int(14 * FONT_SCALE), background_color=(0.2, 0.6, 0.2, 1), color=(1,1,1,1), bold=True)
-        spin_btn.bind(on_press=self.spin_wheel)
-        control_row.add_widget(spin_btn)
-
-        betting_container.add_widget(control_row)
-
-        self.add_widget(betting_container)
-
-        # Update chip button colors to show selection
-        self.update_chip_buttons()
-
-    def create_betting_table_in_container(self, container):
-        """Create a traditional European roulette betting table interface"""
-        betting_container = BoxLayout(size_hint_y=1.0, orientation='vertical', spacing=0, padding=0)
+        def on_texture(texture):
+            if self.betting_texture is None:
+                STARTUP.record('table_texture', requested_at)
+            self.betting_texture = texture
+            self.bg_color.rgba = (0.7, 0.7, 0.7, 1)  # Darker gray tint to darken the texture
+            self.bg_rect.texture = texture
 
-        # Set background texture or fallback to solid color for betting table
-        with betting_container.canvas.before:
-            if hasattr(self, 'betting_texture') and self.betting_texture:
-                # Use texture if available - darker tint for more subdued appearance
-                Color(0.7, 0.7, 0.7, 1)  # Darker gray tint to darken the texture
-                self.bg_rect = Rectangle(texture=self.betting_texture, pos=betting_container.pos, size=betting_container.size)
-            else:
-                # Fallback to solid blue-gray color if texture not found
-                Color(0.15, 0.15, 0.2, 1)  # Very dark blue-gray felt
-                self.bg_rect = Rectangle(pos=betting_container.pos, size=betting_container.size)
+        request_texture = Clock.create_trigger(
+            lambda dt: self.texture_loader.request(TABLE_TEXTURE, betting_container.size, on_texture), 0.1)
+        self._table_texture_trigger = request_texture  # Fired again after release_resources()
 
         def update_bg(instance, value):
             self.bg_rect.pos = instance.pos
             self.bg_rect.size = instance.size
         betting_container.bind(pos=update_bg, size=update_bg)
+        betting_container.bind(size=request_texture)
+        container.add_widget(betting_container)
 
-        # Top info bar
+        self.ui_builder.add('info_row', lambda: self.create_info_row(betting_container))
+        self.ui_builder.add('betting_grid', lambda: self.create_betting_grid(betting_container))
+        for section in BettingGrid.SECTIONS:
+            self.ui_builder.add(f'grid_{section}', lambda s=section: self.betting_grid.build_section(s))
+        self.ui_builder.add('table_state', self.update_table_state)
+
+    def create_info_row(self, betting_container):
+        """Top info bar: balance, last bet and total bet"""
         info_row = BoxLayout(size_hint_y=0.08, spacing=5, padding=[5, 2, 5, 2])
         
         # Add spacer to push balance label to the right (equivalent to 4 characters)
@@ -1796,274 +1441,82 @@ class RouletteGame(BoxLayout):
         info_row.add_widget(spacer_right)
         betting_container.add_widget(info_row)
 
-        # Chip selection
-        chip_row = BoxLayout(size_hint_y=0.08, spacing=2, padding=[5, 2, 5, 2])
-        chip_label = Label(text='CHIP:', font_size=int(20 * FONT_SCALE), color=(1,1,1,1), size_hint_x=0.12)
-        chip_row.add_widget(chip_label)
-
-        self.chip_buttons = []
-        chip_values = [1, 5, 10, 25, 50, 100]
-        for value in chip_values:
-            # Start with gray (will be updated by update_chip_buttons)
-            btn = Button(text=f'${value}', font_size=int(20 * FONT_SCALE), size_hint_x=1/len(chip_values),
-                        background_color=(0.5, 0.5, 0.5, 1.0), color=(1, 1, 1, 1))
-            # Prevent button from changing color when pressed - keep highlight permanent
-            btn.background_normal = ''
-            btn.background_down = ''
-            btn.bind(on_press=lambda instance, val=value: self.select_chip(val))
-            # Bind state change to restore highlight if it gets reset
-            btn.fbind('state', lambda instance, state, val=value: self._maintain_chip_highlight(instance, val))
-            self.chip_buttons.append(btn)
-            chip_row.add_widget(btn)
-        betting_container.add_widget(chip_row)
-
-        # Main betting table area
-        table_area = BoxLayout(size_hint_y=0.74, orientation='vertical', spacing=2, padding=[5, 2, 5, 2])
-
-        # Top row: Zero pocket + Number grid (3 rows x 12 columns)
-        top_section = BoxLayout(size_hint_y=0.7, spacing=3)
-
-        # Zero pocket (green oval at left end)
-        zero_container = BoxLayout(size_hint_x=0.08, orientation='vertical')
-        zero_btn = Button(text='0', font_size=int(20 * FONT_SCALE), background_color=(0.0, 0.6, 0.0, 1), color=(1,1,1,1),
-                         bold=True, size_hint_y=1.0)
-        zero_btn.bind(on_press=lambda instance: self.place_bet('zero'))
-        self.betting_buttons['zero'] = zero_btn
-        zero_container.add_widget(zero_btn)
-        top_section.add_widget(zero_container)
-
-        # Number grid (3 rows x 12 columns = 36 numbers)
-        numbers_container = BoxLayout(size_hint_x=0.92, orientation='vertical', spacing=2)
-
-        # Define the exact European roulette number layout
-        number_rows = [
-            [3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36],  # Top row (red: 3,9,12,18,21,27,30,36)
-            [2, 5, 8, 11, 14, 17, 20, 23, 26, 29, 32, 35],  # Middle row (red: 5,14,17,23,26,32)
-            [1, 4, 7, 10, 13, 16, 19, 22, 25, 28, 31, 34]   # Bottom row (red: 1,7,10,16,19,25,28,31,34)
-        ]
-
-        for row_nums in number_rows:
-            row_container = BoxLayout(size_hint_y=1/3, spacing=1)
-            for num in row_nums:
-                # Determine color: red or black
-                is_red = num in self.wheel.RED_NUMBERS
-                bg_color = (0.85, 0.15, 0.15, 1) if is_red else (0.15, 0.15, 0.15, 1)  # Casino red/black
-
-                num_btn = Button(text=str(num), font_size=int(18 * FONT_SCALE), background_color=bg_color,
-                               color=(1,1,1,1), bold=True, size_hint_x=1/12)
-                num_btn.bind(on_press=lambda instance, n=num: self.place_bet(f'number_{n}'))
-                self.betting_buttons[f'number_{num}'] = num_btn
-                row_container.add_widget(num_btn)
-            numbers_container.add_widget(row_container)
-
-        top_section.add_widget(numbers_container)
-        table_area.add_widget(top_section)
-
-        # Dozens row - align with number columns (1st 12 with cols 1-4, 2nd 12 with cols 5-8, 3rd 12 with cols 9-12)
-        dozens_row = BoxLayout(size_hint_y=0.15, spacing=2)
-        
-        # Empty spacer to match zero column width (0.08)
-        zero_spacer = BoxLayout(size_hint_x=0.08)
-        dozens_row.add_widget(zero_spacer)
-        
-        # Dozens container to match numbers container width (0.92)
-        dozens_container = BoxLayout(size_hint_x=0.92, spacing=2)
-
-        # 1st 12 aligns with columns 1-4 (4/12 of 0.92 = 0.3067)
-        doz1_btn = Button(text='1st 12', font_size=int(17 * FONT_SCALE), background_color=(0.2, 0.6, 0.8, 1),  # Blue
-                         color=(1,1,1,1), bold=True, size_hint_x=4/12)
-        doz1_btn.bind(on_press=lambda instance: self.place_bet('dozen1'))
-        self.betting_buttons['dozen1'] = doz1_btn
-        dozens_container.add_widget(doz1_btn)
-
-        # 2nd 12 aligns with columns 5-8 (4/12 of 0.92 = 0.3067)
-        doz2_btn = Button(text='2nd 12', font_size=int(17 * FONT_SCALE), background_color=(0.2, 0.7, 0.3, 1),  # Green
-                         color=(1,1,1,1), bold=True, size_hint_x=4/12)
-        doz2_btn.bind(on_press=lambda instance: self.place_bet('dozen2'))
-        self.betting_buttons['dozen2'] = doz2_btn
-        dozens_container.add_widget(doz2_btn)
-
-        # 3rd 12 aligns with columns 9-12 (4/12 of 0.92 = 0.3067)
-        doz3_btn = Button(text='3rd 12', font_size=int(17 * FONT_SCALE), background_color=(0.6, 0.4, 0.8, 1),  # Purple
-                         color=(1,1,1,1), bold=True, size_hint_x=4/12)
-        doz3_btn.bind(on_press=lambda instance: self.place_bet('dozen3'))
-        self.betting_buttons['dozen3'] = doz3_btn
-        dozens_container.add_widget(doz3_btn)
-        
-        dozens_row.add_widget(dozens_container)
-        table_area.add_widget(dozens_row)
-
-        # Bottom row: Six sections (each spanning 2 columns)
-        bottom_row = BoxLayout(size_hint_y=0.15, spacing=2)
-
-        # 1to18 (blue background)
-        low_btn = Button(text='1 to 18', font_size=int(16 * FONT_SCALE), background_color=(0.2, 0.4, 0.8, 1),  # Blue
-                        color=(1,1,1,1), bold=True, size_hint_x=1/6)
-        low_btn.bind(on_press=lambda instance: self.place_bet('low'))
-        self.betting_buttons['low'] = low_btn
-        bottom_row.add_widget(low_btn)
-
-        # EVEN (neutral background)
-        even_btn = Button(text='EVEN', font_size=int(16 * FONT_SCALE), background_color=(0.3, 0.3, 0.3, 1),
-                         color=(1,1,1,1), bold=True, size_hint_x=1/6)
-        even_btn.bind(on_press=lambda instance: self.place_bet('even'))
-        self.betting_buttons['even'] = even_btn
-        bottom_row.add_widget(even_btn)
-
-        # RED (red background)
-        red_btn = Button(text='RED', font_size=int(16 * FONT_SCALE), background_color=(0.8, 0.1, 0.1, 1),
-                        color=(1,1,1,1), bold=True, size_hint_x=1/6)
-        red_btn.bind(on_press=lambda instance: self.place_bet('red'))
-        self.betting_buttons['red'] = red_btn
-        bottom_row.add_widget(red_btn)
-
-        # BLACK (black background)
-        black_btn = Button(text='BLACK', font_size=int(16 * FONT_SCALE), background_color=(0.1, 0.1, 0.1, 1),
-                          color=(1,1,1,1), bold=True, size_hint_x=1/6)
-        black_btn.bind(on_press=lambda instance: self.place_bet('black'))
-        self.betting_buttons['black'] = black_btn
-        bottom_row.add_widget(black_btn)
-
-        # ODD (neutral background)
-        odd_btn = Button(text='ODD', font_size=int(16 * FONT_SCALE), background_color=(0.3, 0.3, 0.3, 1),
-                        color=(1,1,1,1), bold=True, size_hint_x=1/6)
-        odd_btn.bind(on_press=lambda instance: self.place_bet('odd'))
-        self.betting_buttons['odd'] = odd_btn
-        bottom_row.add_widget(odd_btn)
-
-        # 19to36 (orange/red background)
-        high_btn = Button(text='19 to 36', font_size=int(16 * FONT_SCALE), background_color=(0.8, 0.4, 0.2, 1),  # Orange/Red
-                         color=(1,1,1,1), bold=True, size_hint_x=1/6)
-        high_btn.bind(on_press=lambda instance: self.place_bet('high'))
-        self.betting_buttons['high'] = high_btn
-        bottom_row.add_widget(high_btn)
-
-        table_area.add_widget(bottom_row)
-        betting_container.add_widget(table_area)
-
-        # Bottom control buttons
-        control_row = BoxLayout(size_hint_y=0.1, spacing=10, padding=[10, 5, 10, 5])
-
-        clear_btn = Button(text='CLEAR BETS', font_size=int(16 * FONT_SCALE), background_color=(0.6, 0.2, 0.2, 1),
-                          color=(1,1,1,1), bold=True)
-        clear_btn.bind(on_press=self.clear_bets)
-        control_row.add_widget(clear_btn)
-
-        rebet_btn = Button(text='REBET', font_size=int(16 * FONT_SCALE), background_color=(0.4, 0.4, 0.8, 1),
-                          color=(1,1,1,1), bold=True)
-        rebet_btn.bind(on_press=self.rebet)
-        control_row.add_widget(rebet_btn)
-
-        double_btn = Button(text='2X', font_size=int(16 * FONT_SCALE), background_color=(0.2, 0.7, 0.7, 1),  # Teal/Cyan
-                          color=(1,1,1,1), bold=True)
-        double_btn.bind(on_press=self.double_bets)
-        control_row.add_widget(double_btn)
-
-        spin_btn = Button(text='SPIN', font_size=int(18 * FONT_SCALE), background_color=(0.2, 0.6, 0.2, 1),
-                         color=(1,1,1,1), bold=True)
-        spin_btn.bind(on_press=self.spin_wheel)
-        control_row.add_widget(spin_btn)
-
-        betting_container.add_widget(control_row)
-
-        container.add_widget(betting_container)
+    def create_betting_grid(self, betting_container):
+        """Chip selector, number grid, outside bets and controls are drawn by one widget
+
+        It starts empty with input disabled; its sections are added by later build steps.
+        """
+        # Looked up on every tap, not bound here, so methods wrapped later (tracing) are the ones called
+        self.betting_grid = BettingGrid(
+            actions={'bet': lambda bet_type: self.place_bet(bet_type),
+                     'chip': lambda value: self.select_chip(value),
+                     'clear': lambda: self.clear_bets(), 'rebet': lambda: self.rebet(),
+                     'double': lambda: self.double_bets(), 'spin': lambda: self.spin_wheel()},
+            sprite_sheet=self.wheel.sprites, font_scale=FONT_SCALE, build=False, size_hint_y=0.92)
+        betting_container.add_widget(self.betting_grid)
+
+    def update_table_state(self):
+        """Show the selected chip and any bets on the freshly built grid"""
         self.update_chip_buttons()
         self.update_betting_buttons()
 
+    def on_ui_complete(self):
+        """The betting table is complete - accept touches and keys"""
+        self.betting_grid.input_enabled = True
+        self.ui_ready = True
+        STARTUP.record('betting_table', self.ui_builder.started_at)
+        if GC_FREEZE:
+            # The UI lives for the whole session - stop every collection from re-scanning it
+            gc.collect()
+            gc.freeze()
+            print(f"✓ Froze {gc.get_freeze_count()} startup objects out of the garbage collector")
+        print(f"✓ Betting table built in {len(self.ui_builder.timings)} steps over {self.ui_builder.frames} frames")
+        if PROFILE_STARTUP:
+            print(STARTUP.report())
+        # Pay out a restored spin that finished while the table was being built
+        self.check_round()
+
     def get_chip_color(self, value):
         """Get casino-standard color for chip value"""
-        chip_colors = {
-            1: ((1.0, 1.0, 1.0, 1), (0, 0, 0, 1)),      # White chip, black text
-            5: ((0.8, 0.2, 0.2, 1), (1, 1, 1, 1)),       # Red chip, white text
-            10: ((0.2, 0.4, 0.8, 1), (1, 1, 1, 1)),      # Blue chip, white text
-            25: ((0.2, 0.6, 0.2, 1), (1, 1, 1, 1)),      # Green chip, white text
-            50: ((0.9, 0.7, 0.2, 1), (0, 0, 0, 1)),      # Orange/Yellow chip, black text
-            100: ((0.1, 0.1, 0.1, 1), (1, 1, 1, 1))      # Black chip, white text
-        }
-        return chip_colors.get(value, ((0.8, 0.6, 0.2, 1), (0, 0, 0, 1)))  # Default fallback
+        return self.CHIP_COLORS.get(value, self.DEFAULT_CHIP_COLOR)
 
     def select_chip(self, value):
         """Select chip value for betting"""
-        self.current_chip = value
+        self.record_input('chip', value)
+        self.apply_select_chip(value)
         self.update_chip_buttons()
-        # Schedule another update after a brief delay to ensure highlight persists
-        # This prevents Kivy button state changes from resetting the color
-        Clock.schedule_once(lambda dt: self.update_chip_buttons(), 0.1)
         print(f"Selected chip: ${value}")
 
-    def _maintain_chip_highlight(self, btn, value):
-        """Maintain chip button highlight when state changes (prevents reset after press)"""
-        # Only maintain if this is the selected chip
-        if value == self.current_chip:
-            # Selected chip: gold color
-            btn.background_color = (0.85, 0.75, 0.3, 1.0)  # Gold color
-            btn.color = (0, 0, 0, 1)  # Black text for contrast
-    
     def update_chip_buttons(self):
-        """Update chip button colors to show selected chip"""
-        for i, btn in enumerate(self.chip_buttons):
-            value = [1, 5, 10, 25, 50, 100][i]
+        """Update chip colors to show the selected chip"""
+        for value in self.CHIP_VALUES:
             if value == self.current_chip:
-                # Selected chip: gold color
-                btn.background_color = (0.85, 0.75, 0.3, 1.0)  # Gold color
-                btn.color = (0, 0, 0, 1)  # Black text for contrast
-                # Also set background_normal and background_down to same color to prevent state changes
-                btn.background_normal = ''
-                btn.background_down = ''
+                # Selected chip: gold with black text for contrast
+                self.betting_grid.set_style(f'chip_{value}', background=CHIP_SELECTED, text_color=DARK_TEXT)
             else:
-                # Unselected chips: gray color
-                btn.background_color = (0.5, 0.5, 0.5, 1.0)  # Gray color
-                btn.color = (1, 1, 1, 1)  # White text
-                # Reset background properties
-                btn.background_normal = ''
-                btn.background_down = ''
+                # Unselected chips: gray with white text
+                self.betting_grid.set_style(f'chip_{value}', background=CHIP_IDLE, text_color=LIGHT_TEXT)
 
     def update_betting_buttons(self):
-        """Update all betting button text to show current bet amounts"""
-        for bet_type, button in self.betting_buttons.items():
-            bet_amount = self.bets.get(bet_type, 0)
-
-            # Get the base text for the button
-            if bet_type == 'zero':
-                base_text = '0'
-            elif bet_type.startswith('number_'):
-                base_text = bet_type.split('_')[1]
-            elif bet_type == 'dozen1':
-                base_text = '1st 12'
-            elif bet_type == 'dozen2':
-                base_text = '2nd 12'
-            elif bet_type == 'dozen3':
-                base_text = '3rd 12'
-            elif bet_type == 'red':
-                base_text = 'RED'
-            elif bet_type == 'black':
-                base_text = 'BLACK'
-            elif bet_type == 'even':
-                base_text = 'EVEN'
-            elif bet_type == 'odd':
-                base_text = 'ODD'
-            elif bet_type == 'low':
-                base_text = '1 to 18'
-            elif bet_type == 'high':
-                base_text = '19 to 36'
-            else:
-                base_text = bet_type.upper()
+        """Update the betting cells whose bet amount changed since the last refresh
 
-            # Update button text with bet amount
-            if bet_amount > 0:
-                button.text = f'{base_text}\n${bet_amount}'
-            else:
-                button.text = base_text
+        Only the changed cells are re-laid out, in the grid's next per-frame text pass.
+        """
+        shown = self._shown_bets
+        changed = [bet_type for bet_type in set(self.bets) | set(shown)
+                   if self.bets.get(bet_type, 0) != shown.get(bet_type, 0)]
+        for bet_type in changed:
+            self.betting_grid.set_amount(bet_type, self.bets.get(bet_type, 0))
+        self._shown_bets = dict(self.bets)
+
+    def record_input(self, action, arg=None):
+        """Record a player input at the current physics tick for replay"""
+        self.recorder.event(self.wheel.tick, action, arg)
 
     def place_bet(self, bet_type):
         """Place a bet on the specified type"""
-        if self.balance >= self.current_chip:
-            if bet_type not in self.bets:
-                self.bets[bet_type] = 0
-            self.bets[bet_type] += self.current_chip
-            self.total_bet += self.current_chip
-            self.balance -= self.current_chip
-
+        self.record_input('bet', bet_type)
+        if self.apply_bet(bet_type):
             # Play coin drop sound when placing a bet
             if self.coin_drop_sound:
                 self.coin_drop_sound.play()
@@ -2076,51 +1529,30 @@ class RouletteGame(BoxLayout):
 
     def rebet(self, instance=None):
         """Repeat the last bet"""
-        if self.last_bets:
-            # Check if we have enough balance for the last bets
-            last_total = sum(self.last_bets.values())
-            if self.balance >= last_total:
-                # Clear current bets first
-                self.balance += self.total_bet
-                self.bets = {}
-                self.total_bet = 0
-                
-                # Restore last bets
-                self.bets = self.last_bets.copy()
-                self.total_bet = last_total
-                self.balance -= self.total_bet
-                
-                self.update_display()
-                self.update_betting_buttons()
-                print(f"Rebet: ${self.total_bet}")
-            else:
-                print("Insufficient balance to rebet!")
+        self.record_input('rebet')
+        result = self.apply_rebet()
+        if result:
+            self.update_display()
+            self.update_betting_buttons()
+            print(f"Rebet: ${self.total_bet}")
+        elif result is False:
+            print("Insufficient balance to rebet!")
     
     def double_bets(self, instance=None):
         """Double all current bets"""
-        if self.bets:
-            # Need enough balance to double (need to add the same amount again)
-            if self.balance >= self.total_bet:
-                # Double all bet amounts
-                for bet_type in self.bets:
-                    self.bets[bet_type] *= 2
-                # Subtract only the additional amount (the original total_bet)
-                self.balance -= self.total_bet
-                self.total_bet *= 2
-                
-                self.update_display()
-                self.update_betting_buttons()
-                print(f"Doubled bets: ${self.total_bet}")
-            else:
-                print("Insufficient balance to double bets!")
+        self.record_input('double')
+        result = self.apply_double()
+        if result:
+            self.update_display()
+            self.update_betting_buttons()
+            print(f"Doubled bets: ${self.total_bet}")
+        elif result is False:
+            print("Insufficient balance to double bets!")
     
     def clear_bets(self, instance=None):
         """Clear all bets"""
-        # Refund bets to balance
-        self.balance += self.total_bet
-        # Don't update last_bet when manually clearing - it should keep the previous spin's total
-        self.bets = {}
-        self.total_bet = 0
+        self.record_input('clear')
+        self.apply_clear()
         self.update_display()
         self.update_betting_buttons()
         print("Bets cleared")
@@ -2133,8 +1565,9 @@ class RouletteGame(BoxLayout):
 
     def spin_wheel(self, instance=None):
         """Handle spin button - only spin if there are bets"""
+        self.record_input('spin')
         if self.total_bet > 0:
-            if not self.wheel.spinning and not self.wheel.ball_active:
+            if self.wheel.idle:
                 # Clear previous winning announcements
                 if hasattr(self, 'winning_number_label'):
                     self.winning_number_label.text = ""
@@ -2147,8 +1580,7 @@ class RouletteGame(BoxLayout):
                 self.reset_number_button_colors()
                 
                 # Start the sequence: spin wheel and launch ball
-                self.wheel.start_spin()
-                self.wheel.launch_ball()
+                self.apply_spin()
 
                 # Play ball sound immediately when spinning starts
                 if self.ball_drop_sound:
@@ -2170,27 +1602,159 @@ class RouletteGame(BoxLayout):
 
     def on_key_down(self, window, key, scancode, codepoint, modifier):
         """Handle keyboard input"""
+        if not self.ui_ready:
+            return  # No input until the betting table is built
         if key == 32:  # Spacebar
-            if not self.wheel.spinning and not self.wheel.ball_active:
-                # Start the sequence: spin wheel and launch ball
-                self.wheel.start_spin()
-                self.wheel.launch_ball()
-
+            self.record_input('key', key)
+            # Spin and launch the ball (or just launch if the wheel is already spinning)
+            if self.apply_key(key):
                 # Play ball sound immediately when spinning starts
                 if self.ball_drop_sound:
                     self.ball_drop_sound.play()
-            elif self.wheel.spinning and not self.wheel.ball_active:
-                # Launch ball if wheel is spinning but ball isn't active
-                self.wheel.launch_ball()
+        elif key == HUD_KEY and 'ctrl' in modifier:  # Capture a profiling trace
+            self.start_trace()
+        elif key == HUD_KEY:  # Performance HUD - not a table input, so not recorded
+            if self.hud is None:
+                self.hud = PerfHUD(self)
+            self.hud.toggle()
     
+    def restore_session(self):
+        """Continue the round saved by pause() if the app was killed while in the background
+
+        Returns True if a session was restored.
+        """
+        try:
+            with open(SESSION_FILE, encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            print(f"✗ Could not read saved session {SESSION_FILE}: {e}")
+            return False
+        try:
+            self.restore(state)
+            print(f"✓ Restored session from {SESSION_FILE}: balance ${self.balance}, bet ${self.total_bet}")
+            return True
+        except (KeyError, TypeError) as e:
+            print(f"✗ Ignoring saved session {SESSION_FILE}: {e}")
+            return False
+        finally:
+            self._discard_session()
+
+    def _discard_session(self):
+        try:
+            os.remove(SESSION_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"✗ Could not remove saved session {SESSION_FILE}: {e}")
+
+    def pause(self):
+        """App going to the background: stop the loop and sounds, save the round"""
+        if self.paused:
+            return
+        self.paused = True
+        self._update_event.cancel()
+        self.sound_effects.stop_all()
+        self.ball_drop_sound.stop()
+        self.paused_state = self.snapshot()
+        try:
+            os.makedirs(os.path.dirname(SESSION_FILE), exist_ok=True)
+            with open(SESSION_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.paused_state, f)
+        except OSError as e:
+            print(f"✗ Could not save session {SESSION_FILE}: {e}")
+        if RELEASE_ON_PAUSE:
+            self.release_resources()
+        print(f"✓ Paused at tick {self.wheel.tick}")
+
+    def resume(self):
+        """Back in the foreground: restart the loop where it stopped and reload what was released"""
+        if not self.paused:
+            return
+        self.paused = False
+        self._discard_session()  # Still running - the saved copy is not needed
+        self.wheel._accumulator = 0.0  # No catch-up for the time spent in the background
+        self._update_event = Clock.schedule_interval(self.update, 1.0 / 480.0)
+        if self.resources_released:
+            self.reload_resources()
+        print(f"✓ Resumed at tick {self.wheel.tick}")
+
+    def on_memory_warning(self, window):
+        """The OS is short of memory: give back loaded sounds and textures not on screen"""
+        if self.paused:
+            self.release_resources()
+            return
+        freed = self.sound_bank.unload_idle()
+        dropped = self.texture_loader.release() + TEXT_CACHE.clear()
+        gc.collect()
+        print(f"✓ Memory warning: unloaded {freed // 1024} KB of sounds, {dropped} cached textures")
+
+    def release_resources(self):
+        """Drop every texture and loaded sound that can be rebuilt (only while paused)"""
+        if self.resources_released:
+            return
+        self.resources_released = True
+        freed = self.sound_bank.unload_idle()
+        dropped = self.texture_loader.release() + TEXT_CACHE.clear()
+        self.wheel.background_texture = None
+        self.wheel.previous_numbers_textures = []
+        if self.betting_texture is not None:
+            self.betting_texture = None
+            self.bg_rect.texture = None
+            self.bg_color.rgba = (0.15, 0.15, 0.2, 1)  # Plain felt until the texture is back
+        gc.collect()
+        print(f"✓ Released {dropped} textures and {freed // 1024} KB of sounds")
+
+    def reload_resources(self):
+        """Undo release_resources() - textures load in the background, sounds on their next play"""
+        self.resources_released = False
+        self.wheel._background_trigger()
+        if getattr(self, '_table_texture_trigger', None) is not None:
+            self._table_texture_trigger()
+        self.wheel.update_previous_numbers_display()
+
+    def start_trace(self):
+        """Trace the hot paths for a bounded window (see tracing.py); they are unwrapped afterwards"""
+        if self.tracer is not None and self.tracer.active:
+            return
+        from tracing import Tracer
+        tracer = Tracer()
+        tracer.hook(RouletteGame, 'update')
+        tracer.hook(RouletteWheel, 'update')
+        tracer.hook(RouletteWheel, 'draw')
+        tracer.hook(RouletteGame, 'process_payouts')
+        tracer.hook(RouletteGame, 'place_bet')
+        # Every scheduled callback runs inside one of these
+        tracer.hook(Clock, 'tick', 'Clock.tick')
+        tracer.hook(Clock, 'tick_draw', 'Clock.tick_draw')
+        tracer.start()
+        Clock.schedule_once(lambda dt: tracer.stop(), tracer.window)
+        self.tracer = tracer
+
     def update(self, dt):
         """Update game loop"""
-        self.wheel.update(dt)
-
-        # Check for spin completion and handle payouts
-        if not self.wheel.spinning and self.wheel.winning_number is not None and self.wheel.winning_number != self.last_win:
-            self.last_win = self.wheel.winning_number
+        governor = self.quality_governor
+        if governor is None:
+            self.wheel.update(dt)
+        else:
+            begin = time.perf_counter()
+            self.wheel.update(dt)
+            governor.frame(dt, time.perf_counter() - begin, not self.wheel.idle)
+
+        # Check for spin completion and handle payouts - a restored spin can finish before
+        # the betting table exists, it is paid out by on_ui_complete()
+        if self.ui_ready:
+            self.check_round()
+
+    def check_round(self):
+        """Pay out a spin that has just completed"""
+        if self.poll_round() is not None:
+            for probe in self.wheel.probes:
+                probe.phase('payouts')
             self.process_payouts()
+            for probe in self.wheel.probes:
+                probe.phase('other')
             print(f"Winning number: {self.wheel.winning_number}")
 
 
@@ -2238,51 +1802,10 @@ class RouletteGame(BoxLayout):
     def process_payouts(self):
         """Process betting payouts based on winning number"""
         win_number = self.wheel.winning_number
-        total_payout = 0
-
-        for bet_type, amount in self.bets.items():
-            payout = 0
-
-            if bet_type == 'red' and win_number in self.wheel.RED_NUMBERS:
-                payout = amount * 2
-            elif bet_type == 'black' and win_number not in self.wheel.RED_NUMBERS and win_number != 0:
-                payout = amount * 2
-            elif bet_type == 'even' and win_number != 0 and win_number % 2 == 0:
-                payout = amount * 2
-            elif bet_type == 'odd' and win_number != 0 and win_number % 2 == 1:
-                payout = amount * 2
-            elif bet_type == 'low' and win_number >= 1 and win_number <= 18:
-                payout = amount * 2
-            elif bet_type == 'high' and win_number >= 19 and win_number <= 36:
-                payout = amount * 2
-            elif bet_type == 'dozen1' and win_number >= 1 and win_number <= 12:
-                payout = amount * 3
-            elif bet_type == 'dozen2' and win_number >= 13 and win_number <= 24:
-                payout = amount * 3
-            elif bet_type == 'dozen3' and win_number >= 25 and win_number <= 36:
-                payout = amount * 3
-            elif bet_type == 'zero' and win_number == 0:
-                payout = amount * 36  # House edge makes this payout high
-            elif bet_type.startswith('number_'):
-                bet_num = int(bet_type.split('_')[1])
-                if win_number == bet_num:
-                    payout = amount * 36
-
-            if payout > 0:
-                total_payout += payout
-                print(f"WIN! {bet_type}: bet ${amount}, payout ${payout}")
-
-        if total_payout > 0:
-            self.balance += total_payout
-            print(f"Total payout: ${total_payout}, New balance: ${self.balance}")
-        else:
-            print("No winning bets this round")
-
-        # Add winning number to previous numbers list
-        self.previous_numbers.append(win_number)
-        if len(self.previous_numbers) > 35:
-            self.previous_numbers.pop(0)  # Keep only last 35 numbers
-
+        total_payout = self.settle_round(win_number)
+        self.recorder.round_result(self.wheel.settle_tick, win_number, self.balance)
+        if self.record_path:
+            self.recorder.save(self.record_path)
 
         # Update the previous numbers display
         self.wheel.update_previous_numbers_display()
@@ -2303,10 +1826,8 @@ class RouletteGame(BoxLayout):
 
             # Clear bets after showing the win result (5 seconds)
             def clear_bets_after_win(dt):
-                self.last_bet = self.total_bet  # Save total bet as last bet before clearing
-                self.last_bets = self.bets.copy()  # Save bets dictionary for rebet
-                self.bets = {}
-                self.total_bet = 0
+                self.record_input('finish')
+                self.finish_round()
                 self.update_display()
                 self.update_betting_buttons()
                 if hasattr(self, 'betting_container') and self.betting_container:
@@ -2315,49 +1836,26 @@ class RouletteGame(BoxLayout):
             Clock.schedule_once(clear_bets_after_win, 5)
         else:
             # No win - clear bets immediately
-            self.last_bet = self.total_bet  # Save total bet as last bet before clearing
-            self.last_bets = self.bets.copy()  # Save bets dictionary for rebet
-            self.bets = {}
-            self.total_bet = 0
+            self.finish_round()
             self.update_display()
             self.update_betting_buttons()
             if hasattr(self, 'betting_container') and self.betting_container:
                 self.draw_coins_on_table(self.betting_container)
     
     def highlight_winning_number(self, winning_number):
-        """Highlight the winning number button on the betting table"""
-        # Reset all number buttons to their original colors first
-        self.reset_number_button_colors()
-        
-        # Find and highlight the winning number button
-        button_key = f'number_{winning_number}'
-        if button_key in self.betting_buttons:
-            winning_button = self.betting_buttons[button_key]
-            # Store original color if not already stored
-            if not hasattr(winning_button, 'original_bg_color'):
-                winning_button.original_bg_color = winning_button.background_color[:]
-            
-            # Highlight with bright gold/yellow to emphasize
-            winning_button.background_color = (1.0, 0.9, 0.2, 1)  # Bright gold
-            winning_button.color = (0, 0, 0, 1)  # Black text for contrast
-            # Make font bigger and bolder
-            winning_button.font_size = int(22 * FONT_SCALE)
-            winning_button.bold = True
-    
+        """Highlight the winning number on the betting table (gold, black bigger text)
+
+        The grid remembers the highlighted cell, so only it and the previous one are redrawn.
+        """
+        cell_id = f'number_{winning_number}'
+        if cell_id in self.betting_grid.cells:
+            self.betting_grid.highlight(cell_id)
+        else:
+            self.reset_number_button_colors()
+
     def reset_number_button_colors(self):
-        """Reset all number buttons to their original colors"""
-        for button_key, button in self.betting_buttons.items():
-            if button_key.startswith('number_'):
-                num = int(button_key.split('_')[1])
-                # Restore original color
-                is_red = num in self.wheel.RED_NUMBERS
-                original_bg = (0.85, 0.15, 0.15, 1) if is_red else (0.15, 0.15, 0.15, 1)
-                button.background_color = original_bg
-                button.color = (1, 1, 1, 1)  # White text
-                button.font_size = int(18 * FONT_SCALE)  # Reset font size
-                button.bold = True  # Keep bold
-                if hasattr(button, 'original_bg_color'):
-                    delattr(button, 'original_bg_color')
+        """Restore the highlighted number (if any) to its original colors"""
+        self.betting_grid.clear_highlight()
 
 
 class RouletteApp(App):
@@ -2384,6 +1882,7 @@ class RouletteApp(App):
     def on_start(self):
         """Called when app starts"""
         print("Roulette game started!")
+        Window.bind(on_flip=self._on_first_frame)
         
         # On Android, force fullscreen immediately
         try:
@@ -2482,6 +1981,12 @@ class RouletteApp(App):
         # if hasattr(self, 'casino_ambiance') and self.casino_ambiance:
         #     self.casino_ambiance.play()
     
+    def _on_first_frame(self, window):
+        """Mark the first presented frame (the wheel) and start building the betting table"""
+        window.unbind(on_flip=self._on_first_frame)
+        STARTUP.mark('first_frame')
+        self.root.ui_builder.start()  # The startup profile is printed once it completes
+
     def _ensure_fullscreen(self):
         """Ensure root widget fills screen"""
         if hasattr(self, 'root') and self.root:
@@ -2493,12 +1998,13 @@ class RouletteApp(App):
             self.root.size_hint = (1, 1)
     
     def on_pause(self):
-        """Called when app is paused (mobile)"""
+        """Called when app is paused (mobile) - nothing runs until on_resume"""
+        self.root.pause()
         return True
     
     def on_resume(self):
         """Called when app resumes (mobile)"""
-        pass
+        self.root.resume()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,220 @@
+"""
+Performance instrumentation for the roulette game (no Kivy dependency).
+
+Frame probes (FrameTimings, MemoryProfiler) are told which phase of the frame
+is running - 'physics', 'draw', 'payouts', or 'other' for the rest of the
+frame (Kivy input, layout, rendering) - and attribute what they measure to it.
+RouletteWheel.update only calls them when at least one is attached.
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+# Set by main.py as its very first statement so import time is included
+PROCESS_START = time.perf_counter()
+
+
+def flag_enabled(flag, env_var):
+    """True if --flag was passed (after Kivy's '--' separator) or env_var is set"""
+    return flag in sys.argv or os.environ.get(env_var, '') not in ('', '0')
+
+
+class StartupProfiler:
+    """Records wall-clock timestamps for each cold-start phase"""
+
+    def __init__(self, start=None):
+        self.start = PROCESS_START if start is None else start
+        self.entries = []  # (name, offset from start, duration) in seconds
+        self._last = self.start
+
+    def mark(self, name):
+        """Record that a phase ended now (its duration is the time since the previous mark)"""
+        now = time.perf_counter()
+        self.entries.append((name, now - self.start, now - self._last))
+        self._last = now
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block as its own phase"""
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self.entries.append((name, now - self.start, now - begin))
+            self._last = now
+
+    def record(self, name, begin, end=None):
+        """Record a phase timed elsewhere (e.g. an asset that finished loading in the background)"""
+        end = time.perf_counter() if end is None else end
+        self.entries.append((name, end - self.start, end - begin))
+
+    def as_dict(self):
+        return {name: {'at_ms': round(at * 1000, 2), 'ms': round(duration * 1000, 2)}
+                for name, at, duration in self.entries}
+
+    def report(self):
+        lines = ["Startup profile (ms):", f"  {'phase':<22}{'duration':>10}{'at':>10}"]
+        for name, at, duration in self.entries:
+            lines.append(f"  {name:<22}{duration * 1000:>10.1f}{at * 1000:>10.1f}")
+        return '\n'.join(lines)
+
+
+STARTUP = StartupProfiler()
+
+
+class RingBuffer:
+    """The last `capacity` samples - adding never allocates once the buffer is full"""
+
+    def __init__(self, capacity=240):
+        self.capacity = capacity
+        self.samples = [0.0] * capacity
+        self.count = 0
+        self._next = 0
+
+    def add(self, value):
+        self.samples[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def values(self):
+        return self.samples[:self.count]
+
+    def clear(self):
+        self.count = 0
+        self._next = 0
+
+    def percentile(self, p):
+        """Nearest-rank percentile (0-100) of the samples, 0.0 when empty"""
+        values = sorted(self.values())
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+    def mean(self):
+        return sum(self.samples[:self.count]) / self.count if self.count else 0.0
+
+
+class FrameTimings:
+    """Per-frame timings (seconds), filled in only while something is watching them"""
+
+    def __init__(self, capacity=240):
+        self.frame = RingBuffer(capacity)  # Time between presented frames
+        self.physics = RingBuffer(capacity)  # RouletteWheel.advance
+        self.draw = RingBuffer(capacity)  # RouletteWheel.draw (instruction generation)
+        self._rings = {'physics': self.physics, 'draw': self.draw}
+        self._phase = None
+        self._since = 0.0
+
+    def phase(self, name):
+        """Frame probe: the previous phase ended and `name` starts now"""
+        now = time.perf_counter()
+        ring = self._rings.get(self._phase)
+        if ring is not None:
+            ring.add(now - self._since)
+        self._phase, self._since = name, now
+
+
+def gc_collections():
+    """Total garbage collections so far, over all generations"""
+    return sum(stats['collections'] for stats in gc.get_stats())
+
+
+class MemoryProfiler:
+    """Frame probe that attributes garbage collector pauses and allocations to frame phases
+
+    Every collection is timed through gc.callbacks and recorded with its
+    generation and the phase it interrupted. With trace_allocations, one whole
+    frame every sample_interval seconds - from its 'physics' phase to the next
+    frame's - is traced with tracemalloc: how much each phase allocated (its
+    peak over the starting size) and kept, and which source lines the frame's
+    surviving allocations came from. Tracing makes that frame
+    many times slower (every graphics instruction allocates), so it is sampled
+    rather than left on.
+    """
+
+    def __init__(self, trace_allocations=False, sample_interval=10.0, frames=1, capacity=4096):
+        self.trace_allocations = trace_allocations
+        self.sample_interval = sample_interval
+        self.frames = frames
+        self.pauses = deque(maxlen=capacity)  # (generation, seconds, phase, objects collected)
+        self.allocated = {}  # phase -> (bytes allocated (peak), bytes kept) in the last sampled frame
+        self.frame_lines = []  # tracemalloc statistics of the last sampled frame, largest first
+        self.current = 'other'
+        self.installed = False
+        self._gc_start = 0.0
+        self._sampling = False
+        self._next_sample = 0.0
+        self._phase_start = 0
+
+    def install(self):
+        if not self.installed:
+            gc.callbacks.append(self._on_gc)
+            self.installed = True
+
+    def uninstall(self):
+        if self.installed:
+            gc.callbacks.remove(self._on_gc)
+            if self._sampling:
+                tracemalloc.stop()
+                self._sampling = False
+            self.installed = False
+
+    def _on_gc(self, stage, info):
+        if stage == 'start':
+            self._gc_start = time.perf_counter()
+        else:
+            self.pauses.append((info['generation'], time.perf_counter() - self._gc_start,
+                                self.current, info['collected']))
+
+    def phase(self, name):
+        """Frame probe: the previous phase ended and `name` starts now"""
+        if self.trace_allocations:
+            if self._sampling:
+                current, peak = tracemalloc.get_traced_memory()
+                allocated, kept = self.allocated.get(self.current, (0, 0))
+                self.allocated[self.current] = (allocated + max(0, peak - self._phase_start),
+                                                kept + current - self._phase_start)
+                tracemalloc.reset_peak()
+                self._phase_start = current
+                if name == 'physics':  # The next frame starts - the sampled one ended with its 'other' phase
+                    snapshot = tracemalloc.take_snapshot().filter_traces(
+                        [tracemalloc.Filter(False, tracemalloc.__file__)])
+                    self.frame_lines = snapshot.statistics('lineno')
+                    tracemalloc.stop()
+                    self._sampling = False
+                    self._next_sample = time.perf_counter() + self.sample_interval
+            if (not self._sampling and name == 'physics' and time.perf_counter() >= self._next_sample
+                    and not tracemalloc.is_tracing()):
+                self.allocated = {}
+                tracemalloc.start(self.frames)
+                self._phase_start = 0
+                self._sampling = True
+        self.current = name
+
+    def pause_summary(self):
+        """{(phase, generation): (collections, total seconds, longest seconds)}"""
+        summary = {}
+        for generation, seconds, phase, _ in self.pauses:
+            count, total, longest = summary.get((phase, generation), (0, 0.0, 0.0))
+            summary[(phase, generation)] = (count + 1, total + seconds, max(longest, seconds))
+        return summary
+
+    def report(self, limit=10):
+        lines = ["GC pauses by frame phase:", f"  {'phase':<10}{'gen':>4}{'count':>7}{'total ms':>10}{'max ms':>9}"]
+        for (phase, generation), (count, total, longest) in sorted(self.pause_summary().items()):
+            lines.append(f"  {phase:<10}{generation:>4}{count:>7}{total * 1000:>10.2f}{longest * 1000:>9.2f}")
+        if self.allocated:
+            lines.append("Allocations in the last sampled frame (KiB):")
+            lines.append(f"  {'phase':<10}{'allocated':>10}{'kept':>10}")
+            for phase, (allocated, kept) in sorted(self.allocated.items()):
+                lines.append(f"  {phase:<10}{allocated / 1024:>10.1f}{kept / 1024:>10.1f}")
+            lines.append("Allocations kept by the sampled frame, by line:")
+            lines.extend(f"  {stat}" for stat in self.frame_lines[:limit])
+        return '\n'.join(lines)
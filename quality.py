@@ -0,0 +1,238 @@
+"""
+Rendering quality tiers for the roulette wheel.
+Each tier decides how much decoration RouletteWheel.draw() emits: drop shadow
+layers, wood grain rings and radial grain lines, how closely pocket arcs
+follow the circle, pocket shading passes and highlight passes. 'ultra' is the
+full look; 'low' keeps only what is needed to read the wheel.
+
+Pocket arcs are cut into as few straight segments as keep every chord within
+the tier's pixel error of the true circle, so the segment count follows the
+on-screen size of the wheel: a small wheel needs two segments per pocket where
+a large one needs more.
+
+While the game runs, a QualityGovernor watches the frames of each spin and
+moves the tier down when too many miss the refresh budget, and back up when
+the frames have had headroom for long enough.
+
+The tier is chosen at startup from a short benchmark of canvas instruction
+creation (the bulk of draw()'s cost), unless ROULETTE_QUALITY (or --quality
+<tier> after Kivy's '--') names one.
+"""
+
+import json
+import math
+import os
+import sys
+import time
+
+from kivy.graphics import Color, InstructionGroup, Line, Triangle
+from kivy.utils import platform
+
+from perf import RingBuffer
+
+QUALITY_TIERS = ('low', 'medium', 'high', 'ultra')
+QUALITY_ENV = 'ROULETTE_QUALITY'
+
+# Instructions the startup benchmark creates per run (best of BENCHMARK_RUNS is used)
+BENCHMARK_INSTRUCTIONS = 300
+BENCHMARK_RUNS = 3
+
+# Highest tier allowed for a measured cost per canvas instruction (microseconds) - about
+# 2 us on a desktop CPU; phones measure 2-5 times that
+TIER_THRESHOLDS = (
+    ('ultra', 2.5),
+    ('high', 5.0),
+    ('medium', 10.0),
+)
+
+# Governor: spin frames are judged in windows of GOVERNOR_WINDOW frames against the refresh budget
+FRAME_BUDGET = 1.0 / float(os.environ.get('ROULETTE_TARGET_FPS', 60))
+GOVERNOR_WINDOW = 90
+DROP_FACTOR = 1.5  # A frame this many budgets long missed at least one refresh
+DROP_RATE_DOWN = 0.2  # Step down when this share of a window's frames dropped
+DROP_RATE_UP = 0.02  # Only windows with at most this share count towards stepping up ...
+HEADROOM = 0.5  # ... and only if 90% of update() calls took at most this share of the budget
+UP_WINDOWS = 4  # Good windows in a row needed to step up (doubles after each rebound)
+MAX_UP_WINDOWS = 64
+REBOUND_WINDOWS = 3  # A step down this soon after a step up is a rebound
+COOLDOWN_WINDOWS = 1  # Windows ignored after any change while the new tier settles
+MAX_FRAME_GAP = 0.5  # Longer gaps are stalls (loading, app switching), not dropped frames
+
+
+class QualityPreset:
+    """How much detail draw() spends on each layer of the wheel"""
+
+    __slots__ = ('name', 'shadow_layers', 'grain_rings', 'grain_spacing', 'arc_error',
+                 'pocket_passes', 'highlight_passes')
+
+    def __init__(self, name, shadow_layers, grain_rings, grain_spacing, arc_error,
+                 pocket_passes, highlight_passes):
+        self.name = name
+        self.shadow_layers = shadow_layers  # Drop shadows stacked under each part (0-3)
+        self.grain_rings = grain_rings  # Concentric grain / inlay rings per part (1-4)
+        self.grain_spacing = grain_spacing  # Radial grain every n-th line of the full look, 0 for none
+        self.arc_error = arc_error  # Pixels a pocket arc's chords may stray from the circle
+        self.pocket_passes = pocket_passes  # Surface, base colour, inner shadow, deep shadow (1-4)
+        self.highlight_passes = highlight_passes  # Highlight and shine strokes (0-3)
+
+    def __repr__(self):
+        return f"QualityPreset({self.name!r})"
+
+
+QUALITY_PRESETS = {
+    'low': QualityPreset('low', shadow_layers=0, grain_rings=1, grain_spacing=0, arc_error=2.0,
+                         pocket_passes=1, highlight_passes=0),
+    'medium': QualityPreset('medium', shadow_layers=1, grain_rings=2, grain_spacing=3, arc_error=1.0,
+                            pocket_passes=2, highlight_passes=1),
+    'high': QualityPreset('high', shadow_layers=2, grain_rings=3, grain_spacing=2, arc_error=0.5,
+                          pocket_passes=3, highlight_passes=2),
+    'ultra': QualityPreset('ultra', shadow_layers=3, grain_rings=4, grain_spacing=1, arc_error=0.25,
+                           pocket_passes=4, highlight_passes=3),
+}
+
+# (radius, arc angle, error) -> segments, filled by arc_segments()
+_arc_segments = {}
+
+
+def arc_segments(radius, angle, max_error):
+    """Straight segments an arc of `angle` radians at `radius` pixels needs to stay within max_error"""
+    radius = math.ceil(radius)
+    key = (radius, angle, max_error)
+    segments = _arc_segments.get(key)
+    if segments is None:
+        if radius <= max_error:
+            segments = 1
+        else:
+            # A chord spanning `step` radians is at most radius * (1 - cos(step / 2)) from the arc
+            step = 2 * math.acos(1 - max_error / radius)
+            segments = max(1, math.ceil(angle / step))
+        _arc_segments[key] = segments
+    return segments
+
+
+def configured_tier():
+    """Tier named by --quality <tier> or ROULETTE_QUALITY (lower case), or None"""
+    tier = os.environ.get(QUALITY_ENV, '')
+    if '--quality' in sys.argv[:-1]:
+        tier = sys.argv[sys.argv.index('--quality') + 1]
+    return tier.strip().lower() or None
+
+
+def instruction_cost(count=BENCHMARK_INSTRUCTIONS, runs=BENCHMARK_RUNS):
+    """Microseconds to create one canvas instruction, in the mix draw() uses (best of runs)"""
+    best = None
+    points = [0.0, 0.0, 10.0, 0.0, 0.0, 10.0]
+    for _ in range(runs):
+        group = InstructionGroup()
+        begin = time.perf_counter()
+        for _ in range(count // 3):
+            group.add(Color(0.5, 0.5, 0.5, 1))
+            group.add(Triangle(points=points))
+            group.add(Line(points=points[:4], width=1))
+        elapsed = time.perf_counter() - begin
+        best = elapsed if best is None else min(best, elapsed)
+    return best / (count // 3 * 3) * 1e6
+
+
+def tier_for_cost(cost):
+    for tier, limit in TIER_THRESHOLDS:
+        if cost <= limit:
+            return tier
+    return 'low'
+
+
+def choose_quality():
+    """QualityPreset from the configured tier, else from the startup benchmark"""
+    tier = configured_tier()
+    if tier in QUALITY_PRESETS:
+        print(f"✓ Rendering quality: {tier} (configured)")
+        return QUALITY_PRESETS[tier]
+    if tier is not None:
+        print(f"✗ Unknown quality tier {tier!r} - expected one of {', '.join(QUALITY_TIERS)}")
+    cost = instruction_cost()
+    tier = tier_for_cost(cost)
+    print(f"✓ Rendering quality: {tier} ({cost:.2f} µs per canvas instruction)")
+    return QUALITY_PRESETS[tier]
+
+
+class QualityGovernor:
+    """Moves the wheel between quality tiers from the frame times of spins
+
+    frame() is called once per RouletteGame.update with the time since the
+    previous frame and the time update() itself took. Only frames while the
+    wheel is moving count. Stepping down takes one bad window; stepping up takes
+    several good ones in a row, and twice as many after each rebound (a step
+    down soon after a step up), so the tier settles instead of oscillating.
+    Every change is printed and, if ROULETTE_GOVERNOR_LOG names a file, appended
+    to it as a JSON line.
+    """
+
+    def __init__(self, wheel, budget=FRAME_BUDGET, window=GOVERNOR_WINDOW, log_path=None):
+        self.wheel = wheel
+        self.budget = budget
+        self.window = window
+        self.log_path = log_path if log_path is not None else os.environ.get('ROULETTE_GOVERNOR_LOG')
+        self.up_windows = UP_WINDOWS
+        self.decisions = []  # One dict per tier change
+        self._work = RingBuffer(window)
+        self._frames = 0
+        self._dropped = 0
+        self._good_windows = 0
+        self._cooldown = 0
+        self._last_step = None
+        self._windows_since_step = 0
+
+    def frame(self, dt, work, active):
+        if not active or dt > MAX_FRAME_GAP:
+            return
+        self._frames += 1
+        if dt > self.budget * DROP_FACTOR:
+            self._dropped += 1
+        self._work.add(work)
+        if self._frames >= self.window:
+            self._evaluate()
+
+    def _evaluate(self):
+        frames, drop_rate, work_p90 = self._frames, self._dropped / self._frames, self._work.percentile(90)
+        self._frames = self._dropped = 0
+        self._work.clear()
+        self._windows_since_step += 1
+        if self._cooldown:
+            self._cooldown -= 1
+            return
+
+        tier = QUALITY_TIERS.index(self.wheel.quality.name)
+        stats = {'frames': frames, 'drop_rate': round(drop_rate, 3), 'work_p90_ms': round(work_p90 * 1000, 2)}
+        if drop_rate >= DROP_RATE_DOWN:
+            self._good_windows = 0
+            if tier > 0:
+                if self._last_step == 'up' and self._windows_since_step <= REBOUND_WINDOWS:
+                    self.up_windows = min(self.up_windows * 2, MAX_UP_WINDOWS)
+                self._step(tier - 1, 'down', stats)
+        elif drop_rate <= DROP_RATE_UP and work_p90 <= self.budget * HEADROOM:
+            self._good_windows += 1
+            if self._good_windows >= self.up_windows and tier < len(QUALITY_TIERS) - 1:
+                self._step(tier + 1, 'up', stats)
+        else:
+            self._good_windows = 0
+
+    def _step(self, tier, direction, stats):
+        old = self.wheel.quality.name
+        self.wheel.quality = QUALITY_PRESETS[QUALITY_TIERS[tier]]
+        self._last_step = direction
+        self._windows_since_step = 0
+        self._good_windows = 0
+        self._cooldown = COOLDOWN_WINDOWS
+        decision = dict(stats, time=round(time.time(), 3), tick=self.wheel.tick, step=direction,
+                        old=old, new=self.wheel.quality.name, up_windows=self.up_windows,
+                        budget_ms=round(self.budget * 1000, 2), platform=platform,
+                        wheel_size=[int(v) for v in self.wheel.size])
+        self.decisions.append(decision)
+        print(f"✓ Quality {old} -> {decision['new']}: {stats['drop_rate']:.0%} of {stats['frames']} spin frames "
+              f"dropped, update p90 {stats['work_p90_ms']:.1f} ms (budget {decision['budget_ms']:.1f} ms)")
+        if self.log_path:
+            try:
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(decision) + '\n')
+            except OSError as e:
+                print(f"✗ Could not write governor log {self.log_path}: {e}")
@@ -0,0 +1,169 @@
+"""
+Random number service for the roulette game.
+Seedable per-table streams with interchangeable backends and batched prefetch.
+"""
+
+import hashlib
+import os
+import random
+import secrets
+
+np = None  # NumPy is imported on first use of the PCG64 backend (keeps it off the startup path)
+
+
+def numpy_available():
+    """Import NumPy on demand, returning False if it is not installed"""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return False
+        np = numpy
+    return True
+
+# Numbers generated per refill - the hot loop only indexes into this buffer
+BATCH_SIZE = 4096
+
+
+def derive_seed(seed, name):
+    """Derive a 64-bit stream seed from the master seed and a stream name"""
+    digest = hashlib.sha256(f"{seed}:{name}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'little')
+
+
+class PythonBackend:
+    """Mersenne Twister from the standard library (reproducible)"""
+    name = 'python'
+    reproducible = True
+
+    def __init__(self, seed):
+        self._rng = random.Random(seed)
+
+    def fill(self, count):
+        rand = self._rng.random
+        return [rand() for _ in range(count)]
+
+
+class PCG64Backend:
+    """NumPy PCG64 generator (reproducible, fast bulk generation)"""
+    name = 'pcg64'
+    reproducible = True
+
+    def __init__(self, seed):
+        self._generator = np.random.Generator(np.random.PCG64(seed))
+
+    def fill(self, count):
+        return self._generator.random(count).tolist()
+
+
+class SecretsBackend:
+    """Operating system CSPRNG via the secrets module (not reproducible)"""
+    name = 'secrets'
+    reproducible = False
+
+    def __init__(self, seed=None):
+        # The OS entropy pool cannot be seeded - the seed is ignored
+        self._rng = secrets.SystemRandom()
+
+    def fill(self, count):
+        rand = self._rng.random
+        return [rand() for _ in range(count)]
+
+
+BACKENDS = {
+    PythonBackend.name: PythonBackend,
+    PCG64Backend.name: PCG64Backend,
+    SecretsBackend.name: SecretsBackend,
+}
+
+
+class RNGStream:
+    """A named stream of uniform floats in [0, 1) served from a prefetched batch"""
+
+    def __init__(self, name, backend, batch_size=BATCH_SIZE):
+        self.name = name
+        self.backend = backend
+        self.batch_size = batch_size
+        self.draws = 0  # Numbers consumed so far (for audits)
+        self._buffer = []
+        self._index = 0
+        self._size = 0
+
+    def _refill(self):
+        """Fetch the next batch from the backend"""
+        self._buffer = self.backend.fill(self.batch_size)
+        self._size = len(self._buffer)
+        self._index = 0
+
+    def random(self):
+        """Next float in [0, 1)"""
+        i = self._index
+        if i >= self._size:
+            self._refill()
+            i = 0
+        self._index = i + 1
+        self.draws += 1
+        return self._buffer[i]
+
+    def skip(self, count):
+        """Discard the next count numbers (to resume a stream at a recorded position)"""
+        for _ in range(count):
+            self.random()
+
+    def uniform(self, a, b):
+        """Float in [a, b) - same formula as random.uniform"""
+        return a + (b - a) * self.random()
+
+    def randint(self, a, b):
+        """Integer in [a, b] inclusive"""
+        return min(b, a + int(self.random() * (b - a + 1)))
+
+
+class RNGService:
+    """Owns the master seed and hands out independent per-table streams"""
+
+    def __init__(self, seed=None, backend='python', batch_size=BATCH_SIZE):
+        if backend not in BACKENDS:
+            print(f"Unknown RNG backend '{backend}', using 'python'")
+            backend = 'python'
+        if backend == 'pcg64' and not numpy_available():
+            print("NumPy not available, PCG64 backend falling back to 'python'")
+            backend = 'python'
+
+        # Always pick a concrete seed so it can be logged and replayed
+        if seed is None:
+            seed = secrets.randbits(64)
+        self.seed = int(seed)
+        self.backend_name = backend
+        self.batch_size = batch_size
+        self.streams = {}
+
+    @classmethod
+    def from_environment(cls):
+        """Build a service from ROULETTE_RNG_SEED / ROULETTE_RNG_BACKEND"""
+        seed = os.environ.get('ROULETTE_RNG_SEED')
+        backend = os.environ.get('ROULETTE_RNG_BACKEND', 'python')
+        return cls(seed=int(seed) if seed else None, backend=backend)
+
+    @property
+    def reproducible(self):
+        return BACKENDS[self.backend_name].reproducible
+
+    def stream(self, name):
+        """Get (or create) the stream with the given name"""
+        stream = self.streams.get(name)
+        if stream is None:
+            backend = BACKENDS[self.backend_name](derive_seed(self.seed, name))
+            stream = RNGStream(name, backend, self.batch_size)
+            self.streams[name] = stream
+        return stream
+
+    def describe(self):
+        """Audit summary: seed, backend and draws per stream"""
+        return {
+            'seed': self.seed,
+            'backend': self.backend_name,
+            'reproducible': self.reproducible,
+            'draws': {name: s.draws for name, s in self.streams.items()},
+        }
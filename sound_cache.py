@@ -0,0 +1,104 @@
+"""
+Content-addressed cache for synthesised sound clips.
+Clips are stored as WAV files named by a hash of the generator and its full
+parameter set, so unchanged parameters never trigger resynthesis. The key also
+names the synth implementation (NumPy or pure Python), whose clips differ. The cache
+directory is capped in size and evicts least recently used clips.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+
+import synth
+
+DEFAULT_CACHE_DIR = os.environ.get('ROULETTE_SOUND_CACHE', os.path.join('sounds', 'cache'))
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024  # 8 MB
+
+
+class SoundCache:
+    """Synthesise clips on a miss, serve the cached WAV path on a hit"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def normalized_params(self, generator, params):
+        """Full parameter set including defaults, so equal clips get equal keys"""
+        bound = inspect.signature(synth.GENERATORS[generator]).bind(**params)
+        bound.apply_defaults()
+        return dict(bound.arguments)
+
+    def key(self, generator, params):
+        """Hash of the synth version and implementation, generator name and parameters"""
+        payload = json.dumps({
+            'version': synth.SYNTH_VERSION,
+            'implementation': synth.implementation(),
+            'generator': generator,
+            'params': self.normalized_params(generator, params),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path_for(self, generator, params):
+        return os.path.join(self.cache_dir, f"{generator}-{self.key(generator, params)[:20]}.wav")
+
+    def get(self, generator, **params):
+        """Return the path of the clip, synthesising it only if it is not cached"""
+        path = self.path_for(generator, params)
+        if os.path.exists(path):
+            self.hits += 1
+            # Touch so eviction sees this clip as recently used
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+            return path
+
+        self.misses += 1
+        os.makedirs(self.cache_dir, exist_ok=True)
+        params = self.normalized_params(generator, params)
+        samples = synth.GENERATORS[generator](**params)
+        # Write to a temporary name first so a crash never leaves a truncated clip behind
+        tmp_path = path + '.tmp'
+        synth.write_wav(tmp_path, samples, params.get('sample_rate', synth.SAMPLE_RATE))
+        os.replace(tmp_path, path)
+        self.evict(keep=path)
+        return path
+
+    def entries(self):
+        """Cached clips as (last_used, size, path), oldest first"""
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith('.wav'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+        return entries
+
+    def evict(self, keep=None):
+        """Delete least recently used clips until the cache fits under max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        return total
@@ -0,0 +1,94 @@
+"""
+Pre-baked sprite atlases for the roulette game.
+bake_atlas.py renders chips, the ball, pocket numbers and betting-table labels
+at several DPI buckets into roulette_game/assets/atlas; at runtime the game loads
+the one atlas matching its display scale instead of rasterising them per frame.
+"""
+
+import os
+import re
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ATLAS_DIR = os.path.join('roulette_game', 'assets', 'atlas')
+ATLAS_NAME = 'sprites'
+
+# Scale factors the atlas is baked at (sprites are drawn at base size x scale)
+DPI_BUCKETS = (1, 2, 3)
+
+# Base (scale 1) sizes in pixels, matching what main.py draws
+BALL_BASE_SIZE = 22
+BALL_SPRITE_MARGIN = 10  # Room for the offset drop shadows around the ball
+CHIP_BASE_SIZE = 40
+NUMBER_FONT_SIZE = 14  # Pocket numbers on the wheel
+GLYPH_FONT_SIZE = 14  # Digits for bet amounts
+GLYPHS = '0123456789$'
+
+# Betting table labels: (text, font size) - all bold white, tinted at draw time
+BETTING_LABELS = (
+    [('0', 20)] + [(str(n), 18) for n in range(1, 37)] +
+    [('1st 12', 17), ('2nd 12', 17), ('3rd 12', 17),
+     ('1 to 18', 16), ('EVEN', 16), ('RED', 16), ('BLACK', 16), ('ODD', 16), ('19 to 36', 16),
+     ('CLEAR BETS', 16), ('REBET', 16), ('2X', 16), ('SPIN', 18), ('CHIP:', 20)]
+)
+# The winning number is shown larger on the table - baked at that size so it stays sharp
+HIGHLIGHT_FONT_SIZE = 22
+HIGHLIGHT_LABELS = [str(n) for n in range(37)]
+
+
+def label_sprite(text):
+    """Sprite name for a betting table label, e.g. '1st 12' -> 'label_1st_12'"""
+    return 'label_' + re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+
+def highlight_sprite(text):
+    """Sprite name for a label in its highlighted (winning number) size"""
+    return label_sprite(text) + '_hi'
+
+
+def glyph_sprite(char):
+    return 'glyph_dollar' if char == '$' else f'glyph_{char}'
+
+
+def atlas_basename(bucket):
+    return f"{ATLAS_NAME}-{bucket}x"
+
+
+def pick_bucket(scale):
+    """Smallest baked bucket that is at least the display scale (so sprites are only ever shrunk)"""
+    for bucket in DPI_BUCKETS:
+        if bucket >= scale:
+            return bucket
+    return DPI_BUCKETS[-1]
+
+
+class SpriteSheet:
+    """One loaded atlas: sprite textures plus the scale they were baked at"""
+
+    def __init__(self, atlas, bucket):
+        self.atlas = atlas
+        self.bucket = bucket
+
+    def texture(self, name):
+        return self.atlas.textures.get(name)
+
+    def draw_size(self, texture, scale):
+        """Size to draw a sprite at for the given display scale"""
+        factor = scale / self.bucket
+        return texture.width * factor, texture.height * factor
+
+
+def load_sprites(scale):
+    """Load the atlas for the display scale, or None if it has not been baked"""
+    bucket = pick_bucket(scale)
+    path = os.path.join(APP_DIR, ATLAS_DIR, atlas_basename(bucket) + '.atlas')
+    if not os.path.exists(path):
+        print(f"✗ Sprite atlas not found: {path} - run bake_atlas.py; drawing sprites at runtime")
+        return None
+    try:
+        from kivy.atlas import Atlas
+        sheet = SpriteSheet(Atlas(path), bucket)
+        print(f"✓ Loaded sprite atlas {atlas_basename(bucket)} ({len(sheet.atlas.textures)} sprites)")
+        return sheet
+    except Exception as e:
+        print(f"✗ Failed to load sprite atlas {path}: {e}")
+        return None
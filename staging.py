@@ -0,0 +1,74 @@
+"""
+Frame-sliced construction for the roulette game UI.
+Work that is not needed for the first frame is queued as named steps and run a
+few at a time, within a per-frame time budget, after the first frame is shown.
+"""
+
+import time
+
+from kivy.clock import Clock
+
+# Time the builder may spend per frame (a step that runs over finishes; the next waits a frame)
+DEFAULT_FRAME_BUDGET = 0.004
+
+
+class StagedBuilder:
+    """Runs queued build steps across frames
+
+    add() queues a step, start() begins running them from the next frame and
+    finish() runs whatever is left immediately (for headless use). on_complete
+    is called once, after the last step.
+    """
+
+    def __init__(self, budget=DEFAULT_FRAME_BUDGET, on_complete=None):
+        self.budget = budget
+        self.on_complete = on_complete
+        self.steps = []  # (name, callable) still to run
+        self.timings = []  # (name, seconds) of the steps that have run
+        self.frames = 0
+        self.started_at = None
+        self.complete = False
+        self._event = None
+
+    def add(self, name, step):
+        self.steps.append((name, step))
+
+    def start(self):
+        if self._event is None and not self.complete:
+            self.started_at = time.perf_counter()
+            self._event = Clock.schedule_once(self._run_frame, 0)
+
+    def _run_step(self):
+        name, step = self.steps.pop(0)
+        begin = time.perf_counter()
+        step()
+        self.timings.append((name, time.perf_counter() - begin))
+
+    def _run_frame(self, dt):
+        self.frames += 1
+        deadline = time.perf_counter() + self.budget
+        while self.steps:
+            self._run_step()
+            if time.perf_counter() >= deadline:
+                break
+        if self.steps:
+            self._event = Clock.schedule_once(self._run_frame, 0)
+        else:
+            self._done()
+
+    def finish(self):
+        """Run every remaining step now"""
+        if self._event is not None:
+            self._event.cancel()
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+        while self.steps:
+            self._run_step()
+        if not self.complete:
+            self._done()
+
+    def _done(self):
+        self._event = None
+        self.complete = True
+        if self.on_complete:
+            self.on_complete()
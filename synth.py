@@ -0,0 +1,210 @@
+"""
+Procedural casino sound synthesis.
+Each generator returns a whole clip of float samples in [-1, 1] built with NumPy
+(or with the array module when NumPy is missing); write_wav() packs the clip to
+16-bit PCM and writes it with a single writeframes call.
+"""
+
+import math
+import random
+import sys
+from array import array
+
+try:
+    import wave
+    WAVE_AVAILABLE = True
+except ImportError:
+    WAVE_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+SAMPLE_RATE = 44100
+TWO_PI = 2 * math.pi
+
+# Bump when a generator's output changes so cached clips are resynthesised
+SYNTH_VERSION = 1
+
+
+def implementation():
+    """'numpy' or 'python' - the two paths draw different random numbers, so their clips differ"""
+    return 'numpy' if NUMPY_AVAILABLE else 'python'
+
+
+def _time_axis(duration, sample_rate):
+    """Sample indices and times for a clip"""
+    num_samples = int(sample_rate * duration)
+    if NUMPY_AVAILABLE:
+        i = np.arange(num_samples, dtype=np.float64)
+        return num_samples, i, i / sample_rate
+    i = range(num_samples)
+    return num_samples, i, [n / sample_rate for n in i]
+
+
+def beep(frequency=440, duration=0.5, volume=0.5, sample_rate=SAMPLE_RATE):
+    """Simple sine beep with a short fade at both ends to avoid clicks"""
+    n, i, t = _time_axis(duration, sample_rate)
+    if NUMPY_AVAILABLE:
+        envelope = np.minimum(np.minimum(i / 1000, (n - i) / 1000), 1.0)
+        return volume * envelope * np.sin(TWO_PI * frequency * t)
+    sin = math.sin
+    return [volume * min(k / 1000, (n - k) / 1000, 1.0) * sin(TWO_PI * frequency * tk)
+            for k, tk in zip(i, t)]
+
+
+def wheel_spin(duration=3.0, sample_rate=SAMPLE_RATE):
+    """Mechanical whirring of a spinning wheel (long enough to loop)"""
+    n, i, t = _time_axis(duration, sample_rate)
+    if NUMPY_AVAILABLE:
+        # Base low frequency rumble
+        base_freq = 80 + 20 * np.sin(TWO_PI * 0.5 * t)
+        base_wave = 0.3 * np.sin(TWO_PI * base_freq * t)
+        # Higher frequency whirring that changes pitch
+        whir_freq = 200 + 50 * np.sin(TWO_PI * 2 * t)
+        whir_wave = 0.2 * np.sin(TWO_PI * whir_freq * t)
+        # Mechanical clicking/rumbling
+        click_freq = 1500 * (1 + 0.5 * np.sin(TWO_PI * 3 * t))
+        click_wave = 0.1 * np.sin(TWO_PI * click_freq * t) * np.exp(-t * 2)
+        # Quick fade in, slow fade out
+        envelope = np.minimum(0.8, i / (sample_rate * 0.1))
+        envelope *= np.maximum(0.1, 1 - (i / n) * 0.5)
+        return envelope * (base_wave + whir_wave + click_wave)
+    sin, exp = math.sin, math.exp
+    samples = []
+    for k, tk in zip(i, t):
+        base_wave = 0.3 * sin(TWO_PI * (80 + 20 * sin(TWO_PI * 0.5 * tk)) * tk)
+        whir_wave = 0.2 * sin(TWO_PI * (200 + 50 * sin(TWO_PI * 2 * tk)) * tk)
+        click_wave = 0.1 * sin(TWO_PI * 1500 * (1 + 0.5 * sin(TWO_PI * 3 * tk)) * tk) * exp(-tk * 2)
+        envelope = min(0.8, k / (sample_rate * 0.1)) * max(0.1, 1 - (k / n) * 0.5)
+        samples.append(envelope * (base_wave + whir_wave + click_wave))
+    return samples
+
+
+def ball_launch(duration=0.15, sample_rate=SAMPLE_RATE):
+    """Sharp mechanical click with a metallic ring"""
+    n, i, t = _time_axis(duration, sample_rate)
+    click_samples = sample_rate * 0.01
+    if NUMPY_AVAILABLE:
+        metallic = 0.7 * np.sin(TWO_PI * 2500 * t) * np.exp(-t * 50)
+        click = np.where(i < click_samples, 0.3, 0.0)
+        return metallic + click
+    sin, exp = math.sin, math.exp
+    return [0.7 * sin(TWO_PI * 2500 * tk) * exp(-tk * 50) + (0.3 if k < click_samples else 0)
+            for k, tk in zip(i, t)]
+
+
+def ball_drop(duration=0.4, sample_rate=SAMPLE_RATE):
+    """Cascading metallic bounces"""
+    n, i, t = _time_axis(duration, sample_rate)
+    if NUMPY_AVAILABLE:
+        bounce1 = 0.4 * np.sin(TWO_PI * 800 * t) * np.exp(-t * 8)
+        bounce2 = np.where(t > 0.1, 0.2 * np.sin(TWO_PI * 1200 * t) * np.exp(-(t - 0.1) * 12), 0.0)
+        bounce3 = np.where(t > 0.2, 0.1 * np.sin(TWO_PI * 600 * t) * np.exp(-(t - 0.2) * 15), 0.0)
+        return bounce1 + bounce2 + bounce3
+    sin, exp = math.sin, math.exp
+    samples = []
+    for tk in t:
+        sample = 0.4 * sin(TWO_PI * 800 * tk) * exp(-tk * 8)
+        if tk > 0.1:
+            sample += 0.2 * sin(TWO_PI * 1200 * tk) * exp(-(tk - 0.1) * 12)
+        if tk > 0.2:
+            sample += 0.1 * sin(TWO_PI * 600 * tk) * exp(-(tk - 0.2) * 15)
+        samples.append(sample)
+    return samples
+
+
+def ball_settle(duration=0.08, sample_rate=SAMPLE_RATE):
+    """Final metallic ping as the ball settles"""
+    n, i, t = _time_axis(duration, sample_rate)
+    if NUMPY_AVAILABLE:
+        ping = 0.8 * np.sin(TWO_PI * 1800 * t) * np.exp(-t * 80)
+        undertone = 0.2 * np.sin(TWO_PI * 900 * t) * np.exp(-t * 40)
+        return ping + undertone
+    sin, exp = math.sin, math.exp
+    return [0.8 * sin(TWO_PI * 1800 * tk) * exp(-tk * 80) + 0.2 * sin(TWO_PI * 900 * tk) * exp(-tk * 40)
+            for tk in t]
+
+
+def casino_ambiance(duration=2.0, seed=0, sample_rate=SAMPLE_RATE):
+    """Subtle crowd murmur with occasional chip sounds"""
+    n, i, t = _time_axis(duration, sample_rate)
+    if NUMPY_AVAILABLE:
+        rng = np.random.default_rng(seed)
+        noise1 = 0.05 * np.sin(TWO_PI * rng.uniform(100, 200, n) * t)
+        noise2 = 0.03 * np.sin(TWO_PI * rng.uniform(150, 250, n) * t)
+        chip_sound = np.where(rng.random(n) < 0.01,
+                              0.02 * np.sin(TWO_PI * 800 * t) * np.exp(-(t % 0.5) * 20), 0.0)
+        return (noise1 + noise2 + chip_sound) * 0.3
+    rng = random.Random(seed)
+    uniform, rand = rng.uniform, rng.random
+    sin, exp = math.sin, math.exp
+    samples = []
+    for tk in t:
+        noise1 = 0.05 * sin(TWO_PI * uniform(100, 200) * tk)
+        noise2 = 0.03 * sin(TWO_PI * uniform(150, 250) * tk)
+        chip_sound = 0.02 * sin(TWO_PI * 800 * tk) * exp(-(tk % 0.5) * 20) if rand() < 0.01 else 0
+        samples.append((noise1 + noise2 + chip_sound) * 0.3)
+    return samples
+
+
+def winning(duration=1.5, sample_rate=SAMPLE_RATE):
+    """Celebratory C-E-G arpeggio with sparkle and a closing 'ta-da'"""
+    n, i, t = _time_axis(duration, sample_rate)
+    freq1, freq2, freq3 = 261.63, 329.63, 392.00  # C4, E4, G4
+    tada_freq = 523.25  # C5
+    if NUMPY_AVAILABLE:
+        wave1 = np.where(t < 0.5, 0.3 * np.sin(TWO_PI * freq1 * t),
+                         np.where(t < 1.0, 0.3 * np.sin(TWO_PI * freq2 * (t - 0.5)),
+                                  0.3 * np.sin(TWO_PI * freq3 * (t - 1.0))))
+        sparkle = 0.1 * np.sin(TWO_PI * freq3 * 2 * t) * np.exp(-t * 2)
+        tada = np.where(t > 1.2, 0.2 * np.sin(TWO_PI * tada_freq * (t - 1.2)) * np.exp(-(t - 1.2) * 5), 0.0)
+        envelope = np.minimum(1.0, i / (sample_rate * 0.1))
+        envelope *= np.maximum(0.0, 1.0 - (i / n) * 0.3)
+        return envelope * (wave1 + sparkle + tada)
+    sin, exp = math.sin, math.exp
+    samples = []
+    for k, tk in zip(i, t):
+        if tk < 0.5:
+            wave1 = 0.3 * sin(TWO_PI * freq1 * tk)
+        elif tk < 1.0:
+            wave1 = 0.3 * sin(TWO_PI * freq2 * (tk - 0.5))
+        else:
+            wave1 = 0.3 * sin(TWO_PI * freq3 * (tk - 1.0))
+        sparkle = 0.1 * sin(TWO_PI * freq3 * 2 * tk) * exp(-tk * 2)
+        tada = 0.2 * sin(TWO_PI * tada_freq * (tk - 1.2)) * exp(-(tk - 1.2) * 5) if tk > 1.2 else 0
+        envelope = min(1.0, k / (sample_rate * 0.1)) * max(0.0, 1.0 - (k / n) * 0.3)
+        samples.append(envelope * (wave1 + sparkle + tada))
+    return samples
+
+
+GENERATORS = {
+    'beep': beep,
+    'wheel_spin': wheel_spin,
+    'ball_launch': ball_launch,
+    'ball_drop': ball_drop,
+    'ball_settle': ball_settle,
+    'casino_ambiance': casino_ambiance,
+    'winning': winning,
+}
+
+
+def to_pcm16(samples):
+    """Convert float samples to little-endian 16-bit PCM bytes (clipped, truncated like int())"""
+    if NUMPY_AVAILABLE and isinstance(samples, np.ndarray):
+        return np.clip(samples * 32767, -32768, 32767).astype('<i2').tobytes()
+    pcm = array('h', [max(-32768, min(32767, int(s * 32767))) for s in samples])
+    if sys.byteorder == 'big':
+        pcm.byteswap()
+    return pcm.tobytes()
+
+
+def write_wav(filename, samples, sample_rate=SAMPLE_RATE):
+    """Write a mono 16-bit WAV file in one bulk writeframes call"""
+    with wave.open(filename, 'wb') as wav_file:
+        wav_file.setnchannels(1)  # Mono
+        wav_file.setsampwidth(2)  # 16-bit
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(to_pcm16(samples))
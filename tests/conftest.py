@@ -0,0 +1,38 @@
+"""
+Shared test setup. The game modules live in the repository root; tests that
+need Kivy run it headless (mock GL) and skip when it is not installed.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Headless Kivy: no GL context, no log to the console, no parsing of pytest's arguments
+os.environ.setdefault('KIVY_GL_BACKEND', 'mock')
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+# A configured tier skips the startup benchmark and the governor
+os.environ.setdefault('ROULETTE_QUALITY', 'low')
+
+
+@pytest.fixture
+def main_module(tmp_path, monkeypatch):
+    """main.py, with the session file kept out of the repository"""
+    pytest.importorskip('kivy')
+    import main
+    monkeypatch.setattr(main, 'SESSION_FILE', str(tmp_path / 'session.json'))
+    return main
+
+
+@pytest.fixture
+def game(main_module, monkeypatch):
+    """A RouletteGame with a fixed seed and its betting table fully built"""
+    monkeypatch.setenv('ROULETTE_RNG_SEED', '1234')
+    game = main_module.RouletteGame()
+    game.ui_builder.finish()
+    game.size = (450, 700)
+    yield game
+    game._update_event.cancel()
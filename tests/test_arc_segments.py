@@ -0,0 +1,51 @@
+import math
+
+import pytest
+
+pytest.importorskip('kivy')
+
+import quality
+from quality import QUALITY_PRESETS, arc_segments
+
+POCKET_ANGLE = 2 * math.pi / 37
+RADII = [1, 2.5, 10, 40, 95.3, 160, 400, 1200]
+ERRORS = sorted({preset.arc_error for preset in QUALITY_PRESETS.values()})
+
+
+def chord_error(radius, angle, segments):
+    return radius * (1 - math.cos(angle / segments / 2))
+
+
+@pytest.mark.parametrize('max_error', ERRORS)
+def test_more_segments_for_larger_radii(max_error):
+    counts = [arc_segments(radius, POCKET_ANGLE, max_error) for radius in RADII]
+    assert counts == sorted(counts)
+    assert counts[-1] > counts[0]
+
+
+@pytest.mark.parametrize('radius', RADII[2:])
+def test_fewer_segments_for_looser_error(radius):
+    counts = [arc_segments(radius, POCKET_ANGLE, max_error) for max_error in ERRORS]
+    assert counts == sorted(counts, reverse=True)
+
+
+@pytest.mark.parametrize('angle', [POCKET_ANGLE, math.pi / 2, 2 * math.pi])
+@pytest.mark.parametrize('max_error', ERRORS)
+@pytest.mark.parametrize('radius', RADII)
+def test_chords_stay_within_error(radius, max_error, angle):
+    segments = arc_segments(radius, angle, max_error)
+    if math.ceil(radius) <= max_error:  # The whole arc is within max_error of any chord
+        assert segments == 1
+        return
+    assert chord_error(radius, angle, segments) <= max_error
+    if segments > 1:  # And no more segments than needed
+        assert chord_error(math.ceil(radius), angle, segments - 1) > max_error
+
+
+def test_cached_count_is_stable(monkeypatch):
+    monkeypatch.setattr(quality, '_arc_segments', {})
+    first = arc_segments(95.3, POCKET_ANGLE, 0.5)
+    assert quality._arc_segments == {(96, POCKET_ANGLE, 0.5): first}
+    assert arc_segments(95.3, POCKET_ANGLE, 0.5) == first
+    assert arc_segments(95.9, POCKET_ANGLE, 0.5) == first  # Same whole-pixel radius, same entry
+    assert len(quality._arc_segments) == 1
@@ -0,0 +1,177 @@
+import sys
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('kivy')
+
+from kivy.clock import Clock
+
+from audio import SoundBank, SoundEffects
+
+
+class FakeSound:
+    length = 0.01
+
+    def __init__(self, path):
+        self.path = path
+        self.state = 'stop'
+        self.plays = 0
+        self.stops = 0
+
+    def play(self):
+        self.state = 'play'
+        self.plays += 1
+
+    def stop(self):
+        if self.state == 'play':
+            self.stops += 1
+        self.state = 'stop'
+
+    def unload(self):
+        pass
+
+
+class RecordingLoader:
+    """Loader that counts loads per path; paths in `hold` wait until release() is called"""
+
+    def __init__(self, hold=()):
+        self.loads = []
+        self.hold = set(hold)
+        self.released = threading.Event()
+
+    def __call__(self, path):
+        if path in self.hold:
+            self.released.wait(5)
+        self.loads.append(path)
+        return FakeSound(path)
+
+
+def wait_until_ready(bank, timeout=5.0):
+    """Run the main thread's side of loading until every handle is ready"""
+    deadline = time.monotonic() + timeout
+    while not bank.all_ready:
+        if time.monotonic() > deadline:
+            raise AssertionError(f"{sum(not h.ready for h in bank.handles.values())} sounds never loaded")
+        Clock.tick()
+        time.sleep(0.001)
+
+
+def test_requests_made_while_loading_are_loaded():
+    loader = RecordingLoader(hold={'first.wav'})
+    bank = SoundBank(mode='thread', loader=loader)
+    bank.request('first.wav')
+    bank.start()
+    second = bank.request('second.wav')  # The loader is busy with the first
+    loader.released.set()
+    wait_until_ready(bank)
+    assert second.ready
+    # Each request arrives just as the loader finishes the previous one and finds the queue
+    # empty; switching threads as often as possible makes every interleaving likely
+    paths = [f'late-{i}.wav' for i in range(300)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for path in paths:
+            loaded = len(loader.loads)
+            bank.request(path)
+            deadline = time.monotonic() + 1
+            while len(loader.loads) == loaded and time.monotonic() < deadline:
+                time.sleep(0)
+            assert len(loader.loads) > loaded, f"{path} was queued but never loaded"
+    finally:
+        sys.setswitchinterval(interval)
+    wait_until_ready(bank)
+    assert sorted(loader.loads[2:]) == sorted(paths)
+
+
+def test_evicted_sound_is_queued_once():
+    loader = RecordingLoader()
+    bank = SoundBank(mode='deferred', loader=loader)
+    handle = bank.request('coin.wav')
+    bank.start()
+    Clock.tick()
+    assert handle.ready
+    bank.unload_idle()
+    for _ in range(3):
+        handle.play()  # Each play of an evicted sound asks for a reload
+    for _ in range(3):
+        Clock.tick()
+    assert loader.loads == ['coin.wav', 'coin.wav']
+    assert handle.sound.plays == 1
+
+
+def test_deferred_mode_loads_one_sound_per_frame():
+    loader = RecordingLoader()
+    bank = SoundBank(mode='deferred', loader=loader)
+    bank.start()
+    for i in range(5):
+        bank.request(f'clip-{i}.wav')  # Each request in the same frame asks for a load
+    for frame in range(1, 6):
+        Clock.tick()
+        assert len(loader.loads) == frame
+    Clock.tick()
+    assert len(loader.loads) == 5 and bank.all_ready
+
+
+def loaded_pool(voices=3, **kwargs):
+    loader = RecordingLoader()
+    bank = SoundBank(mode='deferred', loader=loader)
+    pool = SoundEffects(bank).add('chip', 'chip.wav', voices=voices, **kwargs)
+    bank.start()
+    wait_until_ready(bank)
+    return loader, pool, [voice.sound for voice in pool.voices]
+
+
+def tap(pool, times=1):
+    """Trigger the pool `times` in the current frame, then move to the next frame"""
+    for _ in range(times):
+        pool.play()
+    Clock.tick()
+
+
+def test_oldest_policy_prefers_idle_voices_then_steals_the_oldest():
+    loader, pool, sounds = loaded_pool()
+    for _ in range(3):
+        tap(pool)
+    assert [s.plays for s in sounds] == [1, 1, 1]
+
+    tap(pool)  # All busy - the first voice started longest ago
+    assert [s.plays for s in sounds] == [2, 1, 1] and sounds[0].stops == 1
+
+    sounds[2].stop()  # Finished playing
+    tap(pool)
+    assert [s.plays for s in sounds] == [2, 1, 2] and sounds[1].stops == 0
+    tap(pool)  # Voice 1 is now the oldest
+    assert [s.plays for s in sounds] == [2, 2, 2] and sounds[1].stops == 1
+
+
+def test_round_robin_policy_cycles_through_voices():
+    loader, pool, sounds = loaded_pool(policy='round_robin')
+    order = []
+    for _ in range(7):
+        before = [s.plays for s in sounds]
+        tap(pool)
+        sounds[0].stop()  # An idle voice does not jump the queue
+        order.append(next(i for i, s in enumerate(sounds) if s.plays > before[i]))
+    assert order == [0, 1, 2, 0, 1, 2, 0]
+
+
+@pytest.mark.parametrize('max_per_frame', [1, 2])
+def test_extra_triggers_in_one_frame_are_dropped(max_per_frame):
+    loader, pool, sounds = loaded_pool(max_per_frame=max_per_frame)
+    tap(pool, times=5)
+    assert sum(s.plays for s in sounds) == max_per_frame
+    tap(pool, times=5)
+    assert sum(s.plays for s in sounds) == max_per_frame * 2
+
+
+def test_burst_reuses_the_preloaded_voices():
+    loader, pool, sounds = loaded_pool(voices=4)
+    loads = list(loader.loads)
+    for _ in range(20):
+        tap(pool)
+    assert loader.loads == loads  # No player was created for the burst
+    assert [voice.sound for voice in pool.voices] == sounds
+    assert [s.plays for s in sounds] == [5, 5, 5, 5]
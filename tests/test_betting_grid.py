@@ -0,0 +1,85 @@
+import pytest
+
+pytest.importorskip('kivy')
+
+from kivy.clock import Clock
+
+
+def settle():
+    for _ in range(3):
+        Clock.tick()
+
+
+def test_bet_relayouts_only_its_cell(game, monkeypatch):
+    grid = game.betting_grid
+    settle()
+    assert not grid._dirty_text
+    cached = dict(grid._text_cache)
+
+    laid_out = []
+    cell_vertices = grid._cell_vertices
+
+    def spy(cell):
+        laid_out.append(cell.cell_id)
+        return cell_vertices(cell)
+
+    monkeypatch.setattr(grid, '_cell_vertices', spy)
+    game.place_bet('red')
+    game.place_bet('red')  # Same frame - still one re-layout
+    assert grid._dirty_text == {'red'}
+
+    Clock.tick()
+    assert laid_out == ['red']
+    assert not grid._dirty_text
+    assert grid._text_cache['red'] is not cached['red']
+    assert all(grid._text_cache[cell_id] is groups
+               for cell_id, groups in cached.items() if cell_id != 'red')
+
+    Clock.tick()
+    assert laid_out == ['red']  # Nothing left to flush
+
+
+def brute_force_hits(grid, x, y):
+    """Every interactive cell whose rect contains the point, like collide_point on each"""
+    x, y = x - grid.x, y - grid.y  # Into the grid's space, as cell_at does
+    hits = []
+    for cell in grid.cells.values():
+        cx, cy, w, h = cell.rect
+        if cell.action is not None and cx <= x <= cx + w and cy <= y <= cy + h:
+            hits.append(cell)
+    return hits
+
+
+def probe_points(grid, step=7):
+    """A regular sweep of the widget plus every cell's corners, edge midpoints and the gaps just past them"""
+    points = [(grid.x + i, grid.y + j)
+              for i in range(-step, int(grid.width) + step, step)
+              for j in range(-step, int(grid.height) + step, step)]
+    for cell in grid.cells.values():
+        x, y, w, h = cell.rect
+        x, y = x + grid.x, y + grid.y
+        for px in (x - 0.5, x, x + w / 2, x + w, x + w + 0.5):
+            for py in (y - 0.5, y, y + h / 2, y + h, y + h + 0.5):
+                points.append((px, py))
+    return points
+
+
+@pytest.mark.parametrize('layouts', [[((0, 0), (450, 600)), ((12, 34), (333, 517))],
+                                     [((5, 80), (1080, 700)), ((0, 0), (450, 600))]])
+def test_cell_at_matches_brute_force(layouts):
+    from betting_grid import BettingGrid
+    actions = {name: (lambda *args: None) for name in ('bet', 'chip', 'clear', 'rebet', 'double', 'spin')}
+    grid = BettingGrid(actions)
+    for pos, size in layouts:
+        grid.pos, grid.size = pos, size
+        assert grid._layout_size == size
+        gaps = 0
+        for x, y in probe_points(grid):
+            hits = brute_force_hits(grid, x, y)
+            found = grid.cell_at(x, y)
+            if hits:
+                assert found in hits, (pos, size, x, y)
+            else:
+                assert found is None, (pos, size, x, y, found.cell_id)
+            gaps += not hits and grid.collide_point(x, y)
+        assert gaps  # Points between cells were probed
@@ -0,0 +1,26 @@
+import pytest
+
+from benchmark import LAYER_BUDGETS, WHEEL_SIZES
+
+
+@pytest.mark.parametrize('size', WHEEL_SIZES, ids=lambda size: f'{size[0]}x{size[1]}')
+def test_spinning_frame_layers_fit_their_budgets(game, size):
+    from kivy.graphics.texture import Texture
+    from main import DRAW_LAYERS
+    from quality import QUALITY_PRESETS
+    wheel = game.wheel
+    wheel.quality = QUALITY_PRESETS['ultra']  # Budgets are for the full look
+    wheel.background_texture = Texture.create(size=(4, 4))  # As once the wood texture has loaded
+    wheel.size = size
+    wheel.start_spin()
+    wheel.launch_ball()
+    wheel.advance(1.0)  # Ball well into its spin
+    assert wheel.ball_active and wheel.ball_on_bumper
+
+    wheel.canvas.clear()
+    wheel.draw()
+    counts = wheel.layer_counts()
+    assert set(counts) == set(DRAW_LAYERS) == set(LAYER_BUDGETS)
+    over = {layer: count for layer, count in counts.items() if count > LAYER_BUDGETS[layer]}
+    assert not over, f"over budget at {size}: {over}"
+    assert all(counts[layer] > 0 for layer in ('felt', 'bumper', 'rim', 'hub', 'pockets', 'ball'))
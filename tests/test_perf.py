@@ -0,0 +1,26 @@
+from perf import MemoryProfiler
+
+
+def test_sampled_frame_covers_every_phase(game):
+    game.place_bet('red')
+    game.spin_wheel()
+    while not game.wheel.ball_has_dropped:
+        game.update(1 / 30)
+
+    # Every frame is sampled from here until the one that pays out the round (long frames
+    # of 12 physics steps keep the traced frames few)
+    profiler = MemoryProfiler(trace_allocations=True, sample_interval=0)
+    game.wheel.probes.append(profiler)
+    try:
+        for _ in range(1000):
+            game.update(1 / 5)
+            if game.recorder.record['rounds']:
+                break
+        assert game.recorder.record['rounds']
+        profiler.sample_interval = 3600
+        game.update(1 / 30)  # The next frame's physics phase ends the sample
+    finally:
+        profiler.uninstall()
+        game.wheel.probes.remove(profiler)
+    assert set(profiler.allocated) == {'physics', 'draw', 'payouts', 'other'}
+    assert profiler.frame_lines
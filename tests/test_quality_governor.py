@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+pytest.importorskip('kivy')
+
+from quality import (COOLDOWN_WINDOWS, GOVERNOR_WINDOW, QUALITY_PRESETS, UP_WINDOWS,
+                     QualityGovernor)
+
+BUDGET = 1 / 60
+SMOOTH = BUDGET  # One refresh per frame
+DROPPED = BUDGET * 2  # Missed a refresh
+LIGHT_WORK = BUDGET * 0.1
+
+
+class FakeWheel:
+    def __init__(self, tier):
+        self.quality = QUALITY_PRESETS[tier]
+        self.tick = 0
+        self.size = (450, 420)
+
+
+def governor(tier, **kwargs):
+    wheel = FakeWheel(tier)
+    return wheel, QualityGovernor(wheel, budget=BUDGET, log_path=kwargs.pop('log_path', ''), **kwargs)
+
+
+def window(gov, dt=SMOOTH, work=LIGHT_WORK, spikes=0, active=True):
+    """Feed one full window of spin frames, the first `spikes` of them dropped"""
+    for frame in range(GOVERNOR_WINDOW):
+        gov.frame(DROPPED if frame < spikes else dt, work, active)
+
+
+def test_sustained_dropped_frames_step_down():
+    wheel, gov = governor('ultra')
+    for _ in range(GOVERNOR_WINDOW - 1):
+        gov.frame(DROPPED, LIGHT_WORK, True)
+    assert wheel.quality.name == 'ultra'  # Judged only once the window is full
+    gov.frame(DROPPED, LIGHT_WORK, True)
+    assert wheel.quality.name == 'high'
+    assert gov.decisions[-1]['step'] == 'down'
+
+
+def test_single_spike_changes_nothing():
+    wheel, gov = governor('high')
+    window(gov, spikes=1)
+    assert wheel.quality.name == 'high' and not gov.decisions
+
+
+def test_idle_frames_and_stalls_are_ignored():
+    wheel, gov = governor('ultra')
+    window(gov, dt=DROPPED, active=False)  # Wheel at rest
+    window(gov, dt=1.0)  # Loading or app switching
+    assert wheel.quality.name == 'ultra' and not gov.decisions
+
+
+def test_step_up_needs_a_run_of_headroom_windows():
+    wheel, gov = governor('medium')
+    for _ in range(UP_WINDOWS - 1):
+        window(gov)
+    assert wheel.quality.name == 'medium'
+    window(gov)
+    assert wheel.quality.name == 'high'
+    assert gov.decisions[-1]['step'] == 'up'
+
+
+def test_slow_updates_do_not_count_as_headroom():
+    wheel, gov = governor('medium')
+    for _ in range(UP_WINDOWS * 2):
+        window(gov, work=BUDGET * 0.8)  # No dropped frames, but little time to spare
+    assert wheel.quality.name == 'medium'
+
+
+def test_rebound_doubles_the_wait_and_cooldown_holds_the_tier():
+    wheel, gov = governor('high')
+    for _ in range(UP_WINDOWS):
+        window(gov)
+    assert wheel.quality.name == 'ultra'
+
+    for _ in range(COOLDOWN_WINDOWS):
+        window(gov, dt=DROPPED)  # Ignored while the new tier settles
+    assert wheel.quality.name == 'ultra'
+    window(gov, dt=DROPPED)
+    assert wheel.quality.name == 'high'
+    assert gov.up_windows == UP_WINDOWS * 2  # A rebound
+
+    for _ in range(COOLDOWN_WINDOWS + UP_WINDOWS * 2 - 1):
+        window(gov)
+    assert wheel.quality.name == 'high'  # Would have flipped back up without the doubling
+    window(gov)
+    assert wheel.quality.name == 'ultra'
+    assert [d['step'] for d in gov.decisions] == ['up', 'down', 'up']
+
+
+def test_decisions_are_logged_as_json_lines(tmp_path):
+    log = tmp_path / 'governor.jsonl'
+    wheel, gov = governor('ultra', log_path=str(log))
+    window(gov, dt=DROPPED)
+    for _ in range(COOLDOWN_WINDOWS + 1):
+        window(gov, dt=DROPPED)
+    lines = [json.loads(line) for line in log.read_text(encoding='utf-8').splitlines()]
+    assert lines == gov.decisions
+    assert [(d['old'], d['new']) for d in lines] == [('ultra', 'high'), ('high', 'medium')]
+    assert lines[0]['drop_rate'] == 1.0 and lines[0]['frames'] == GOVERNOR_WINDOW
@@ -0,0 +1,71 @@
+import random
+
+from engine import WheelPhysics, TableState
+from replay import RoundRecorder, replay, verify
+from rng import RNGService
+
+# Frame lengths a live game sees - 60 Hz with dropped frames (one to four physics steps per frame)
+FRAME_TIMES = (1 / 60, 1 / 30, 1 / 20, 1 / 15)
+
+
+def play_spin(update, wheel, frames, max_frames=5000):
+    """Call update() with varying frame times until the spin is over"""
+    for _ in range(max_frames):
+        if wheel.idle:
+            return
+        update(frames.choice(FRAME_TIMES))
+    raise AssertionError("spin did not finish")
+
+
+class LiveTable(TableState):
+    """RouletteGame's loop without widgets: several physics steps per frame, then one poll"""
+
+    verbose = False
+
+    def __init__(self, seed):
+        self.init_table(WheelPhysics(rng=RNGService(seed, 'python').stream('table-1'), verbose=False))
+        self.recorder = RoundRecorder(seed, 'python')
+
+    def bet_and_spin(self):
+        for bet_type in ('red', 'number_17'):
+            self.recorder.event(self.wheel.tick, 'bet', bet_type)
+            self.apply_bet(bet_type)
+        self.recorder.event(self.wheel.tick, 'spin')
+        self.apply_spin()
+
+    def update(self, dt):
+        self.wheel.advance(dt)
+        win_number = self.poll_round()
+        if win_number is not None:
+            self.settle_round(win_number)
+            self.recorder.round_result(self.wheel.settle_tick, win_number, self.balance)
+            self.recorder.event(self.wheel.tick, 'finish')
+            self.finish_round()
+
+
+def test_frame_polled_rounds_replay():
+    for seed in range(40):
+        table = LiveTable(seed)
+        frames = random.Random(seed)
+        for _ in range(2):
+            table.bet_and_spin()
+            play_spin(table.update, table.wheel, frames)
+        record = table.recorder.record
+        assert record['rounds']
+        assert replay(record) == record['rounds'], f"seed {seed}"
+
+
+def test_game_update_records_replayable_rounds(game):
+    frames = random.Random(7)
+    for _ in range(3):
+        game.place_bet('red')
+        game.place_bet('dozen2')
+        game.spin_wheel()
+        play_spin(game.update, game.wheel, frames)
+        if game.bets:
+            # What the clear scheduled 5 s after a win does
+            game.record_input('finish')
+            game.finish_round()
+    record = game.recorder.record
+    assert len(record['rounds']) == 3
+    assert verify(record)
@@ -0,0 +1,57 @@
+import pytest
+
+from rng import RNGService, numpy_available
+
+BATCH = 7  # Small batches so the draws below cross several refills
+
+REPRODUCIBLE = [
+    'python',
+    pytest.param('pcg64', marks=pytest.mark.skipif(not numpy_available(), reason="needs numpy")),
+]
+
+
+def draws(service, name, count):
+    stream = service.stream(name)
+    return [stream.random() for _ in range(count)]
+
+
+@pytest.mark.parametrize('backend', REPRODUCIBLE)
+def test_same_seed_and_name_replay(backend):
+    first = draws(RNGService(seed=42, backend=backend, batch_size=BATCH), 'table-1', BATCH * 5)
+    second = draws(RNGService(seed=42, backend=backend, batch_size=BATCH), 'table-1', BATCH * 5)
+    assert first == second
+    assert RNGService(seed=42, backend=backend).backend_name == backend  # No silent fallback
+
+
+@pytest.mark.parametrize('backend', REPRODUCIBLE)
+def test_batch_size_does_not_change_the_sequence(backend):
+    small = draws(RNGService(seed=42, backend=backend, batch_size=BATCH), 'wheel', 50)
+    large = draws(RNGService(seed=42, backend=backend), 'wheel', 50)
+    assert small == large
+
+
+@pytest.mark.parametrize('backend', REPRODUCIBLE)
+@pytest.mark.parametrize('skipped', [0, 1, BATCH - 1, BATCH, BATCH + 1, BATCH * 3])
+def test_skip_and_draws_stay_in_step_across_refills(backend, skipped):
+    reference = draws(RNGService(seed=7, backend=backend, batch_size=BATCH), 'wheel', skipped + BATCH * 2)
+
+    stream = RNGService(seed=7, backend=backend, batch_size=BATCH).stream('wheel')
+    stream.skip(skipped)
+    assert stream.draws == skipped
+    assert [stream.random() for _ in range(BATCH * 2)] == reference[skipped:]
+    assert stream.draws == skipped + BATCH * 2
+
+
+@pytest.mark.parametrize('backend', REPRODUCIBLE)
+def test_named_streams_are_independent(backend):
+    service = RNGService(seed=42, backend=backend, batch_size=BATCH)
+    assert draws(service, 'table-1', 20) != draws(service, 'table-2', 20)
+    assert RNGService(seed=43, backend=backend).stream('table-1').random() != \
+        RNGService(seed=42, backend=backend).stream('table-1').random()
+
+
+def test_secrets_backend_does_not_replay_a_seed():
+    first = RNGService(seed=42, backend='secrets', batch_size=BATCH)
+    second = RNGService(seed=42, backend='secrets', batch_size=BATCH)
+    assert not first.reproducible
+    assert draws(first, 'table-1', 20) != draws(second, 'table-1', 20)
@@ -0,0 +1,44 @@
+import os
+
+from replay import replay
+
+
+def spin_until_idle(game, max_frames=5000):
+    for _ in range(max_frames):
+        if game.wheel.idle:
+            return
+        game.update(1 / 30)
+    raise AssertionError("spin did not finish")
+
+
+def test_restored_spin_is_recorded_and_paid_after_staging(main_module, monkeypatch):
+    monkeypatch.setenv('ROULETTE_RNG_SEED', '99')
+    game = main_module.RouletteGame()
+    game.ui_builder.finish()
+    game.place_bet('red')
+    game.place_bet('number_5')
+    game.spin_wheel()
+    for _ in range(20):
+        game.update(1 / 30)
+    game.pause()
+    assert os.path.exists(main_module.SESSION_FILE)
+
+    # Killed in the background: the next launch restores with a different seed
+    monkeypatch.setenv('ROULETTE_RNG_SEED', '100')
+    restored = main_module.RouletteGame()
+    try:
+        assert restored.bets == {'red': 5, 'number_5': 5}
+        assert not restored.wheel.idle
+        record = restored.recorder.record
+        assert record['state']['bets'] == restored.bets
+
+        # The spin finishes before the betting table is built - it must wait for it
+        spin_until_idle(restored)
+        assert record['rounds'] == []
+        assert restored.previous_numbers == game.previous_numbers
+
+        restored.ui_builder.finish()
+        assert len(record['rounds']) == 1
+        assert replay(record) == record['rounds']
+    finally:
+        restored._update_event.cancel()
@@ -0,0 +1,37 @@
+import pytest
+
+import synth
+from sound_cache import SoundCache
+
+np = pytest.importorskip('numpy')
+
+
+def pure_python(monkeypatch):
+    monkeypatch.setattr(synth, 'NUMPY_AVAILABLE', False)
+
+
+def test_cache_key_names_the_implementation(tmp_path, monkeypatch):
+    cache = SoundCache(cache_dir=str(tmp_path))
+    numpy_key = cache.key('casino_ambiance', {'duration': 0.1})
+    pure_python(monkeypatch)
+    assert cache.key('casino_ambiance', {'duration': 0.1}) != numpy_key
+
+
+def test_each_implementation_gets_its_own_clip(tmp_path, monkeypatch):
+    cache = SoundCache(cache_dir=str(tmp_path))
+    numpy_clip = cache.get('casino_ambiance', duration=0.1)
+    pure_python(monkeypatch)
+    python_clip = cache.get('casino_ambiance', duration=0.1)
+    assert python_clip != numpy_clip
+    assert cache.misses == 2
+    with open(numpy_clip, 'rb') as a, open(python_clip, 'rb') as b:
+        assert a.read() != b.read()
+
+
+@pytest.mark.parametrize('generator', sorted(set(synth.GENERATORS) - {'casino_ambiance'}))
+def test_deterministic_generators_match_across_implementations(generator, monkeypatch):
+    vectorised = synth.GENERATORS[generator]()
+    pure_python(monkeypatch)
+    fallback = synth.GENERATORS[generator]()
+    assert len(vectorised) == len(fallback)
+    assert np.allclose(vectorised, fallback, rtol=0, atol=1e-9)
@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip('kivy')
+
+from kivy.core.window import Window  # noqa: F401 - text is rendered through the window's GL context
+
+from text_cache import TextTextureCache
+
+WHITE = (1, 1, 1, 1)
+
+
+def texture_bytes(texture):
+    return texture.width * texture.height * 4
+
+
+def test_repeated_lookup_is_a_hit():
+    cache = TextTextureCache()
+    first = cache.texture('17', 18, False, WHITE)
+    assert first is not None
+    assert cache.texture('17', 18, False, [1, 1, 1, 1]) is first  # Colour lists are keyed as tuples
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    for style in [(20, False, WHITE), (18, True, WHITE), (18, False, (1, 0, 0, 1))]:
+        assert cache.texture('17', *style) is not first  # Each style is its own texture
+    assert (cache.hits, cache.misses, len(cache)) == (1, 4, 4)
+    assert cache.resident_bytes == sum(texture_bytes(t) for t in cache._textures.values())
+
+
+def test_over_budget_evicts_least_recently_used():
+    cache = TextTextureCache(budget=1 << 30)
+    oldest = cache.texture('11', 18)
+    middle = cache.texture('22', 18)
+    cache.budget = cache.resident_bytes  # Room for exactly these two
+    assert cache.texture('11', 18) is oldest  # Now the most recently used
+    assert cache.evictions == 0
+
+    newest = cache.texture('33', 18)
+    assert texture_bytes(newest) == texture_bytes(middle)
+    assert cache.evictions == 1
+    assert list(cache._textures.values()) == [oldest, newest]
+    assert cache.resident_bytes == texture_bytes(oldest) + texture_bytes(newest) <= cache.budget
+    assert cache.texture('22', 18) is not middle  # Rendered again
+    assert cache.stats()['evictions'] == 2
+
+
+def test_clear_resets_byte_accounting():
+    cache = TextTextureCache()
+    for text in ('RED', 'BLACK', 'EVEN'):
+        cache.texture(text, 16)
+    assert cache.resident_bytes > 0
+    assert cache.clear() == 3
+    assert (len(cache), cache.resident_bytes, cache.stats()['resident_kb']) == (0, 0, 0)
+    cache.texture('RED', 16)
+    assert cache.resident_bytes == texture_bytes(cache.texture('RED', 16))
@@ -0,0 +1,28 @@
+def tap(grid, cell_id):
+    """Touch the middle of a betting grid cell, as a finger would"""
+    from kivy.tests.common import UnitTestTouch
+    x, y, w, h = grid.cells[cell_id].rect
+    touch = UnitTestTouch(grid.x + x + w / 2, grid.y + y + h / 2)
+    touch.touch_down()
+    touch.touch_up()
+
+
+def test_grid_taps_are_traced(game, tmp_path, monkeypatch):
+    from kivy.clock import Clock
+    from kivy.core.window import Window
+    monkeypatch.setenv('ROULETTE_TRACE_DIR', str(tmp_path))
+    Window.add_widget(game)
+    try:
+        for _ in range(3):
+            Clock.tick()  # Lay out the grid
+        game.start_trace()
+        tap(game.betting_grid, 'red')
+        tap(game.betting_grid, 'number_7')
+        path = game.tracer.stop()
+    finally:
+        Window.remove_widget(game)
+    assert game.bets == {'red': 5, 'number_7': 5}
+    names = [event[0] for event in game.tracer.events]
+    assert names.count('RouletteGame.place_bet') == 2
+    assert path is not None and path.startswith(str(tmp_path))
+
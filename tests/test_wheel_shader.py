@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip('kivy')
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BROKEN_SHADER = '''
+$HEADER$
+void main(void) { gl_FragColor = undefined_color; }
+'''
+
+# Run with a real GL context: SDL's offscreen driver on Mesa (llvmpipe) needs no display
+MESA_SCRIPT = '''
+from kivy.core.window import Window
+from kivy.graphics.opengl import glGetString, GL_RENDERER
+import wheel_shader
+print('renderer', glGetString(GL_RENDERER).decode())
+print('compiled', bool(wheel_shader.WheelBodyShader().success))
+wheel_shader.BODY_SHADER = wheel_shader.BODY_SHADER.replace('acc = vec4(0.0);', 'acc = undefined_color;')
+print('broken', wheel_shader.create_body_shader())
+'''
+
+
+def test_body_shader_compiles_on_software_gl():
+    env = dict(os.environ, SDL_VIDEODRIVER='offscreen', PYTHONPATH=REPO)
+    env.pop('KIVY_GL_BACKEND', None)
+    try:
+        proc = subprocess.run([sys.executable, '-c', MESA_SCRIPT], env=env, cwd=REPO,
+                              capture_output=True, text=True, timeout=120)
+    except subprocess.TimeoutExpired:
+        pytest.skip("no offscreen GL context")
+    lines = dict(line.split(' ', 1) for line in proc.stdout.splitlines() if ' ' in line)
+    if 'renderer' not in lines:
+        pytest.skip(f"no offscreen GL context: {proc.stderr.strip().splitlines()[-1:]}")
+    assert lines.get('compiled') == 'True', proc.stderr
+    assert lines.get('broken') == 'None'
+
+
+def test_failed_shader_falls_back_to_instructions(main_module, monkeypatch):
+    import wheel_shader
+    monkeypatch.setattr(main_module, 'WHEEL_SHADER', True)
+    monkeypatch.setattr(wheel_shader, 'BODY_SHADER', BROKEN_SHADER)
+    assert wheel_shader.create_body_shader() is None
+
+    bodies = []
+    draw_body = main_module.RouletteWheel.draw_body
+    monkeypatch.setattr(main_module.RouletteWheel, 'draw_body',
+                        lambda self, *args: bodies.append(args) or draw_body(self, *args))
+    wheel = main_module.RouletteWheel()
+    assert wheel.body_shader is None
+    wheel.size = (450, 420)
+    wheel.canvas.clear()
+    wheel.draw()
+    counts = wheel.layer_counts()
+    assert len(bodies) == 1
+    assert all(counts[layer] > 10 for layer in ('bumper', 'rim', 'hub'))
@@ -0,0 +1,78 @@
+"""
+Shared cache of rendered text textures for the roulette game.
+Text that is not in the sprite atlas (history strip, fallback pocket numbers
+and labels, draw_text) is rasterised with CoreLabel once per distinct
+(text, font size, bold, colour) and reused everywhere. The least recently used
+textures are dropped once their total size passes a memory budget.
+"""
+
+import os
+from collections import OrderedDict
+
+from kivy.core.text import Label as CoreLabel
+
+# Texture memory the cache may hold before the least recently used entries are dropped
+DEFAULT_TEXT_BUDGET = int(float(os.environ.get('ROULETTE_TEXT_CACHE_MB', '4')) * 1024 * 1024)
+
+
+class TextTextureCache:
+    """CoreLabel textures by (text, font_size, bold, color), least recently used first"""
+
+    def __init__(self, budget=DEFAULT_TEXT_BUDGET):
+        self.budget = budget
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._textures = OrderedDict()
+
+    def __len__(self):
+        return len(self._textures)
+
+    def texture(self, text, font_size=16, bold=False, color=(1, 1, 1, 1)):
+        """Texture for the text, rendered only the first time it is asked for"""
+        key = (text, font_size, bold, tuple(color))
+        texture = self._textures.get(key)
+        if texture is not None:
+            self.hits += 1
+            self._textures.move_to_end(key)
+            return texture
+        self.misses += 1
+        label = CoreLabel(text=text, font_size=font_size, bold=bold, color=color)
+        label.refresh()
+        texture = label.texture
+        if texture is None:
+            return None
+        self._textures[key] = texture
+        self.resident_bytes += texture.width * texture.height * 4
+        self._enforce_budget()
+        return texture
+
+    def _enforce_budget(self):
+        # The newest entry always stays; a texture still on a canvas lives on until it is redrawn
+        while self.resident_bytes > self.budget and len(self._textures) > 1:
+            _, texture = self._textures.popitem(last=False)
+            self.resident_bytes -= texture.width * texture.height * 4
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every texture (memory pressure), returns how many there were"""
+        count = len(self._textures)
+        self._textures.clear()
+        self.resident_bytes = 0
+        return count
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'evictions': self.evictions,
+            'textures': len(self._textures),
+            'resident_kb': self.resident_bytes // 1024,
+        }
+
+
+# The one cache shared by every widget
+TEXT_CACHE = TextTextureCache()
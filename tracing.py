@@ -0,0 +1,117 @@
+"""
+Opt-in profiling for the roulette game (no Kivy dependency).
+
+A Tracer wraps chosen methods only while a capture is running and restores the
+originals when it stops, so nothing is timed - and nothing is wrapped - when
+profiling is off. A capture writes Chrome trace-event JSON (open it in
+chrome://tracing or ui.perfetto.dev) and, optionally, a cProfile dump.
+
+Environment:
+    ROULETTE_TRACE=1             capture from startup
+    ROULETTE_TRACE_SECONDS=10    length of a capture
+    ROULETTE_TRACE_CPROFILE=1    also write a cProfile .prof file
+    ROULETTE_TRACE_DIR=path      where captures are written (default cache/traces)
+"""
+
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+TRACE_ENV = 'ROULETTE_TRACE'
+DEFAULT_TRACE_DIR = os.path.join(APP_DIR, 'cache', 'traces')
+DEFAULT_WINDOW = 10.0  # Seconds
+MAX_EVENTS = 200000  # Further events in a capture are dropped
+
+
+class Tracer:
+    """Records a complete trace event for each call of the hooked methods during a capture"""
+
+    def __init__(self, out_dir=None, window=None, cprofile=None, max_events=MAX_EVENTS):
+        env = os.environ
+        self.out_dir = out_dir or env.get('ROULETTE_TRACE_DIR', DEFAULT_TRACE_DIR)
+        self.window = window if window is not None else float(env.get('ROULETTE_TRACE_SECONDS', DEFAULT_WINDOW))
+        self.cprofile = cprofile if cprofile is not None else env.get('ROULETTE_TRACE_CPROFILE', '') not in ('', '0')
+        self.max_events = max_events
+        self.hooks = []  # (owner, attribute, event name)
+        self.events = []  # (name, begin, duration, thread id) in perf_counter seconds
+        self.active = False
+        self.started = None
+        self._patched = []  # (owner, attribute, original or None if it was inherited)
+        self._profile = None
+
+    def hook(self, owner, attribute, name=None):
+        """Trace calls of owner.attribute (a class method, or a callable attribute of an object)"""
+        self.hooks.append((owner, attribute, name or f"{getattr(owner, '__name__', type(owner).__name__)}.{attribute}"))
+
+    def _wrap(self, function, name):
+        events, limit = self.events, self.max_events
+
+        @functools.wraps(function)
+        def traced(*args, **kwargs):
+            begin = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                if len(events) < limit:
+                    events.append((name, begin, time.perf_counter() - begin, threading.get_ident()))
+        return traced
+
+    def start(self):
+        if self.active:
+            return
+        self.events.clear()
+        for owner, attribute, name in self.hooks:
+            own = owner.__dict__.get(attribute) if isinstance(owner, type) else None
+            original = own if own is not None else getattr(owner, attribute)
+            setattr(owner, attribute, self._wrap(original, name))
+            self._patched.append((owner, attribute, own if isinstance(owner, type) else None))
+        if self.cprofile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self.started = time.perf_counter()
+        self.active = True
+        print(f"✓ Tracing {len(self.hooks)} hot paths for {self.window:g}s")
+
+    def stop(self):
+        """End the capture, restore the original methods and write the files; returns the trace path"""
+        if not self.active:
+            return None
+        self.active = False
+        if self._profile is not None:
+            self._profile.disable()
+        for owner, attribute, original in reversed(self._patched):
+            if original is not None:
+                setattr(owner, attribute, original)
+            else:
+                delattr(owner, attribute)  # Back to the class method
+        self._patched = []
+        return self.write()
+
+    def trace_events(self):
+        """Chrome trace-event format: complete ('X') events in microseconds from the capture start"""
+        pid = os.getpid()
+        return [{'name': name, 'cat': 'roulette', 'ph': 'X', 'pid': pid, 'tid': tid,
+                 'ts': round((begin - self.started) * 1e6, 1), 'dur': round(duration * 1e6, 1)}
+                for name, begin, duration, tid in self.events]
+
+    def write(self):
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        base = os.path.join(self.out_dir, f"roulette-{stamp}")
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            with open(base + '.json', 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, f)
+            print(f"✓ Wrote {len(self.events)} trace events to {base}.json")
+            if self._profile is not None:
+                self._profile.dump_stats(base + '.prof')
+                print(f"✓ Wrote cProfile stats to {base}.prof")
+        except OSError as e:
+            print(f"✗ Could not write trace {base}: {e}")
+            return None
+        finally:
+            self._profile = None
+        return base + '.json'
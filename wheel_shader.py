@@ -0,0 +1,213 @@
+"""
+Shader renderer for the static body of the roulette wheel.
+The bumper track, rim and hub - the layers of RouletteWheel.draw() that do not
+rotate - are drawn by one fragment shader on a single quad instead of the few
+hundred Ellipse and Line instructions of the instruction path. The shader
+draws the same layers in the same order, with the same quality tier rules for
+shadows, grain and highlights.
+
+The GLSL sticks to what GLSL ES 1.00 allows (no integer uniforms, no dynamic
+loops or arrays), so it compiles on phones and on Mesa's software renderer.
+When it does not compile, create_body_shader() returns None and draw() keeps
+using instructions.
+"""
+
+from kivy.graphics import Color, Rectangle, RenderContext
+
+# Main material colours of the wheel body, as used by RouletteWheel.draw()
+BODY_COLORS = {
+    'bumper_color': (0.15, 0.08, 0.04, 1.0),  # Deep mahogany bumper surface
+    'rim_color': (0.22, 0.12, 0.06, 1.0),  # Rich mahogany rim surface
+    'hub_color': (0.18, 0.09, 0.05, 1.0),  # Very dark mahogany hub surface
+    'grain_color': (0.25, 0.12, 0.06, 1.0),  # Medium mahogany grain and inlay rings
+    'brass_color': (0.7, 0.55, 0.25, 1.0),  # Polished brass edges
+    'brass_highlight': (0.9, 0.75, 0.35, 1.0),  # Bright brass highlights
+}
+
+# Quad margin beyond the bumper for its offset drop shadows (pixels)
+SHADOW_MARGIN = 8
+
+BODY_SHADER = '''
+$HEADER$
+
+uniform vec2 quad_pos;
+uniform vec2 quad_size;
+uniform vec2 center;
+uniform vec4 radii;         // wheel radius, bumper outer, bumper inner, pocket outer
+uniform float inner_radius;
+uniform vec4 quality;       // shadow layers, grain rings, grain spacing (0 = none), highlight passes
+uniform vec4 bumper_color;
+uniform vec4 rim_color;
+uniform vec4 hub_color;
+uniform vec4 grain_color;
+uniform vec4 brass_color;
+uniform vec4 brass_highlight;
+
+const float PI = 3.14159265;
+
+vec2 p;
+vec4 acc;  // Premultiplied colour of the layers so far
+
+void over(vec4 color, float coverage) {
+    float a = color.a * coverage;
+    acc = vec4(color.rgb * a + acc.rgb * (1.0 - a), a + acc.a * (1.0 - a));
+}
+
+float disc(vec2 c, float r) {
+    return clamp(r - distance(p, c) + 0.5, 0.0, 1.0);
+}
+
+// Line(circle=..., width=w): 2w wide, or one pixel for w <= 1
+float ring(float r, float w) {
+    float half_width = w > 1.0 ? w : 0.5;
+    return clamp(half_width - abs(distance(p, center) - r) + 0.5, 0.0, 1.0);
+}
+
+// Radial lines every `spacing` radians from r0 to r1
+float spokes(float spacing, float r0, float r1, float w) {
+    vec2 d = p - center;
+    float r = length(d);
+    float a = atan(d.y, d.x);
+    float nearest = floor(a / spacing + 0.5) * spacing;
+    float half_width = w > 1.0 ? w : 0.5;
+    float across = clamp(half_width - abs(r * sin(a - nearest)) + 0.5, 0.0, 1.0);
+    return across * step(r0, r) * step(r, r1);
+}
+
+void main(void) {
+    p = quad_pos + tex_coord0 * quad_size;
+    acc = vec4(0.0);
+    float R = radii.x;
+    float bo = radii.y;
+    float bi = radii.z;
+    float po = radii.w;
+    float ir = inner_radius;
+    float shadows = quality.x;
+    float rings = quality.y;
+    float spacing = quality.z;
+    float highlights = quality.w;
+
+    // Bumper track
+    if (shadows >= 1.0) over(vec4(0.0, 0.0, 0.0, 0.3), disc(center + vec2(3.0, -3.0), bo));
+    if (shadows >= 2.0) over(vec4(0.0, 0.0, 0.0, 0.2), disc(center + vec2(5.0, -5.0), bo));
+    over(vec4(0.12, 0.06, 0.03, 1.0), disc(center, bo));
+    over(bumper_color, disc(center, bo - 1.0));
+    if (rings >= 1.0) over(grain_color, ring(bo, 3.0));
+    if (rings >= 2.0) over(grain_color, ring(bo * 0.99, 3.0));
+    if (rings >= 3.0) over(grain_color, ring(bi + 2.0, 3.0));
+    if (rings >= 4.0) over(grain_color, ring((bi + 2.0) * 0.99, 3.0));
+    if (spacing > 0.0) over(vec4(0.22, 0.11, 0.05, 0.5), spokes(radians(20.0) * spacing, bi + 3.0, bo - 1.0, 1.0));
+    over(vec4(0.1, 0.05, 0.02, 0.8), disc(center, bi + 2.0));
+    if (highlights >= 2.0) {
+        over(vec4(0.35, 0.18, 0.08, 1.0), ring(bo - 1.0, 2.0));
+        over(vec4(0.35, 0.18, 0.08, 1.0), ring(bi + 1.0, 2.0));
+    }
+    if (highlights >= 1.0) over(vec4(0.45, 0.25, 0.12, 0.6), disc(center + vec2(2.0 - 0.1 * bo), bo * 0.9));
+    over(vec4(0.6, 0.5, 0.3, 1.0), ring(bo, 2.0));
+    over(vec4(0.6, 0.5, 0.3, 1.0), ring(bi, 2.0));
+    if (highlights >= 2.0) {
+        over(vec4(0.85, 0.75, 0.45, 1.0), ring(bo - 0.5, 1.0));
+        over(vec4(0.85, 0.75, 0.45, 1.0), ring(bi + 0.5, 1.0));
+    }
+    if (highlights >= 3.0) over(vec4(0.95, 0.85, 0.5, 0.6), ring(bo - 1.0, 0.5));
+
+    // Rim
+    if (shadows >= 1.0) over(vec4(0.0, 0.0, 0.0, 0.25), disc(center + vec2(2.0, -2.0), R));
+    if (shadows >= 2.0) over(vec4(0.0, 0.0, 0.0, 0.15), disc(center + vec2(4.0, -4.0), R));
+    over(vec4(0.1, 0.05, 0.02, 1.0), disc(center + vec2(1.0), R));
+    over(vec4(0.18, 0.09, 0.04, 1.0), disc(center, R));
+    over(rim_color, disc(center, R - 2.0));
+    vec4 rim_grain = vec4(0.28, 0.16, 0.08, 1.0);
+    if (rings >= 1.0) over(rim_grain, ring(R, 2.0));
+    if (rings >= 2.0) over(rim_grain, ring(R * 0.98, 2.0));
+    if (rings >= 3.0) over(rim_grain, ring(R * 0.96, 2.0));
+    if (rings >= 4.0) over(rim_grain, ring(R * 0.94, 2.0));
+    if (spacing > 0.0) over(vec4(0.25, 0.14, 0.07, 0.6), spokes(radians(15.0) * spacing, R * 0.92, R * 0.98, 1.0));
+    over(vec4(0.15, 0.08, 0.04, 0.7), disc(center, po + 2.0));
+    if (highlights >= 2.0) {
+        over(vec4(0.38, 0.22, 0.10, 1.0), ring(R - 1.0, 2.0));
+        over(vec4(0.38, 0.22, 0.10, 1.0), ring(R * 0.96, 1.0));
+    }
+    if (highlights >= 3.0) over(vec4(0.5, 0.3, 0.15, 0.8), ring(R - 0.5, 1.0));
+    if (highlights >= 1.0) over(vec4(0.6, 0.4, 0.2, 0.4), disc(center + vec2(3.0 - 0.25 * R), R * 0.75));
+    over(brass_color, ring(R, 2.0));
+    if (highlights >= 1.0) over(brass_highlight, ring(R - 0.5, 1.0));
+
+    // Hub
+    if (shadows >= 3.0) over(vec4(0.0, 0.0, 0.0, 0.3), disc(center + vec2(5.0), ir));
+    if (shadows >= 2.0) over(vec4(0.0, 0.0, 0.0, 0.45), disc(center + vec2(4.0), ir));
+    if (shadows >= 1.0) over(vec4(0.0, 0.0, 0.0, 0.6), disc(center + vec2(3.0), ir));
+    over(vec4(0.12, 0.06, 0.03, 1.0), disc(center, ir));
+    over(hub_color, disc(center, ir - 1.0));
+    for (int i = 0; i < 4; i++) {
+        float inlay = ir * (1.0 - 0.1 * float(i));
+        if (rings >= float(i + 1)) {
+            over(grain_color, ring(inlay, 2.0));
+            if (highlights >= 2.0) over(vec4(0.35, 0.18, 0.08, 0.6), ring(inlay - 0.5, 1.0));
+        }
+    }
+    if (spacing > 0.0) over(vec4(0.3, 0.15, 0.07, 0.7), spokes(radians(30.0) * spacing, ir * 0.65, ir * 0.95, 1.5));
+    over(vec4(0.08, 0.04, 0.02, 1.0), disc(center, ir * 0.3));
+    over(vec4(0.4, 0.2, 0.08, 1.0), disc(center, ir * 0.25));
+    over(vec4(0.5, 0.3, 0.12, 1.0), ring(ir * 0.25, 2.0));
+    if (highlights >= 1.0) over(vec4(0.6, 0.35, 0.15, 0.6), disc(center - vec2(0.05 * ir), ir * 0.15));
+    over(brass_color, disc(center, ir * 0.1));
+    if (highlights >= 3.0) over(vec4(0.9, 0.75, 0.35, 0.8), disc(center, ir * 0.08));
+
+    if (acc.a <= 0.0)
+        discard;
+    gl_FragColor = vec4(acc.rgb / acc.a, acc.a) * frag_color;
+}
+'''
+
+
+class WheelBodyShader:
+    """The bumper, rim and hub drawn by BODY_SHADER on one quad"""
+
+    def __init__(self):
+        self.context = RenderContext(use_parent_projection=True, use_parent_modelview=True,
+                                     use_parent_frag_modelview=True)
+        self.context.shader.fs = BODY_SHADER
+        self.success = self.context.shader.success
+        with self.context:
+            Color(1, 1, 1, 1)
+            self.quad = Rectangle()
+        for name, color in BODY_COLORS.items():
+            self.context[name] = color
+        self._uniforms = None
+
+    def draw(self, canvas, center_x, center_y, radius, bumper_outer, bumper_inner, pocket_outer,
+             inner_radius, quality):
+        """Add the wheel body to canvas (uniforms are only sent when the geometry or tier changed)"""
+        uniforms = (center_x, center_y, radius, bumper_outer, bumper_inner, pocket_outer, inner_radius,
+                    quality.name)
+        if uniforms != self._uniforms:
+            self._uniforms = uniforms
+            extent = bumper_outer + SHADOW_MARGIN
+            pos = (center_x - extent, center_y - extent)
+            size = (extent * 2, extent * 2)
+            self.quad.pos = pos
+            self.quad.size = size
+            context = self.context
+            context['quad_pos'] = tuple(map(float, pos))
+            context['quad_size'] = tuple(map(float, size))
+            context['center'] = (float(center_x), float(center_y))
+            context['radii'] = tuple(map(float, (radius, bumper_outer, bumper_inner, pocket_outer)))
+            context['inner_radius'] = float(inner_radius)
+            context['quality'] = tuple(map(float, (quality.shadow_layers, quality.grain_rings,
+                                                   quality.grain_spacing, quality.highlight_passes)))
+        canvas.add(self.context)
+
+
+def create_body_shader():
+    """WheelBodyShader, or None (with the reason printed) when the shader cannot be used"""
+    try:
+        body = WheelBodyShader()
+    except Exception as e:
+        print(f"✗ Wheel body shader unavailable, drawing with instructions: {e}")
+        return None
+    if not body.success:
+        print("✗ Wheel body shader failed to compile, drawing with instructions")
+        return None
+    print("✓ Drawing the wheel body with a shader")
+    return body